@@ -15,10 +15,12 @@ from ..element import Element
 from ..ndmapping import OrderedDict
 from ..spaces import HoloMap, DynamicMap
 from .interface import Interface, iloc, ndloc
+from .lazy import QueryPlan
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
+from .packed import PackedInterface, PackedData # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
 
 default_datatype = 'dictionary'
@@ -49,10 +51,25 @@ try:
 except ImportError:
     pass
 
+try:
+    import pyarrow # noqa (Availability import)
+    from .arrow import ArrowInterface # noqa (Conditional API import)
+    datatypes.append('arrow')
+except ImportError:
+    pass
+
+try:
+    from .memmap import MemmapInterface # noqa (Conditional API import)
+    datatypes.append('memmap')
+except ImportError:
+    pass
+
 if 'array' not in datatypes:
     datatypes.append('array')
 if 'multitabular' not in datatypes:
     datatypes.append('multitabular')
+if 'packed' not in datatypes:
+    datatypes.append('packed')
 
 
 def concat(datasets, datatype=None):
@@ -198,7 +215,10 @@ class Dataset(Element):
     _vdim_reductions = {}
     _kdim_reductions = {}
 
-    def __init__(self, data, kdims=None, vdims=None, **kwargs):
+    # QueryPlan of a lazy Dataset, evaluated when the data is accessed
+    _plan = None
+
+    def __init__(self, data, kdims=None, vdims=None, lazy=False, **kwargs):
         if isinstance(data, Element):
             pvals = util.get_param_values(data)
             kwargs.update([(l, pvals[l]) for l in ['group', 'label']
@@ -207,18 +227,102 @@ class Dataset(Element):
         kdims, vdims = kwargs.get('kdims'), kwargs.get('vdims')
 
         validate_vdims = kwargs.pop('_validate_vdims', True)
+        validate = kwargs.pop('_validate', True)
+        self._stats = None
         initialized = Interface.initialize(type(self), data, kdims, vdims,
                                            datatype=kwargs.get('datatype'))
         (data, self.interface, dims, extra_kws) = initialized
         super(Dataset, self).__init__(data, **dict(kwargs, **dict(dims, **extra_kws)))
-        self.interface.validate(self, validate_vdims)
+        if validate:
+            self.interface.validate(self, validate_vdims)
 
         self.redim = Redim(self, mode='dataset')
+        if lazy and not (self.interface.gridded or self.interface.multi):
+            self._plan = QueryPlan(self.clone())
+
+
+    @property
+    def data(self):
+        "The data of the Dataset, evaluating the QueryPlan of a lazy Dataset"
+        if self._plan is not None:
+            self._execute()
+        return self.__dict__['data']
+
+
+    @data.setter
+    def data(self, data):
+        self._plan = None
+        self.__dict__['data'] = data
+
+
+    def __getstate__(self):
+        "Evaluates lazy Datasets and excludes the statistics cache"
+        if self._plan is not None:
+            self._execute()
+        state = super(Dataset, self).__getstate__()
+        state['_stats'] = None
+        return state
+
+
+    def __setstate__(self, state):
+        "Ensures pickles predating the statistics cache can be restored"
+        state.setdefault('_stats', None)
+        super(Dataset, self).__setstate__(state)
+
+
+    def lazy(self):
+        """Returns a lazy copy of the Dataset
+
+        Operations applied to a lazy Dataset, i.e. select, sort,
+        reindex, aggregate and iloc, are recorded in a QueryPlan
+        rather than being applied immediately. The plan is optimized
+        and evaluated once the data is accessed, e.g. when the
+        Dataset is plotted, merging adjacent selections, applying
+        selections before sorting and dropping value dimensions which
+        are never used. Gridded and multi-element data is not
+        supported and is returned unchanged.
+
+        Returns:
+            Lazy copy of the Dataset
+        """
+        if self.interface.gridded or self.interface.multi or self._plan is not None:
+            return self.clone()
+        lazy = self.clone()
+        lazy._plan = QueryPlan(self.clone())
+        return lazy
+
+
+    def _lazy_clone(self, plan, **overrides):
+        """
+        Returns a clone of the Dataset evaluating the supplied
+        QueryPlan, which is initialized with the source data until
+        the plan is evaluated.
+        """
+        new = self.clone(plan.source.data, **overrides)
+        if isinstance(new, Dataset):
+            new._plan = plan
+        return new
+
+
+    def _execute(self):
+        "Evaluates the QueryPlan of a lazy Dataset in place"
+        plan, self._plan = self._plan, None
+        result = plan.execute([d.name for d in self.dimensions()])
+        self.__dict__['data'] = result.data
+        self.interface = result.interface
+        if len(result.vdims) != len(self.vdims):
+            # Aggregation may drop value dimensions
+            with util.disable_constant(self):
+                self.vdims = [vd for vd in self.vdims if vd in result.vdims]
 
 
     def closest(self, coords=[], **kwargs):
         """Snaps coordinate(s) to closest coordinate in Dataset
 
+        On tabular data with two key dimensions the coordinates are
+        snapped to the closest point, which is looked up in a spatial
+        index built lazily on the first call if scipy is available.
+
         Args:
             coords: List of coordinates expressed as tuples
             **kwargs: Coordinates defined as keyword pairs
@@ -229,7 +333,9 @@ class Dataset(Element):
         Raises:
             NotImplementedError: Raised if snapping is not supported
         """
-        if self.ndims > 1:
+        if self.ndims == 2 and not self.interface.gridded:
+            return self._closest_2d(coords, **kwargs)
+        elif self.ndims > 1:
             raise NotImplementedError("Closest method currently only "
                                       "implemented for 1D Elements")
 
@@ -243,10 +349,66 @@ class Dataset(Element):
         xs = self.dimension_values(0)
         if xs.dtype.kind in 'SO':
             raise NotImplementedError("Closest only supported for numeric types")
-        idxs = [np.argmin(np.abs(xs-coord)) for coord in coords]
+        samples = np.asarray(coords)
+        if (len(xs) and xs.dtype.kind in 'iuf' and samples.dtype.kind in 'iuf'
+            and samples.ndim == 1 and self.interface.issorted(self, 0)):
+            idxs = util.closest_indices(xs, samples)
+        else:
+            idxs = [np.argmin(np.abs(xs-coord)) for coord in coords]
         return [xs[idx] for idx in idxs]
 
 
+    def _closest_2d(self, coords=[], **kwargs):
+        """
+        Snaps 2D coordinates to the closest point along the two key
+        dimensions using the spatial index of the interface.
+        """
+        if kwargs:
+            if len(kwargs) != 2:
+                raise NotImplementedError("Closest method on 2D Elements requires "
+                                          "coordinates along both key dimensions")
+            values = {self.get_dimension(d, strict=True): v for d, v in kwargs.items()}
+            coords = list(zip(*(v if isinstance(v, list) else [v]
+                                for v in (values[kd] for kd in self.kdims))))
+
+        coords = [util.wrap_tuple(c) for c in coords]
+        if not all(len(c) == 2 and all(util.isnumeric(v) for v in c) for c in coords):
+            raise NotImplementedError("Closest on 2D Elements only supported "
+                                      "for numeric 2D coordinates")
+        xs, ys = (self.dimension_values(kd) for kd in self.kdims)
+        if xs.dtype.kind not in 'iuf' or ys.dtype.kind not in 'iuf':
+            raise NotImplementedError("Closest only supported for numeric types")
+        elif not coords:
+            return []
+        rows = self.interface.closest_rows(self, coords)
+        return [(xs[r], ys[r]) for r in rows]
+
+
+    def index(self, dimension):
+        """Sorts the data along a dimension and records it as sorted
+
+        Sorts the data along the supplied dimension (unless it is
+        already sorted) and records it in the statistics, which allows
+        range and point selections and slicing along that dimension to
+        use a binary search and return views of the data rather than
+        copies. Monotonic dimensions are also detected on the first
+        selection, so indexing is only required if the data is not
+        already sorted.
+
+        Args:
+            dimension: Dimension to sort and index the data by
+
+        Returns:
+            Dataset sorted along the dimension
+        """
+        dim = self.get_dimension(dimension, strict=True)
+        if self.interface.issorted(self, dim):
+            return self.clone()
+        indexed = self.sort(dim)
+        indexed.interface.issorted(indexed, dim)
+        return indexed
+
+
     def sort(self, by=None, reverse=False):
         """
         Sorts the data by the values along the supplied dimensions.
@@ -262,8 +424,10 @@ class Dataset(Element):
             by = self.kdims
         elif not isinstance(by, list):
             by = [by]
+        if self._plan is not None:
+            return self._lazy_clone(self._plan.sort(by, reverse))
         sorted_columns = self.interface.sort(self, by, reverse)
-        return self.clone(sorted_columns)
+        return self.clone(sorted_columns, _validate=False)
 
 
     def range(self, dim, data_range=True, dimension_range=True):
@@ -286,7 +450,12 @@ class Dataset(Element):
         elif all(util.isfinite(v) for v in dim.range) and dimension_range:
             return dim.range
         elif dim in self.dimensions() and data_range and bool(self):
-            lower, upper = self.interface.range(self, dim)
+            if self.interface.gridded and dim in self.kdims:
+                # Coordinate ranges depend on the bounds or bin edges
+                lower, upper = self.interface.range(self, dim)
+            else:
+                lower, upper = self.interface.statistic(
+                    self, dim, 'range', lambda: self.interface.range(self, dim))
         else:
             lower, upper = (np.NaN, np.NaN)
         if not dimension_range:
@@ -294,6 +463,28 @@ class Dataset(Element):
         return util.dimension_range(lower, upper, dim.range, dim.soft_range)
 
 
+    def describe(self, dimensions=None, quantiles=(0.25, 0.5, 0.75)):
+        """Computes descriptive statistics of the dimension values.
+
+        Computes the count, NaN count, min, max, mean, variance and
+        quantiles of the values along each dimension in a single
+        chunked pass over the data. Quantiles of large datasets are
+        approximate. The results are cached and also seed the cached
+        ranges of the dimensions.
+
+        Args:
+            dimensions: Dimensions to describe (defaults to all)
+            quantiles (tuple, optional): Quantiles to compute
+
+        Returns:
+            OrderedDict mapping from dimension name to an OrderedDict
+            of statistics
+        """
+        if dimensions is not None and not isinstance(dimensions, list):
+            dimensions = [dimensions]
+        return self.interface.describe(self, dimensions, quantiles)
+
+
     def add_dimension(self, dimension, dim_pos, dim_val, vdim=False, **kwargs):
         """Adds a dimension and its values to the Dataset
 
@@ -381,12 +572,21 @@ class Dataset(Element):
             or not selection):
             return self
 
+        if self._plan is not None and not self.interface.indexed(self, selection):
+            return self._lazy_clone(self._plan.select(**selection))
+
         data = self.interface.select(self, **selection)
 
         if np.isscalar(data):
             return data
-        else:
-            return self.clone(data)
+        selected = self.clone(data, _validate=False)
+        if isinstance(selected, Dataset):
+            # Selecting rows preserves the sort order of the data
+            stats = selected.interface.statistics(selected)
+            for d, dim_stats in self.interface.statistics(self).items():
+                if dim_stats.get('sorted'):
+                    stats.setdefault(d, {})['sorted'] = True
+        return selected
 
 
     def reindex(self, kdims=None, vdims=None):
@@ -426,6 +626,11 @@ class Dataset(Element):
             val_dims = [self.get_dimension(v, strict=True) for v in vdims]
             new_type = self._vdim_reductions.get(len(val_dims), type(self))
 
+        if self._plan is not None:
+            return self._lazy_clone(self._plan.reindex(key_dims, val_dims),
+                                    kdims=key_dims, vdims=val_dims,
+                                    new_type=new_type)
+
         data = self.interface.reindex(self, key_dims, val_dims)
         datatype = self.datatype
         if gridded and dropped:
@@ -506,6 +711,9 @@ class Dataset(Element):
                 Defined as two-tuple for 1D sampling and four-tuple
                 for 2D sampling.
             closest: Whether to snap to closest coordinates
+                On tabular data with two key dimensions samples are
+                snapped to the closest point, set closest=False to
+                only match points exactly
             **kwargs: Coordinates specified as keyword pairs
                 Keywords of dimensions and scalar coordinates
 
@@ -624,12 +832,25 @@ class Dataset(Element):
         """Aggregates data on the supplied dimensions.
 
         Aggregates over the supplied key dimensions with the defined
-        function.
+        function. Several reductions may be computed at once by
+        supplying a list of functions to apply to every value
+        dimension or a dictionary mapping from value dimension to one
+        or more functions, e.g.:
+
+            ds.aggregate('x', {'y': ['mean', 'std', 'count'], 'z': 'max'})
+
+        Each value dimension reduced with a list of functions is
+        replaced by one dimension per function named by suffixing the
+        name of the reduction, e.g. y_mean, y_std and y_count. Known
+        reductions (count, sum, mean, var, std, min, max and their
+        nan-prefixed variants) may be named by string and are computed
+        for all groups in a single vectorized pass.
 
         Args:
             dimensions: Dimension(s) to aggregate on
                 Default to all key dimensions
             function: Aggregation function to apply, e.g. numpy.mean
+                or a list or dictionary of reductions
             spreadfn: Secondary reduction to compute value spread
                 Useful for computing a confidence interval, spread, or
                 standard deviation.
@@ -643,6 +864,19 @@ class Dataset(Element):
         if dimensions is None: dimensions = self.kdims
         elif not isinstance(dimensions, list): dimensions = [dimensions]
         kdims = [self.get_dimension(d, strict=True) for d in dimensions]
+
+        ndims = len(dimensions)
+        min_d, max_d = self.param.objects('existing')['kdims'].bounds
+        generic_type = (min_d is not None and ndims < min_d) or (max_d is not None and ndims > max_d)
+
+        if isinstance(function, (list, dict)):
+            return self._aggregate_many(kdims, function, spreadfn, generic_type)
+
+        if (self._plan is not None and kdims and self.vdims and
+            not spreadfn and not generic_type):
+            return self._lazy_clone(self._plan.aggregate(kdims, function, **kwargs),
+                                    kdims=kdims)
+
         if not len(self):
             if spreadfn:
                 spread_name = spreadfn.__name__
@@ -656,10 +890,6 @@ class Dataset(Element):
         aggregated = self.interface.unpack_scalar(self, aggregated)
         vdims = [vd for vd in vdims if vd not in dropped]
 
-        ndims = len(dimensions)
-        min_d, max_d = self.param.objects('existing')['kdims'].bounds
-        generic_type = (min_d is not None and ndims < min_d) or (max_d is not None and ndims > max_d)
-
         if spreadfn:
             error, _ = self.interface.aggregate(self, dimensions, spreadfn)
             spread_name = spreadfn.__name__
@@ -685,6 +915,38 @@ class Dataset(Element):
                                   datatype=datatype)
 
 
+    def _aggregate_many(self, kdims, functions, spreadfn, generic_type):
+        """
+        Applies a list of reductions to all value dimensions or a
+        dictionary of reductions to specific value dimensions in a
+        single call to the interface.
+        """
+        if isinstance(functions, list):
+            functions = OrderedDict((vd.name, functions) for vd in self.vdims)
+
+        reductions, vdims = [], []
+        for vdim, fns in functions.items():
+            vdim = self.get_dimension(vdim, strict=True)
+            if isinstance(fns, list):
+                outputs = [(fn, vdim('_'.join([vdim.name, util.reduction_name(fn)])))
+                           for fn in fns]
+            else:
+                outputs = [(fns, vdim)]
+            if spreadfn:
+                outputs.append((spreadfn, vdim('_'.join([vdim.name, spreadfn.__name__]))))
+            reductions += [(vdim.name, fn, out.name) for fn, out in outputs]
+            vdims += [out for _, out in outputs]
+
+        if not len(self):
+            return self.clone([], kdims=kdims, vdims=vdims)
+
+        aggregated, dropped = self.interface.aggregate_many(self, kdims, reductions)
+        vdims = [vd for vd in vdims if vd.name not in dropped]
+        datatype = list(util.unique_iterator(self.datatype+['dataframe', 'dictionary']))
+        return self.clone(aggregated, kdims=kdims, vdims=vdims, datatype=datatype,
+                          new_type=Dataset if generic_type else None)
+
+
     def groupby(self, dimensions=[], container_type=HoloMap, group_type=None,
                 dynamic=False, **kwargs):
         """Groups object by one or more dimensions
@@ -852,7 +1114,26 @@ class Dataset(Element):
         if 'datatype' not in overrides:
             datatypes = [self.interface.datatype] + self.datatype
             overrides['datatype'] = list(util.unique_iterator(datatypes))
-        return super(Dataset, self).clone(data, shared_data, new_type, *args, **overrides)
+        if (data is None and shared_data and self._plan is not None and
+            not any(k in overrides for k in ('kdims', 'vdims'))):
+            # Lazy clones share the QueryPlan and are linked to the original
+            if (args[0] if args else overrides.get('link', True)):
+                overrides['plot_id'] = self._plot_id
+            new = super(Dataset, self).clone(self._plan.source.data, shared_data,
+                                             new_type, *args, **overrides)
+            if isinstance(new, Dataset):
+                new._plan = self._plan
+            return new
+        if (data is None and shared_data and '_validate' not in overrides and
+            (new_type is None or issubclass(new_type, Dataset)) and
+            not any(k in overrides for k in ('kdims', 'vdims'))):
+            # Data of a validated Dataset with unchanged dimensions is trusted
+            overrides['_validate'] = False
+        new = super(Dataset, self).clone(data, shared_data, new_type, *args, **overrides)
+        if (data is None and shared_data and isinstance(new, Dataset) and
+            new.data is self.data and new.dimensions() == self.dimensions()):
+            new._stats = self.interface.statistics(self)
+        return new
 
 
     @property
@@ -877,6 +1158,12 @@ class Dataset(Element):
         * Select with a list of integer coordinates:
 
             dataset.iloc[[0, 2, 3]]
+
+        Contiguous and strided row slices of data stored by an
+        interface declaring zero_copy support (the dictionary, memmap
+        and array interfaces, where the array interface additionally
+        requires evenly spaced columns) return views sharing memory
+        with the original data, which are not validated again.
         """
         return iloc(self)
 
@@ -18,6 +18,8 @@ class ArrayInterface(Interface):
 
     datatype = 'array'
 
+    zero_copy = True
+
     @classmethod
     def dimension_type(cls, dataset, dim):
         return dataset.data.dtype.type
@@ -154,14 +156,8 @@ class ArrayInterface(Interface):
         vdims = dataset.vdims
 
         # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        # and the row indices of each group
+        keys, indices = util.group_indices([data[:, d_idx] for d_idx in dim_idxs])
 
         # Get group
         group_kwargs = {}
@@ -170,15 +166,12 @@ class ArrayInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Iterate over the unique entries indexing each group
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        for group, group_inds in zip(keys, indices):
+            group_data = data[np.ix_(group_inds, col_idxs)]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
@@ -197,7 +190,7 @@ class ArrayInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         data = np.atleast_2d(dataset.data[selection_mask, :])
         if len(data) == 1 and indexed and len(dataset.vdims) == 1:
@@ -257,6 +250,11 @@ class ArrayInterface(Interface):
             cols = [dataset.get_dimension_index(cols)]
         elif not isinstance(cols, slice):
             cols = [dataset.get_dimension_index(d) for d in cols]
+            steps = np.diff(cols)
+            if len(cols) and (steps > 0).all() and (steps == steps[:1]).all():
+                # Evenly spaced columns can be selected as a view
+                step = steps[0] if len(steps) else 1
+                cols = slice(cols[0], cols[-1]+1, step)
 
         if np.isscalar(rows):
             rows = [rows]
@@ -0,0 +1,572 @@
+from __future__ import absolute_import
+
+import sys
+try:
+    import itertools.izip as zip
+except ImportError:
+    pass
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, sorted_context, OrderedDict
+from .interface import Interface, DataError
+from .dictionary import DictInterface
+
+
+class ArrowInterface(Interface):
+    """
+    The ArrowInterface allows a Dataset object to wrap a pyarrow
+    Table (or RecordBatch) natively, avoiding a conversion to a
+    pandas DataFrame. Selections, sorting, grouping, aggregation and
+    range computations are performed using the Arrow compute kernels
+    and the values along a dimension are returned as zero-copy NumPy
+    views wherever the Arrow buffers allow it, i.e. for numeric and
+    temporal columns without missing values stored in a single chunk.
+
+    Dictionary-encoded columns are treated as categorical dimensions,
+    selections on them are evaluated on the dictionary and mapped
+    back onto the rows using the integer codes, and grouping and
+    sorting operate on the codes, so only the unique values are ever
+    converted to Python objects.
+
+    Aggregations using functions which have no equivalent Arrow
+    compute kernel are applied to the NumPy arrays of each group.
+    """
+
+    types = ()
+
+    datatype = 'arrow'
+
+    # Maps the names of NumPy reductions onto Arrow aggregation kernels
+    _kernels = {'amin': 'min', 'amax': 'max', 'mean': 'mean',
+                'std': 'stddev', 'sum': 'sum', 'var': 'variance'}
+
+    @classmethod
+    def loaded(cls):
+        return 'pyarrow' in sys.modules
+
+    @classmethod
+    def applies(cls, obj):
+        if not cls.loaded():
+            return False
+        import pyarrow as pa
+        return isinstance(obj, (pa.Table, pa.RecordBatch))
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        import pyarrow as pa
+
+        if isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
+
+        if isinstance(data, pa.Table):
+            element_params = eltype.param.objects()
+            kdim_param = element_params['kdims']
+            vdim_param = element_params['vdims']
+            columns = data.column_names
+            if isinstance(kdim_param.bounds[1], int):
+                ndim = min([kdim_param.bounds[1], len(kdim_param.default)])
+            else:
+                ndim = None
+            nvdim = vdim_param.bounds[1] if isinstance(vdim_param.bounds[1], int) else None
+            if kdims and vdims is None:
+                vdims = [c for c in columns if c not in kdims]
+            elif vdims and kdims is None:
+                kdims = [c for c in columns if c not in vdims][:ndim]
+            elif kdims is None:
+                kdims = columns[:ndim]
+                if vdims is None:
+                    vdims = [d for d in columns[ndim:((ndim+nvdim) if nvdim else None)]
+                             if d not in kdims]
+            elif kdims == [] and vdims is None:
+                vdims = columns[:nvdim if nvdim else None]
+
+            for d in kdims+vdims:
+                d = dimension_name(d)
+                if len([c for c in columns if c == d]) > 1:
+                    raise DataError('Dimensions may not reference duplicated Table '
+                                    'columns (found duplicate %r columns).' % d, cls)
+        else:
+            data, dims, _ = DictInterface.init(eltype, data, kdims, vdims)
+            kdims, vdims = dims['kdims'], dims['vdims']
+            dimensions = [dimension_name(d) for d in kdims+vdims]
+            columns = [(d, vals) for d, vals in data.items() if d in dimensions]
+            lengths = [len(vals) for _, vals in columns if not util.isscalar(vals)]
+            length = max(lengths) if lengths else 1
+            arrays = [pa.array(np.full(length, vals) if util.isscalar(vals) else vals)
+                      for _, vals in columns]
+            data = pa.Table.from_arrays(arrays, names=[d for d, _ in columns])
+        return data, {'kdims':kdims, 'vdims':vdims}, {}
+
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        dim_types = 'all' if vdims else 'key'
+        dimensions = dataset.dimensions(dim_types, label='name')
+        not_found = [d for d in dimensions if d not in dataset.data.column_names]
+        if not_found:
+            raise DataError("Supplied data does not contain specified "
+                            "dimensions, the following dimensions were "
+                            "not found: %s" % repr(not_found), cls)
+
+
+    @classmethod
+    def _column(cls, dataset, dim):
+        "Returns the ChunkedArray holding the values along a dimension"
+        name = dataset.get_dimension(dim, strict=True).name
+        return dataset.data.column(name)
+
+
+    @classmethod
+    def _to_numpy(cls, array):
+        """
+        Converts an Arrow Array or ChunkedArray to a NumPy array,
+        returning a zero-copy view of the Arrow buffer if possible.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        if pa.types.is_dictionary(array.type):
+            array = pc.cast(array, array.type.value_type)
+        if isinstance(array, pa.ChunkedArray):
+            array = array.chunk(0) if array.num_chunks == 1 else array.combine_chunks()
+        try:
+            return array.to_numpy(zero_copy_only=True)
+        except pa.ArrowException:
+            return array.to_numpy(zero_copy_only=False)
+
+
+    @classmethod
+    def _to_scalar(cls, value):
+        "Converts NumPy scalars to values accepted by compute functions"
+        import pyarrow as pa
+        if isinstance(value, np.datetime64):
+            return pa.scalar(value.astype('datetime64[ns]'))
+        elif isinstance(value, np.generic):
+            return value.item()
+        return value
+
+
+    @classmethod
+    def _categorical(cls, column):
+        """
+        Returns the integer codes and the unified dictionary of a
+        dictionary-encoded column, missing values are assigned a code
+        of -1.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        column = column.unify_dictionaries()
+        if column.num_chunks:
+            dictionary = column.chunk(0).dictionary
+        else:
+            dictionary = pa.array([], type=column.type.value_type)
+        codes = [pc.fill_null(chunk.indices, -1).to_numpy(zero_copy_only=False)
+                 for chunk in column.chunks]
+        codes = np.concatenate(codes) if codes else np.array([], dtype='int64')
+        return codes, dictionary
+
+
+    @classmethod
+    def _predicate(cls, column, predicate):
+        """
+        Applies a predicate compute function to a column. For
+        dictionary-encoded columns the predicate is only evaluated on
+        the dictionary and mapped back onto the rows using the codes.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        if not pa.types.is_dictionary(column.type):
+            return predicate(column)
+        masks = []
+        for chunk in column.chunks:
+            matches = pc.fill_null(predicate(chunk.dictionary), False)
+            masks.append(pc.take(matches, chunk.indices))
+        return pa.chunked_array(masks, type=pa.bool_())
+
+
+    @classmethod
+    def _isnumeric(cls, arrow_type):
+        import pyarrow as pa
+        return pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)
+
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        import pyarrow as pa
+        arrow_type = cls._column(dataset, dimension).type
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if pa.types.is_timestamp(arrow_type):
+            return np.dtype('datetime64[%s]' % arrow_type.unit)
+        try:
+            return np.dtype(arrow_type.to_pandas_dtype())
+        except (NotImplementedError, TypeError):
+            return np.dtype('O')
+
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls.dtype(dataset, dim).type
+
+
+    @classmethod
+    def shape(cls, dataset):
+        return (dataset.data.num_rows, dataset.data.num_columns)
+
+
+    @classmethod
+    def length(cls, dataset):
+        return dataset.data.num_rows
+
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        import pyarrow.compute as pc
+        return len(pc.unique(cls._column(dataset, dim))) == 1
+
+
+    @classmethod
+    def issorted(cls, dataset, dim):
+        import pyarrow as pa
+        arrow_type = cls._column(dataset, dim).type
+        if not (cls._isnumeric(arrow_type) or pa.types.is_timestamp(arrow_type)):
+            return cls.statistic(dataset, dim, 'sorted', lambda: False)
+        return super(ArrowInterface, cls).issorted(dataset, dim)
+
+
+    @classmethod
+    def nancount(cls, dataset, dim):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        def nancount():
+            column = cls._column(dataset, dim)
+            count = column.null_count
+            if pa.types.is_floating(column.type):
+                count += pc.sum(pc.is_nan(column)).as_py() or 0
+            return count
+        return cls.statistic(dataset, dim, 'nancount', nancount)
+
+
+    @classmethod
+    def nunique(cls, dataset, dim):
+        import pyarrow.compute as pc
+        def nunique():
+            return len(pc.unique(cls._column(dataset, dim)))
+        return cls.statistic(dataset, dim, 'nunique', nunique)
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        column = cls._column(dataset, dimension)
+        if pa.types.is_dictionary(column.type):
+            # Only compute the range over the values that are in use
+            column = pc.cast(pc.unique(column), column.type.value_type)
+        if not len(column):
+            return np.NaN, np.NaN
+        minmax = pc.min_max(column)
+        lower, upper = minmax['min'], minmax['max']
+        if not lower.is_valid:
+            return np.NaN, np.NaN
+        elif pa.types.is_timestamp(column.type):
+            unit = column.type.unit
+            return np.datetime64(lower.value, unit), np.datetime64(upper.value, unit)
+        return lower.as_py(), upper.as_py()
+
+
+    @classmethod
+    def values(cls, dataset, dim, expanded=True, flat=True, compute=True):
+        import pyarrow.compute as pc
+        column = cls._column(dataset, dim)
+        if not expanded:
+            column = pc.unique(column)
+        return cls._to_numpy(column)
+
+
+    @classmethod
+    def select_mask(cls, dataset, selection, index=None):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        selection keys (i.e tuple ranges, slices, sets, lists or literals)
+        return a boolean mask over the rows in the Dataset object that
+        have been selected, evaluated using Arrow compute kernels. If
+        an index slice is supplied the mask is only computed over the
+        rows within that slice.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        data = dataset.data
+        if index is not None:
+            start, stop, _ = index.indices(data.num_rows)
+            data = data.slice(start, max(stop-start, 0))
+
+        select_mask = None
+        try:
+            for dim, k in selection.items():
+                if isinstance(k, tuple):
+                    k = slice(*k)
+                column = data.column(dataset.get_dimension(dim, strict=True).name)
+                masks = []
+                if isinstance(k, slice):
+                    if k.start is not None:
+                        start = cls._to_scalar(k.start)
+                        masks.append(cls._predicate(column, lambda arr: pc.greater_equal(arr, start)))
+                    if k.stop is not None:
+                        stop = cls._to_scalar(k.stop)
+                        masks.append(cls._predicate(column, lambda arr: pc.less(arr, stop)))
+                elif isinstance(k, (set, list)):
+                    value_set = pa.array([cls._to_scalar(ik) for ik in k])
+                    masks.append(cls._predicate(column, lambda arr: pc.is_in(arr, value_set=value_set)))
+                elif callable(k):
+                    masks.append(pa.array(np.asarray(k(cls._to_numpy(column)), dtype=bool)))
+                else:
+                    value = cls._to_scalar(k)
+                    mask = cls._predicate(column, lambda arr: pc.equal(arr, value))
+                    if dataset.ndims == 1 and not pc.any(mask).as_py():
+                        # Snap to the closest value if there is no exact match
+                        arr = cls._to_numpy(column)
+                        mask = np.zeros(len(arr), dtype=bool)
+                        mask[np.argmin(np.abs(arr - k))] = True
+                        mask = pa.array(mask)
+                    masks.append(mask)
+                for mask in masks:
+                    select_mask = mask if select_mask is None else pc.and_(select_mask, mask)
+        except (pa.ArrowException, TypeError):
+            return super(ArrowInterface, cls).select_mask(dataset, selection, index)
+
+        if select_mask is None:
+            return np.ones(data.num_rows, dtype=bool)
+        return cls._to_numpy(pc.fill_null(select_mask, False))
+
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        import pyarrow as pa
+        data = dataset.data
+        if selection_mask is None:
+            selection_mask = cls.select_index(dataset, selection)
+        indexed = cls.indexed(dataset, selection)
+        if isinstance(selection_mask, slice):
+            start, stop, _ = selection_mask.indices(data.num_rows)
+            data = data.slice(start, max(stop-start, 0))
+        else:
+            selection_mask = np.asarray(selection_mask)
+            if selection_mask.dtype.kind == 'b':
+                data = data.filter(pa.array(selection_mask))
+            else:
+                data = data.take(pa.array(selection_mask))
+        if indexed and data.num_rows == 1 and len(dataset.vdims) == 1:
+            return cls._to_numpy(data.column(dataset.vdims[0].name))[0]
+        return data
+
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        import pyarrow.compute as pc
+        data = dataset.data
+        mask = None
+        for sample in samples:
+            sample_mask = None
+            if np.isscalar(sample): sample = [sample]
+            for i, v in enumerate(sample):
+                column = data.column(dataset.get_dimension(i).name)
+                v = cls._to_scalar(v)
+                dim_mask = cls._predicate(column, lambda arr: pc.equal(arr, v))
+                sample_mask = dim_mask if sample_mask is None else pc.and_(sample_mask, dim_mask)
+            if sample_mask is not None:
+                mask = sample_mask if mask is None else pc.or_(mask, sample_mask)
+        if mask is None:
+            return data.slice(0, 0)
+        return data.filter(mask)
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        import pyarrow as pa
+        index_dims = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        element_dims = [kdim for kdim in dataset.kdims
+                        if kdim not in index_dims]
+
+        group_kwargs = {}
+        if group_type != 'raw' and issubclass(group_type, Element):
+            group_kwargs = dict(util.get_param_values(dataset),
+                                kdims=element_dims)
+        group_kwargs.update(kwargs)
+
+        # Group dictionary-encoded columns by their integer codes
+        arrays, dictionaries = [], []
+        for d in index_dims:
+            column = dataset.data.column(d.name)
+            if pa.types.is_dictionary(column.type):
+                codes, dictionary = cls._categorical(column)
+            else:
+                codes, dictionary = cls._to_numpy(column), None
+            arrays.append(codes)
+            dictionaries.append(dictionary)
+
+        if index_dims:
+            keys, indices = util.group_indices(arrays)
+        elif len(dataset):
+            keys, indices = [()], [np.arange(len(dataset))]
+        else:
+            keys, indices = [], []
+
+        data = []
+        for key, group_inds in zip(keys, indices):
+            key = tuple(v if dictionary is None else
+                        (dictionary[v].as_py() if v >= 0 else None)
+                        for v, dictionary in zip(key, dictionaries))
+            if len(key) == 1:
+                key = key[0]
+            group = dataset.data.take(pa.array(group_inds))
+            data.append((key, group_type(group, **group_kwargs)))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(data, kdims=index_dims)
+        else:
+            return container_type(data)
+
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        data = dataset.data
+        cols = [d.name for d in dataset.kdims if d in dimensions]
+        vdims = dataset.dimensions('value', label='name')
+        kernel = cls._kernels.get(getattr(function, '__name__', None))
+
+        if kernel is None or kwargs or (cols and not hasattr(data, 'group_by')):
+            # Apply the function to the NumPy arrays of each group
+            from . import Dataset
+            columns = OrderedDict([(d, cls.values(dataset, d)) for d in cols+vdims])
+            ds = Dataset(columns, kdims=[dataset.get_dimension(c) for c in cols],
+                         vdims=dataset.vdims, datatype=['dictionary'])
+            aggregated, dropped = DictInterface.aggregate(ds, cols, function, **kwargs)
+            columns = [c for c in cols+vdims if c not in dropped]
+            arrays = [pa.array(np.asarray(aggregated[c])) for c in columns]
+            return pa.Table.from_arrays(arrays, names=columns), dropped
+
+        numeric = [vd for vd in vdims if cls._isnumeric(data.column(vd).type)]
+        if cols:
+            # Order the groups by their first occurrence
+            index = '__index__'
+            table = data.select(cols+numeric).append_column(
+                index, pa.array(np.arange(data.num_rows)))
+            aggs = [(vd, kernel) for vd in numeric] + [(index, 'min')]
+            agg = table.group_by(cols).aggregate(aggs)
+            agg = agg.take(pc.sort_indices(agg, sort_keys=[(index+'_min', 'ascending')]))
+            arrays = ([agg.column(c) for c in cols] +
+                      [agg.column('%s_%s' % (vd, kernel)) for vd in numeric])
+        else:
+            arrays = [pa.array([getattr(pc, kernel)(data.column(vd)).as_py()])
+                      for vd in numeric]
+        dropped = [vd for vd in vdims if vd not in numeric]
+        return pa.Table.from_arrays(arrays, names=cols+numeric), dropped
+
+
+    @classmethod
+    def sort(cls, dataset, by=[], reverse=False):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        order = 'descending' if reverse else 'ascending'
+        columns = OrderedDict()
+        for d in by:
+            name = dataset.get_dimension(d, strict=True).name
+            column = dataset.data.column(name)
+            if pa.types.is_dictionary(column.type):
+                # Sort dictionary-encoded columns by the rank of the
+                # values in the dictionary, placing missing values last
+                codes, dictionary = cls._categorical(column)
+                ranks = np.empty(len(dictionary)+1, dtype='int64')
+                ranks[cls._to_numpy(pc.array_sort_indices(dictionary))] = np.arange(len(dictionary))
+                ranks[-1] = len(dictionary)
+                column = pa.array(ranks[codes])
+            columns[name] = column
+        sort_keys = [(name, order) for name in columns]
+        sorting = pc.sort_indices(pa.table(columns), sort_keys=sort_keys)
+        return dataset.data.take(sorting)
+
+
+    @classmethod
+    def unpack_scalar(cls, dataset, data):
+        """
+        Given a dataset object and data in the appropriate format for
+        the interface, return a simple scalar.
+        """
+        if data.num_rows != 1 or data.num_columns > 1:
+            return data
+        return cls._to_numpy(data.column(0))[0]
+
+
+    @classmethod
+    def reindex(cls, dataset, kdims=None, vdims=None):
+        # Arrow Tables don't need to be reindexed
+        return dataset.data
+
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        names = [dimensions[c].name if c in dimensions else c
+                 for c in dataset.data.column_names]
+        return dataset.data.rename_columns(names)
+
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        import pyarrow as pa
+        data = dataset.data
+        if dimension.name not in data.column_names:
+            if util.isscalar(values):
+                values = np.full(len(dataset), values)
+            data = data.add_column(dim_pos, dimension.name, pa.array(values))
+        return data
+
+
+    @classmethod
+    def concat(cls, datasets, dimensions, vdims):
+        import pyarrow as pa
+        key_dtypes = [np.asarray([key[i] for key, _ in datasets]).dtype
+                      for i in range(len(dimensions))]
+        tables = []
+        for key, ds in datasets:
+            table = ds.data
+            for i, (d, k, dtype) in enumerate(zip(dimensions, key, key_dtypes)):
+                table = table.add_column(i, d.name, pa.array(np.full(len(ds), k, dtype=dtype)))
+            tables.append(table)
+        return pa.concat_tables(tables)
+
+
+    @classmethod
+    def iloc(cls, dataset, index):
+        import pyarrow as pa
+        rows, cols = index
+        scalar = False
+        if isinstance(cols, slice):
+            cols = [d.name for d in dataset.dimensions()][cols]
+        elif np.isscalar(cols):
+            scalar = np.isscalar(rows)
+            cols = [dataset.get_dimension(cols).name]
+        else:
+            cols = [dataset.get_dimension(d).name for d in cols]
+        if np.isscalar(rows):
+            rows = [rows]
+
+        data = dataset.data.select(cols)
+        if isinstance(rows, slice) and rows.step in (None, 1):
+            start, stop, _ = rows.indices(data.num_rows)
+            data = data.slice(start, max(stop-start, 0))
+        else:
+            rows = np.arange(data.num_rows)[rows]
+            data = data.take(pa.array(rows))
+        if scalar:
+            return cls._to_numpy(data.column(0))[0]
+        return data
+
+
+Interface.register(ArrowInterface)
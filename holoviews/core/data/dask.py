@@ -1,6 +1,9 @@
 from __future__ import absolute_import
 
 import sys
+import weakref
+from bisect import bisect_left, bisect_right
+from functools import partial
 try:
     import itertools.izip as zip
 except ImportError:
@@ -8,9 +11,10 @@ except ImportError:
 
 import numpy as np
 import pandas as pd
+import param
 
 from .. import util
-from ..dimension import Dimension
+from ..dimension import Dimension, dimension_name
 from ..element import Element
 from ..ndmapping import NdMapping, item_check, OrderedDict, sorted_context
 from .interface import Interface
@@ -34,6 +38,11 @@ class DaskInterface(PandasInterface):
        error when supplied a non-scalar value.
     4) Not all functions can be easily applied to a dask dataframe so
        some functions applied with aggregate and reduce will not work.
+
+    If the dataframe is indexed by a key dimension and its divisions
+    are known the index is retained, selections along that dimension
+    only read the partitions overlapping the selection and the range
+    of the dimension is computed from the first and last partition.
     """
 
     types = ()
@@ -42,6 +51,18 @@ class DaskInterface(PandasInterface):
 
     default_partitions = 100
 
+    persist_partitions = param.Integer(default=0, bounds=(0, None), doc="""
+        Number of partitions of a dataframe indexed by a dimension to
+        keep persisted in memory once they have been selected, avoiding
+        reloading them on subsequent selections (e.g. when zooming).""")
+
+    # Persisted partitions indexed by dataframe name and partition
+    _persisted = OrderedDict()
+
+    # Weak references to the dataframes with persisted partitions by
+    # id, evicting their partitions once they are garbage collected
+    _persisted_refs = {}
+
     @classmethod
     def loaded(cls):
         return 'dask' in sys.modules and 'pandas' in sys.modules
@@ -57,6 +78,13 @@ class DaskInterface(PandasInterface):
     def init(cls, eltype, data, kdims, vdims):
         import dask.dataframe as dd
 
+        # Retain the index of dataframes indexed by a key dimension
+        # with known divisions, adding the dimension as a column
+        if (isinstance(data, dd.DataFrame) and kdims and data.known_divisions and
+            data.index.name in [dimension_name(kd) for kd in kdims] and
+            data.index.name not in data.columns):
+            data = data.assign(**{data.index.name: data.index})
+
         data, dims, extra = PandasInterface.init(eltype, data, kdims, vdims)
         if not isinstance(data, dd.DataFrame):
             data = dd.from_pandas(data, npartitions=cls.default_partitions, sort=False)
@@ -70,6 +98,98 @@ class DaskInterface(PandasInterface):
                 data = reset
         return data, dims, extra
 
+    @classmethod
+    def index_dimension(cls, dataset):
+        """
+        Returns the name of the dimension the dataframe is indexed by
+        if the divisions of the index are known and None otherwise.
+        """
+        data = dataset.data
+        name = data.index.name
+        if (name is None or name not in data.columns or not data.known_divisions
+            or dataset.get_dimension(name) is None):
+            return None
+        return name
+
+    @classmethod
+    def _unindexed(cls, data):
+        """
+        Drops the name of an index which is also a column, since
+        pandas considers grouping by such a name ambiguous.
+        """
+        if data.index.name is None or data.index.name not in data.columns:
+            return data
+        return data.map_partitions(lambda df: df.rename_axis(None))
+
+    @classmethod
+    def _partitions(cls, data, start, stop):
+        """
+        Returns the dataframe restricted to the persisted partitions
+        overlapping the supplied index range, persisting partitions
+        which have not been loaded yet.
+        """
+        import dask.dataframe as dd
+        divisions = data.divisions
+        first = max(bisect_right(divisions, start)-1, 0) if start is not None else 0
+        last = data.npartitions-1
+        if stop is not None:
+            last = min(bisect_left(divisions, stop)-1, last)
+        if first > last:
+            return data
+
+        if id(data) not in cls._persisted_refs:
+            evict = partial(cls._evict, id(data), data._name)
+            cls._persisted_refs[id(data)] = weakref.ref(data, evict)
+
+        partitions = []
+        for i in range(first, last+1):
+            key = (data._name, i)
+            if key in cls._persisted:
+                partition = cls._persisted.pop(key)
+            else:
+                partition = data.get_partition(i).persist()
+            cls._persisted[key] = partition
+            partitions.append(partition)
+        while len(cls._persisted) > cls.persist_partitions:
+            cls._persisted.popitem(last=False)
+        return dd.concat(partitions)
+
+    @classmethod
+    def _evict(cls, ident, name, ref=None):
+        "Drops the persisted partitions of a garbage collected dataframe"
+        cls._persisted_refs.pop(ident, None)
+        for key in [k for k in cls._persisted if k[0] == name]:
+            del cls._persisted[key]
+
+    @classmethod
+    def _prune(cls, dataset, selection):
+        """
+        Applies range and scalar selections along the index dimension
+        using the divisions so that only partitions overlapping the
+        selection are read.
+        """
+        data = dataset.data
+        index_dim = cls.index_dimension(dataset)
+        if index_dim is None:
+            return data
+        for dim, k in selection.items():
+            if dataset.get_dimension(dim).name != index_dim:
+                continue
+            if isinstance(k, tuple):
+                k = slice(*k)
+            try:
+                if isinstance(k, slice):
+                    start = util.numpy_scalar_to_python(k.start)
+                    stop = util.numpy_scalar_to_python(k.stop)
+                    if cls.persist_partitions:
+                        data = cls._partitions(data, start, stop)
+                    data = data.loc[start:stop]
+                elif util.isscalar(k):
+                    data = data.loc[util.numpy_scalar_to_python(k)]
+            except (TypeError, KeyError, ValueError):
+                return dataset.data
+        return data
+
     @classmethod
     def shape(cls, dataset):
         return (len(dataset.data), len(dataset.data.columns))
@@ -77,12 +197,64 @@ class DaskInterface(PandasInterface):
     @classmethod
     def range(cls, dataset, dimension):
         import dask.dataframe as dd
-        column = dataset.data[dataset.get_dimension(dimension).name]
+        dim = dataset.get_dimension(dimension)
+        column = dataset.data[dim.name]
+        if dim.name == cls.index_dimension(dataset) and column.dtype.kind in 'iufM':
+            # The data is sorted along the index so only the first and
+            # last partition have to be loaded
+            data = dataset.data
+            lower, upper = dd.compute(data.get_partition(0).index.min(),
+                                      data.get_partition(data.npartitions-1).index.max())
+            if not (pd.isnull(lower) or pd.isnull(upper)):
+                return lower, upper
         if column.dtype.kind == 'O':
             column = np.sort(column[column.notnull()].compute())
             return (column[0], column[-1]) if len(column) else (None, None)
-        else:
-            return dd.compute(column.min(), column.max())
+
+        # Compute the ranges of all numeric dimensions which have not
+        # been cached yet in a single pass over the data
+        stats = cls.statistics(dataset)
+        index_dim = cls.index_dimension(dataset)
+        dims = [dim] + [d for d in dataset.dimensions() if d != dim and d.name != index_dim
+                        and 'range' not in stats.get(d.name, {})
+                        and dataset.data[d.name].dtype.kind in 'iufM']
+        columns = [dataset.data[d.name] for d in dims]
+        values = dd.compute(*[agg for c in columns for agg in (c.min(), c.max())])
+        ranges = list(zip(values[::2], values[1::2]))
+        for d, drange in zip(dims[1:], ranges[1:]):
+            stats.setdefault(d.name, {})['range'] = drange
+        return ranges[0]
+
+    @classmethod
+    def _describe(cls, dataset, dimensions, quantiles, chunksize):
+        import dask.dataframe as dd
+        # Compute the statistics of all numeric columns in a single
+        # pass, quantiles are approximated by dask
+        numeric = [d for d in dimensions if dataset.data[d.name].dtype.kind in 'iuf']
+        reductions = []
+        for d in numeric:
+            column = dataset.data[d.name]
+            reductions += [column.size, column.count(), column.min(), column.max(),
+                           column.mean(), column.var(ddof=0)]
+            if quantiles:
+                reductions.append(column.quantile(list(quantiles)))
+        values = list(dd.compute(*reductions))
+        computed = {}
+        for d in numeric:
+            size, count, lower, upper, mean, var = values[:6]
+            qs = values[6].values if quantiles else []
+            values = values[7 if quantiles else 6:]
+            summary = OrderedDict([('count', size), ('nancount', size-count),
+                                   ('min', lower), ('max', upper),
+                                   ('mean', mean), ('var', var)])
+            for q, v in zip(quantiles, qs):
+                summary[util.quantile_label(q)] = v
+            computed[d.name] = (summary, True)
+        others = [d for d in dimensions if d not in numeric]
+        if others:
+            summaries = super(DaskInterface, cls)._describe(dataset, others, quantiles, chunksize)
+            computed.update({d.name: s for d, s in zip(others, summaries)})
+        return [computed[d.name] for d in dimensions]
 
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
@@ -105,13 +277,17 @@ class DaskInterface(PandasInterface):
         return a boolean mask over the rows in the Dataset object that
         have been selected.
         """
+        return cls._select_mask(dataset.data, dataset, selection)
+
+    @classmethod
+    def _select_mask(cls, data, dataset, selection):
         select_mask = None
         for dim, k in selection.items():
             if isinstance(k, tuple):
                 k = slice(*k)
             masks = []
             alias = dataset.get_dimension(dim).name
-            series = dataset.data[alias]
+            series = data[alias]
             if isinstance(k, slice):
                 if k.start is not None:
                     # Workaround for dask issue #3392
@@ -145,7 +321,8 @@ class DaskInterface(PandasInterface):
         df = dataset.data
         if selection_mask is not None:
             return df[selection_mask]
-        selection_mask = cls.select_mask(dataset, selection)
+        df = cls._prune(dataset, selection)
+        selection_mask = cls._select_mask(df, dataset, selection)
         indexed = cls.indexed(dataset, selection)
         df = df if selection_mask is None else df[selection_mask]
         if indexed and len(df) == 1 and len(dataset.vdims) == 1:
@@ -166,7 +343,7 @@ class DaskInterface(PandasInterface):
 
         data = []
         group_by = [d.name for d in index_dims]
-        groupby = dataset.data.groupby(group_by)
+        groupby = cls._unindexed(dataset.data).groupby(group_by)
         if len(group_by) == 1:
             column = dataset.data[group_by[0]]
             if column.dtype.name == 'category':
@@ -200,7 +377,7 @@ class DaskInterface(PandasInterface):
         dtypes = data.dtypes
         numeric = [c for c, dtype in zip(dtypes.index, dtypes.values)
                    if dtype.kind in 'iufc' and c in vdims]
-        reindexed = data[cols+numeric]
+        reindexed = cls._unindexed(data[cols+numeric])
 
         inbuilts = {'amin': 'min', 'amax': 'max', 'mean': 'mean',
                     'std': 'std', 'sum': 'sum', 'var': 'var'}
@@ -224,6 +401,53 @@ class DaskInterface(PandasInterface):
                 dropped.append(vd)
         return df, dropped
 
+
+    @classmethod
+    def aggregate_many(cls, dataset, dimensions, reductions):
+        # Avoid loading the columns into memory by aggregating lazily,
+        # computing all known reductions in a single pass. As on the
+        # PandasInterface missing values are skipped and std and var
+        # use ddof=0 for consistency with numpy.
+        import dask
+        cols = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        vdims = list(util.unique_iterator(vd for vd, _, _ in reductions))
+        data = cls._unindexed(dataset.data[cols+vdims])
+        if not cols:
+            # Reduce all rows as a single group
+            data = data.assign(__group__=0)
+        groups = data.groupby(cols or ['__group__'])
+
+        known, custom, dropped = [], [], []
+        for vdim, function, name in reductions:
+            column = groups[vdim]
+            reduction = util._known_reduction(function)
+            if reduction is None:
+                custom.append((name, column, function))
+                continue
+            reduction = reduction.replace('nan', '')
+            if reduction == 'count':
+                known.append((name, column.size()))
+            elif reduction in ('std', 'var'):
+                known.append((name, getattr(column, reduction)(ddof=0)))
+            else:
+                known.append((name, getattr(column, reduction)()))
+
+        computed = dict(zip([n for n, _ in known], dask.compute(*[r for _, r in known])))
+        for name, column, function in custom:
+            try:
+                computed[name] = column.apply(lambda s: function(s.values)).compute()
+            except TypeError:
+                dropped.append(name)
+
+        names = [name for _, _, name in reductions if name in computed]
+        if not names:
+            return OrderedDict((c, []) for c in cols), dropped
+        df = pd.concat([computed[n] for n in names], axis=1, keys=names).reset_index()
+        columns = OrderedDict((c, df[c].values) for c in cols)
+        columns.update((n, df[n].values) for n in names)
+        return columns, dropped
+
+
     @classmethod
     def unpack_scalar(cls, dataset, data):
         """
@@ -276,10 +500,11 @@ class DaskInterface(PandasInterface):
 
     @classmethod
     def dframe(cls, dataset, dimensions):
+        data = cls._unindexed(dataset.data)
         if dimensions:
-            return dataset.data[dimensions].compute()
+            return data[dimensions].compute()
         else:
-            return dataset.data.compute()
+            return data.compute()
 
     @classmethod
     def nonzero(cls, dataset):
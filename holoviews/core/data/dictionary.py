@@ -1,4 +1,4 @@
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 try:
     import itertools.izip as zip
 except ImportError:
@@ -27,6 +27,27 @@ class DictInterface(Interface):
 
     datatype = 'dictionary'
 
+    zero_copy = True
+
+    # String columns with at least categorical_length rows and at most
+    # categorical_ratio unique values per row are dictionary-encoded
+    # as a CategoricalArray, disabled by default (None) since encoded
+    # columns have to be decoded whenever their values are requested
+    categorical_length = None
+
+    # The ratio is first estimated on the leading 1000 rows to avoid
+    # factorizing high cardinality columns, so a column which only
+    # repeats values further down is not encoded
+    categorical_ratio = 0.1
+
+    @classmethod
+    def applies(cls, obj):
+        if type(obj) not in cls.types:
+            return False
+        # Dictionaries of memory-mapped columns belong to the MemmapInterface
+        return not (len(obj) > 0 and all(isinstance(v, np.memmap) and v.ndim == 1
+                                         for v in obj.values()))
+
     @classmethod
     def dimension_type(cls, dataset, dim):
         name = dataset.get_dimension(dim, strict=True).name
@@ -88,7 +109,7 @@ class DictInterface(Interface):
                               for k, v in dict_data))
             data = {k: np.array(v) for k, v in zip(dimensions, dict_data)}
 
-        if not isinstance(data, cls.types):
+        if not isinstance(data, DictInterface.types):
             raise ValueError("DictInterface interface couldn't convert data.""")
 
         unpacked = []
@@ -107,10 +128,11 @@ class DictInterface(Interface):
             elif d not in dimensions:
                 unpacked.append((d, vals))
             else:
-                if not isscalar(vals):
+                if not (isscalar(vals) or isinstance(vals, util.CategoricalArray)):
                     vals = np.asarray(vals)
                     if not vals.ndim == 1 and d in dimensions:
                         raise ValueError('DictInterface expects data for each column to be flat.')
+                    vals = cls._encode(vals)
                 unpacked.append((d, vals))
 
         if not cls.expanded([vs for d, vs in unpacked if d in dimensions and not isscalar(vs)]):
@@ -123,6 +145,36 @@ class DictInterface(Interface):
         return data, {'kdims':kdims, 'vdims':vdims}, {}
 
 
+    @classmethod
+    def _encode(cls, values):
+        """
+        Encodes long string columns with few unique values as a
+        CategoricalArray.
+        """
+        if (cls.categorical_length is None or len(values) < cls.categorical_length
+            or values.dtype.kind not in 'SUO' or
+            (values.dtype.kind == 'O' and not isinstance(values[0], util.basestring))):
+            return values
+        try:
+            head = values[:1000]
+            if len(util.unique_array(head)) > cls.categorical_ratio*len(head):
+                return values
+            categorical = util.CategoricalArray.from_values(values)
+        except TypeError:
+            return values
+        if (len(categorical.categories) > cls.categorical_ratio*len(values) or
+            not all(isinstance(c, util.basestring) for c in categorical.categories)):
+            return values
+        return categorical
+
+
+    @classmethod
+    def categorical(cls, dataset, dim):
+        name = dataset.get_dimension(dim, strict=True).name
+        values = dataset.data[name]
+        return values if isinstance(values, util.CategoricalArray) else None
+
+
     @classmethod
     def validate(cls, dataset, vdims=True):
         dim_types = 'all' if vdims else 'key'
@@ -161,6 +213,8 @@ class DictInterface(Interface):
         values = dataset.data[name]
         if isscalar(values):
             return True
+        elif isinstance(values, util.CategoricalArray):
+            return len(np.unique(values.codes)) == 1
         if values.dtype.kind == 'O':
             unique = set(values)
         else:
@@ -212,16 +266,17 @@ class DictInterface(Interface):
 
     @classmethod
     def concat(cls, datasets, dimensions, vdims):
-        columns = defaultdict(list)
-        for key, ds in datasets:
-            for k, vals in ds.data.items():
-                columns[k].append(vals)
-            for d, k in zip(dimensions, key):
-                columns[d.name].append(np.full(len(ds), k))
+        # Compute the lengths up front to allocate each column once
+        lengths = [len(ds) for _, ds in datasets]
+        columns = OrderedDict()
+        for i, d in enumerate(dimensions):
+            columns[d.name] = util.repeat_keys([key[i] for key, _ in datasets], lengths)
 
         template = datasets[0][1]
-        dims = dimensions+template.dimensions()
-        return OrderedDict([(d.name, np.concatenate(columns[d.name])) for d in dims])
+        for d in template.dimensions():
+            arrays = [ds.data[d.name] for _, ds in datasets]
+            columns[d.name] = util.concat_arrays(arrays, lengths)
+        return columns
 
 
     @classmethod
@@ -242,6 +297,11 @@ class DictInterface(Interface):
         column = dataset.data[dim.name]
         if isscalar(column):
             return column, column
+        elif isinstance(column, util.CategoricalArray):
+            # Only the categories in use have to be compared
+            if not len(column):
+                return np.NaN, np.NaN
+            return util.find_range(column.unique())
         return Interface.range(dataset, dimension)
 
 
@@ -282,17 +342,22 @@ class DictInterface(Interface):
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        # Find the unique keys and the row indices of each group
+        if dimensions:
+            arrays = [cls.categorical(dataset, d) for d in dimensions]
+            arrays = [cls.values(dataset, d) if arr is None else arr
+                      for d, arr in zip(dimensions, arrays)]
+            keys, indices = util.group_indices(arrays)
+        elif len(dataset):
+            keys, indices = [()], [np.arange(len(dataset))]
+        else:
+            keys, indices = [], []
 
-        # Iterate over the unique entries applying selection masks
+        # Iterate over the unique entries indexing each group
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
+        for unique_key, group_inds in zip(keys, indices):
             group_data = OrderedDict(((d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
-                                       else dataset.data[d.name][mask])
+                                       else dataset.data[d.name][group_inds])
                                       for d in kdims+vdims))
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
@@ -307,7 +372,7 @@ class DictInterface(Interface):
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         data = OrderedDict((k, v if isscalar(v) else v[selection_mask])
                            for k, v in dataset.data.items())
@@ -335,6 +400,9 @@ class DictInterface(Interface):
     def aggregate(cls, dataset, kdims, function, **kwargs):
         kdims = [dataset.get_dimension(d, strict=True).name for d in kdims]
         vdims = dataset.dimensions('value', label='name')
+        if not kwargs and not any(isscalar(dataset.data[vd]) for vd in vdims):
+            return cls.aggregate_many(dataset, kdims, [(vd, function, vd) for vd in vdims])
+
         groups = cls.groupby(dataset, kdims, list, OrderedDict)
         aggregated = OrderedDict([(k, []) for k in kdims+vdims])
 
@@ -1,8 +1,15 @@
 from __future__ import absolute_import
 
+import os
 import sys
+import atexit
+import weakref
+import tempfile
+import itertools
+import warnings
 import datetime as dt
 from collections import OrderedDict, defaultdict, Iterable
+from functools import partial
 
 try:
     import itertools.izip as zip
@@ -44,6 +51,14 @@ class GridInterface(DictInterface):
 
     gridded = True
 
+    # Row slices flatten the grid into columns
+    zero_copy = False
+
+    # Maps the ids of memory-mapped pyramid levels to a weak reference
+    # to the level and the file backing it, which is removed once the
+    # level is released (memmaps are unhashable so cannot be keys)
+    _pyramid_files = {}
+
     @classmethod
     def init(cls, eltype, data, kdims, vdims):
         if kdims is None:
@@ -348,12 +363,28 @@ class GridInterface(DictInterface):
                 data = data.compute()
             return data.T.flatten() if flat else data
         elif expanded:
-            data = cls.coords(dataset, dim.name, expanded=True)
-            return data.T.flatten() if flat else data
+            if flat:
+                return cls.expanded_values(dataset, dim)
+            return cls.coords(dataset, dim.name, expanded=True)
         else:
             return cls.coords(dataset, dim.name, ordered=True)
 
 
+    @classmethod
+    def expanded_values(cls, dataset, dim):
+        """
+        Returns the flattened coordinates along a key dimension
+        expanded to the length of the dataset. Since the expanded
+        array has to be materialized it is recorded in the statistics
+        cache and marked read-only as it is shared between callers.
+        """
+        def expand():
+            data = cls.coords(dataset, dim, expanded=True).T.flatten()
+            data.setflags(write=False)
+            return data
+        return cls.statistic(dataset, dim, 'expanded', expand)
+
+
     @classmethod
     def groupby(cls, dataset, dim_names, container_type, group_type, **kwargs):
         # Get dimensions information
@@ -386,11 +417,27 @@ class GridInterface(DictInterface):
         transpose = [dataset.ndims-dataset.kdims.index(kd)-1 for kd in kdims]
         transpose += [i for i in range(dataset.ndims) if i not in transpose]
 
-        # Iterate over the unique entries applying selection masks
+        # Regularly sampled grids are already factorized along each
+        # axis so groups can be sliced out by their integer position
+        shape = cls.shape(dataset, gridded=True)
+        sliceable = not dataset._binned and len(shape) == dataset.ndims and all(
+            not cls.irregular(dataset, kd) and len(dataset.data[kd.name]) ==
+            shape[dataset.ndims-dataset.get_dimension_index(kd)-1]
+            for kd in dataset.kdims)
+        axes = [dataset.ndims-dataset.get_dimension_index(d)-1 for d in dimensions]
+
+        # Iterate over the unique entries selecting each group
         grouped_data = []
-        for unique_key in zip(*util.cartesian_product(keys)):
+        for key_inds in itertools.product(*[range(len(k)) for k in keys]):
+            unique_key = tuple(k[i] for k, i in zip(keys, key_inds))
             select = dict(zip(dim_names, unique_key))
-            if drop_dim:
+            if sliceable:
+                group_data = cls._slice_group(dataset, dict(zip(axes, key_inds)))
+                if drop_dim:
+                    group_data = dataset.clone(group_data).columns()
+                elif len(dimensions) == dataset.ndims and len(dataset.vdims) == 1:
+                    group_data = np.squeeze(group_data[dataset.vdims[0].name])
+            elif drop_dim:
                 group_data = dataset.select(**select)
                 group_data = group_data if np.isscalar(group_data) else group_data.columns()
             else:
@@ -417,6 +464,27 @@ class GridInterface(DictInterface):
             return container_type(grouped_data)
 
 
+    @classmethod
+    def _slice_group(cls, dataset, indices):
+        """
+        Slices a group out of a regularly sampled grid given a
+        dictionary mapping from array axis to the integer index along
+        that axis, returning views of the coordinate and value arrays.
+        """
+        data = OrderedDict()
+        for i, kd in enumerate(dataset.kdims):
+            axis = dataset.ndims-i-1
+            coords = dataset.data[kd.name]
+            if axis in indices:
+                coords = coords[indices[axis]:indices[axis]+1]
+            data[kd.name] = coords
+        index = tuple(slice(indices[axis], indices[axis]+1) if axis in indices
+                      else slice(None) for axis in range(dataset.ndims))
+        for vd in dataset.vdims:
+            data[vd.name] = dataset.data[vd.name][index]
+        return data
+
+
     @classmethod
     def key_select_mask(cls, dataset, values, ind):
         if isinstance(ind, tuple):
@@ -454,6 +522,82 @@ class GridInterface(DictInterface):
         return mask
 
 
+    @classmethod
+    def slice_index(cls, values, ind):
+        """
+        Given a 1D array of coordinates and a range selection returns
+        an integer slice selecting the coordinates within the range.
+        Uses a binary search if the coordinates are monotonically
+        increasing or decreasing and returns None if the selection
+        cannot be expressed as a slice.
+        """
+        if isinstance(ind, tuple):
+            ind = slice(*ind)
+        if ind is None:
+            return slice(0, len(values))
+        elif (not isinstance(ind, slice) or ind.step is not None or
+              np.ndim(values) != 1 or values.dtype.kind not in 'iufM'):
+            return None
+
+        if np.all(values[1:] > values[:-1]):
+            ascending = True
+        elif np.all(values[1:] < values[:-1]):
+            ascending, values = False, values[::-1]
+        else:
+            return None
+
+        bounds = []
+        for bound, default in ((ind.start, 0), (ind.stop, len(values))):
+            if bound is None:
+                bounds.append(default)
+                continue
+            try:
+                if values.dtype.kind == 'M':
+                    bound = np.datetime64(bound)
+                bounds.append(int(np.searchsorted(values, bound, 'left')))
+            except (TypeError, ValueError):
+                return None
+        start, stop = bounds
+        if not ascending:
+            start, stop = len(values)-stop, len(values)-start
+        return slice(start, max(start, stop))
+
+
+    @classmethod
+    def _select_slices(cls, dataset, selection):
+        """
+        Applies a selection consisting only of range selections along
+        monotonic coordinates by slicing the arrays, returning views
+        rather than copies of the data. Returns None if the selection
+        cannot be applied by slicing.
+        """
+        slices = []
+        for dim, ind in selection:
+            if cls.irregular(dataset, dim):
+                return None
+            slc = cls.slice_index(cls.coords(dataset, dim), ind)
+            if slc is None:
+                return None
+            slices.append(slc)
+
+        data = {}
+        for dim, slc in zip(dataset.kdims, slices):
+            if dataset._binned:
+                edges = cls.coords(dataset, dim, False, edges=True)
+                if slc.stop > slc.start:
+                    data[dim.name] = edges[slc.start:slc.stop+1]
+                else:
+                    data[dim.name] = edges[0:0]
+            else:
+                data[dim.name] = cls.coords(dataset, dim)[slc]
+
+        # Arrays are indexed in reversed order of the key dimensions
+        index = tuple(slices[::-1])
+        for vdim in dataset.vdims:
+            data[vdim.name] = dataset.data[vdim.name][index]
+        return data
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         dimensions = dataset.kdims
@@ -465,6 +609,11 @@ class GridInterface(DictInterface):
         indexed = cls.indexed(dataset, selection)
         full_selection = [(d, selection.get(d.name, selection.get(d.label)))
                           for d in dimensions]
+        if not indexed:
+            data = cls._select_slices(dataset, full_selection)
+            if data is not None:
+                return data
+
         data = {}
         value_select = []
         for i, (dim, ind) in enumerate(full_selection):
@@ -662,12 +811,54 @@ class GridInterface(DictInterface):
             return new_data[0][0]
         return tuple(new_data)
 
+    @classmethod
+    def dask_ranges(cls, dataset, dimension):
+        """
+        Computes the range of a dask backed value dimension along with
+        the ranges of all other dask backed value dimensions, which
+        have not been cached yet, in a single dask.compute call. The
+        additional ranges are added to the statistics of the dataset.
+        Returns None if the dimension is not backed by a dask array.
+        """
+        da = dask_array_module()
+        dimension = dataset.get_dimension(dimension, strict=True)
+        if da is None or dimension not in dataset.vdims:
+            return None
+        stats = cls.statistics(dataset)
+        dims = [dimension] + [vd for vd in dataset.vdims if vd != dimension
+                              and 'range' not in stats.get(vd.name, {})]
+        reductions, computed = [], []
+        for d in dims:
+            array = dataset.data[d.name]
+            if not isinstance(array, da.Array):
+                # Unpack xarray DataArrays
+                array = getattr(array, 'data', None)
+            if (not isinstance(array, da.Array) or not array.size or
+                array.dtype.kind not in 'iufM'):
+                if d is dimension:
+                    return None
+                continue
+            elif array.dtype.kind == 'M':
+                reductions += [array.min(), array.max()]
+            else:
+                reductions += [da.nanmin(array), da.nanmax(array)]
+            computed.append(d)
+        values = da.compute(*reductions)
+        ranges = list(zip(values[::2], values[1::2]))
+        for d, drange in zip(computed[1:], ranges[1:]):
+            stats.setdefault(d.name, {})['range'] = drange
+        return ranges[0]
+
+
     @classmethod
     def range(cls, dataset, dimension):
         if dataset._binned and dimension in dataset.kdims:
             expanded = cls.irregular(dataset, dimension)
             column = cls.coords(dataset, dimension, expanded=expanded, edges=True)
         else:
+            drange = cls.dask_ranges(dataset, dimension)
+            if drange is not None:
+                return drange
             column = cls.values(dataset, dimension, expanded=False, flat=False)
 
         da = dask_array_module()
@@ -689,4 +880,89 @@ class GridInterface(DictInterface):
                 return column[0], column[-1]
 
 
+    @classmethod
+    def _downsample(cls, array, function):
+        """
+        Downsamples a 2D array by a factor of two along both axes by
+        applying the 'mean' or 'max' to each 2x2 block, dropping a
+        trailing row or column if the shape is odd.
+        """
+        ny, nx = (array.shape[0]//2), (array.shape[1]//2)
+        blocks = array[:ny*2, :nx*2].reshape(ny, 2, nx, 2)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'(Mean of empty slice|All-NaN)')
+            if function == 'max':
+                return np.nanmax(blocks, axis=(1, 3))
+            elif array.dtype.kind in 'iub':
+                return np.round(blocks.mean(axis=(1, 3))).astype(array.dtype)
+            return np.nanmean(blocks, axis=(1, 3))
+
+
+    @classmethod
+    def pyramid(cls, dataset, level, function='mean', path=None):
+        """
+        Returns the coordinates and value arrays of a 2D dataset
+        downsampled by a factor of 2**level along both axes as a tuple
+        of the form (xs, ys, *values). Each level of the values is
+        computed from the previous level using the 'mean' or 'max' of
+        2x2 blocks, only when it is first requested, and recorded in
+        the statistics cache. If a path is supplied the value arrays
+        are written to uniquely named memory-mapped .npy files in that
+        directory, which are removed once the arrays are released.
+        """
+        def level_coords(dim):
+            # Coordinates are cheap to derive and may depend on the
+            # bounds, which are not shared with the statistics cache
+            coords = cls.values(dataset, dim, expanded=False)
+            for _ in range(level):
+                n = len(coords)//2
+                lower, upper = coords[:n*2:2], coords[1:n*2:2]
+                coords = lower + (upper-lower)/2
+            return coords
+
+        def level_values(dim, level):
+            if level == 0:
+                return cls.values(dataset, dim, flat=False)
+            return cls.statistic(dataset, dim, ('pyramid', function, level),
+                                 lambda: compute_values(dim, level))
+
+        def compute_values(dim, level):
+            downsampled = cls._downsample(np.asarray(level_values(dim, level-1)), function)
+            if path is None:
+                return downsampled
+            prefix = '%s_%s_%d_' % (util.dimension_sanitizer(dim.name), function, level)
+            fd, filename = tempfile.mkstemp(suffix='.npy', prefix=prefix, dir=path)
+            os.close(fd)
+            memmap = np.lib.format.open_memmap(filename, mode='w+', dtype=downsampled.dtype,
+                                               shape=downsampled.shape)
+            memmap[:] = downsampled
+            memmap.flush()
+            ref = weakref.ref(memmap, partial(cls._remove_pyramid_file, id(memmap)))
+            cls._pyramid_files[id(memmap)] = (ref, filename)
+            return memmap
+
+        return (tuple(level_coords(kd) for kd in dataset.kdims) +
+                tuple(level_values(vd, level) for vd in dataset.vdims))
+
+
+    @classmethod
+    def _remove_pyramid_file(cls, ident, ref=None):
+        _, filename = cls._pyramid_files.pop(ident, (None, None))
+        if filename is None:
+            return
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+
+    @classmethod
+    def _remove_pyramid_files(cls):
+        "Removes the pyramid files which are still in use on exit"
+        for ident in list(cls._pyramid_files):
+            cls._remove_pyramid_file(ident)
+
+
 Interface.register(GridInterface)
+
+atexit.register(GridInterface._remove_pyramid_files)
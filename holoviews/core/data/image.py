@@ -161,7 +161,11 @@ class ImageInterface(GridInterface):
         The set of samples available along a particular dimension.
         """
         dim_idx = dataset.get_dimension_index(dim)
-        if dim_idx in [0, 1]:
+        if dim_idx in [0, 1] and expanded:
+            if flat:
+                return cls.expanded_values(dataset, dim)
+            return util.expand_grid_coords(dataset, dim)
+        elif dim_idx in [0, 1]:
             l, b, r, t = dataset.bounds.lbrt()
             dim2, dim1 = dataset.data.shape[:2]
             xdate, ydate = isinstance(l, util.datetime_types), isinstance(b, util.datetime_types)
@@ -179,11 +183,7 @@ class ImageInterface(GridInterface):
             else:
                 ystep = float(t - b)/dim2
                 ylin = np.linspace(b+(ystep/2.), t-(ystep/2.), dim2)
-            if expanded:
-                values = np.meshgrid(ylin, xlin)[abs(dim_idx-1)]
-                return values.flatten() if flat else values.T
-            else:
-                return ylin if dim_idx else xlin
+            return ylin if dim_idx else xlin
         elif dataset.ndims <= dim_idx < len(dataset.dimensions()):
             # Raster arrays are stored with different orientation
             # than expanded column format, reorient before expanding
@@ -40,6 +40,20 @@ class DataError(ValueError):
         super(DataError, self).__init__(msg)
 
 
+class DataStatistics(dict):
+    """
+    DataStatistics is a small cache of statistics of the values along
+    the dimensions of a data object, indexed by dimension name and the
+    name of the statistic. It holds a reference to the data the
+    statistics were computed on, which allows a Dataset to discard the
+    cache once its data has been replaced.
+    """
+
+    def __init__(self, data):
+        super(DataStatistics, self).__init__()
+        self.data = data
+
+
 class iloc(object):
     """
     iloc is small wrapper object that allows row, column based
@@ -63,14 +77,9 @@ class iloc(object):
         rows, cols = index
         if rows is Ellipsis:
             rows = slice(None)
-        data = self.dataset.interface.iloc(self.dataset, (rows, cols))
         kdims = self.dataset.kdims
         vdims = self.dataset.vdims
-        if np.isscalar(data):
-            return data
-        elif cols == slice(None):
-            pass
-        else:
+        if not (isinstance(cols, slice) and cols == slice(None)):
             if isinstance(cols, slice):
                 dims = self.dataset.dimensions()[index[1]]
             elif np.isscalar(cols):
@@ -80,6 +89,22 @@ class iloc(object):
             kdims = [d for d in dims if d in kdims]
             vdims = [d for d in dims if d in vdims]
 
+        plan = self.dataset._plan
+        if plan is not None and not (np.isscalar(rows) and np.isscalar(cols)):
+            return self.dataset._lazy_clone(plan.iloc((rows, cols)),
+                                            kdims=kdims, vdims=vdims)
+
+        data = self.dataset.interface.iloc(self.dataset, (rows, cols))
+        if np.isscalar(data):
+            return data
+
+        interface = self.dataset.interface
+        if isinstance(rows, slice) and interface.zero_copy:
+            # Views of validated data do not have to be validated again
+            datatype = list(util.unique_iterator([interface.datatype]+self.dataset.datatype))
+            return self.dataset.clone(data, kdims=kdims, vdims=vdims,
+                                      datatype=datatype, _validate=False)
+
         datatype = [dt for dt in self.dataset.datatype
                     if dt in Interface.interfaces and
                     not Interface.interfaces[dt].gridded]
@@ -118,6 +143,13 @@ class Interface(param.Parameterized):
 
     interfaces = {}
 
+    # Maps the signature of the input data, the element type and the
+    # datatype priority list to the highest priority interface, if it
+    # accepted the data, holding at most _dispatch_size entries
+    _dispatch = OrderedDict()
+
+    _dispatch_size = 256
+
     datatype = None
 
     types = ()
@@ -128,6 +160,10 @@ class Interface(param.Parameterized):
     # Denotes whether the interface expects ragged data
     multi = False
 
+    # Denotes whether contiguous and strided row slices applied with
+    # iloc return views sharing memory with the original data
+    zero_copy = False
+
     @classmethod
     def loaded(cls):
         """
@@ -149,6 +185,7 @@ class Interface(param.Parameterized):
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
+        cls._dispatch.clear()
 
     @classmethod
     def cast(cls, datasets, datatype=None, cast_type=None):
@@ -183,6 +220,26 @@ class Interface(param.Parameterized):
                 "on supported datatypes see {url}".format(**info))
 
 
+    @classmethod
+    def _signature(cls, data):
+        """
+        Returns a signature of the supplied data used to look up the
+        interface which last accepted it. Along with the type of the
+        data it records the type and dimensionality of the columns of
+        tuples and dictionaries and the type of the first item in a
+        list, since these determine which interfaces accept the data.
+        """
+        if isinstance(data, tuple):
+            columns = data
+        elif isinstance(data, dict):
+            columns = data.values()
+        elif isinstance(data, list):
+            columns = data[:1]
+        else:
+            return type(data)
+        return (type(data),)+tuple((type(c), getattr(c, 'ndim', None))
+                                   for c in columns)
+
     @classmethod
     def initialize(cls, eltype, data, kdims, vdims, datatype=None):
         # Process params and dimensions
@@ -216,6 +273,19 @@ class Interface(param.Parameterized):
         if datatype is None:
             datatype = eltype.datatype
 
+        # Try the highest priority interface for data with the same
+        # signature, skipping the type checks of all interfaces
+        key = (cls._signature(data), eltype, tuple(datatype))
+        cached = cls._dispatch.get(key)
+        if cached is not None:
+            try:
+                (data, dims, extra_kws) = cached.init(eltype, data, kdims, vdims)
+                return data, cached, dims, extra_kws
+            except DataError:
+                raise
+            except Exception:
+                pass
+
         # Set interface priority order
         prioritized = [cls.interfaces[p] for p in datatype
                        if p in cls.interfaces]
@@ -225,17 +295,20 @@ class Interface(param.Parameterized):
             prioritized = head + [el for el in prioritized if el != head[0]]
 
         # Iterate over interfaces until one can interpret the input
-        priority_errors = []
+        priority_errors, failed = [], cached is not None
         for interface in prioritized:
             if not interface.loaded() and len(datatype) != 1:
                 # Skip interface if it is not loaded and was not explicitly requested
                 continue
+            elif interface is cached:
+                continue
             try:
                 (data, dims, extra_kws) = interface.init(eltype, data, kdims, vdims)
                 break
             except DataError:
                 raise
             except Exception as e:
+                failed = True
                 if interface in head:
                     priority_errors.append((interface, e))
         else:
@@ -248,6 +321,12 @@ class Interface(param.Parameterized):
                 error = ' '.join([error, priority_error])
             raise DataError(error)
 
+        # Only cache the interface if no higher priority interface
+        # failed, so that the dispatch does not depend on earlier data
+        if not failed:
+            if len(cls._dispatch) >= cls._dispatch_size:
+                cls._dispatch.popitem(last=False)
+            cls._dispatch[key] = interface
         return data, interface, dims, extra_kws
 
 
@@ -279,18 +358,36 @@ class Interface(param.Parameterized):
 
 
     @classmethod
-    def select_mask(cls, dataset, selection):
+    def categorical(cls, dataset, dim):
+        """
+        Returns the CategoricalArray storing the values along the
+        supplied dimension or None if the column is not
+        dictionary-encoded.
+        """
+        return None
+
+
+    @classmethod
+    def select_mask(cls, dataset, selection, index=None):
         """
         Given a Dataset object and a dictionary with dimension keys and
         selection keys (i.e tuple ranges, slices, sets, lists or literals)
         return a boolean mask over the rows in the Dataset object that
-        have been selected.
+        have been selected. If an index slice is supplied the mask is
+        only computed over the rows within that slice.
         """
-        mask = np.ones(len(dataset), dtype=np.bool)
+        length = len(dataset)
+        if index is not None:
+            length = len(range(length)[index])
+        mask = np.ones(length, dtype=np.bool)
         for dim, k in selection.items():
             if isinstance(k, tuple):
                 k = slice(*k)
-            arr = cls.values(dataset, dim)
+            arr = cls.categorical(dataset, dim)
+            if arr is None:
+                arr = cls.values(dataset, dim)
+            if index is not None:
+                arr = arr[index]
             if isinstance(k, slice):
                 with warnings.catch_warnings():
                     warnings.filterwarnings('ignore', r'invalid value encountered')
@@ -298,6 +395,8 @@ class Interface(param.Parameterized):
                         mask &= k.start <= arr
                     if k.stop is not None:
                         mask &= arr < k.stop
+            elif isinstance(k, (set, list)) and isinstance(arr, util.CategoricalArray):
+                mask &= arr.isin(k)
             elif isinstance(k, (set, list)):
                 iter_slcs = []
                 for ik in k:
@@ -306,18 +405,260 @@ class Interface(param.Parameterized):
                         iter_slcs.append(arr == ik)
                 mask &= np.logical_or.reduce(iter_slcs)
             elif callable(k):
-                mask &= k(arr)
+                mask &= k(np.asarray(arr))
             else:
                 index_mask = arr == k
                 if dataset.ndims == 1 and np.sum(index_mask) == 0:
                     data_index = np.argmin(np.abs(arr - k))
-                    mask = np.zeros(len(dataset), dtype=np.bool)
+                    mask = np.zeros(length, dtype=np.bool)
                     mask[data_index] = True
                 else:
                     mask &= index_mask
         return mask
 
 
+    @classmethod
+    def statistics(cls, dataset):
+        """
+        Returns the statistics cache of the Dataset, which is shared
+        between clones of the same data and replaced by an empty cache
+        if the data of the Dataset no longer matches the data the
+        statistics were computed on.
+        """
+        stats = getattr(dataset, '_stats', None)
+        if stats is None or stats.data is not dataset.data:
+            stats = DataStatistics(dataset.data)
+            dataset._stats = stats
+        return stats
+
+
+    @classmethod
+    def statistic(cls, dataset, dim, stat, compute):
+        """
+        Looks up a statistic of the values along the supplied dimension
+        in the statistics cache of the Dataset, calling the supplied
+        compute function and recording the result if it is missing.
+        """
+        dim = dataset.get_dimension(dim, strict=True)
+        dim_stats = cls.statistics(dataset).setdefault(dim.name, {})
+        if stat not in dim_stats:
+            dim_stats[stat] = compute()
+        return dim_stats[stat]
+
+
+    @classmethod
+    def issorted(cls, dataset, dim):
+        """
+        Whether the values along the supplied dimension are sorted in
+        ascending order. The result is recorded in the statistics
+        cache of the Dataset.
+        """
+        def issorted():
+            arr = cls.values(dataset, dim)
+            if arr.dtype.kind not in 'iufM':
+                return False
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'invalid value encountered')
+                return bool(np.all(arr[1:] >= arr[:-1]))
+        return cls.statistic(dataset, dim, 'sorted', issorted)
+
+
+    @classmethod
+    def nancount(cls, dataset, dim):
+        """
+        Returns the number of missing values (NaN, NaT or None) along
+        the supplied dimension. The result is recorded in the
+        statistics cache of the Dataset.
+        """
+        def nancount():
+            arr = cls.values(dataset, dim)
+            if arr.dtype.kind in 'fc':
+                return int(np.isnan(arr).sum())
+            elif arr.dtype.kind == 'M':
+                return int(util.isnat(arr).sum())
+            elif arr.dtype.kind == 'O':
+                return sum(1 for v in arr if v is None or
+                           (isinstance(v, float) and np.isnan(v)))
+            return 0
+        return cls.statistic(dataset, dim, 'nancount', nancount)
+
+
+    @classmethod
+    def nunique(cls, dataset, dim):
+        """
+        Returns the number of unique values along the supplied
+        dimension, counting all missing values as a single value.
+        The result is recorded in the statistics cache of the Dataset.
+        """
+        def nunique():
+            return len(util.unique_array(cls.values(dataset, dim)))
+        return cls.statistic(dataset, dim, 'nunique', nunique)
+
+
+    @classmethod
+    def describe(cls, dataset, dimensions=None, quantiles=(0.25, 0.5, 0.75),
+                 chunksize=1000000):
+        """
+        Returns an OrderedDict of descriptive statistics for each of
+        the supplied dimensions (defaulting to all dimensions), which
+        are computed in a single pass over the data and recorded in
+        the statistics cache. The cached ranges and NaN counts are
+        seeded from the results. See util.describe_array for the
+        statistics computed on numeric and datetime values, other
+        values only report the count and NaN count.
+        """
+        if dimensions is None:
+            dimensions = dataset.dimensions()
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        key = ('describe', tuple(quantiles))
+        stats = cls.statistics(dataset)
+        missing = [d for d in dimensions if key not in stats.get(d.name, {})]
+        if missing:
+            summaries = cls._describe(dataset, missing, quantiles, chunksize)
+            for d, (summary, numeric) in zip(missing, summaries):
+                dim_stats = stats.setdefault(d.name, {})
+                dim_stats[key] = summary
+                dim_stats.setdefault('nancount', summary['nancount'])
+                if numeric:
+                    dim_stats.setdefault('range', (summary['min'], summary['max']))
+        return OrderedDict([(d.name, stats[d.name][key]) for d in dimensions])
+
+
+    @classmethod
+    def _describe(cls, dataset, dimensions, quantiles, chunksize):
+        """
+        Computes the descriptive statistics of the supplied dimensions
+        returning a list of tuples containing the summary and whether
+        the values are numeric, i.e. whether the summary contains the
+        range of the values.
+        """
+        summaries = []
+        for d in dimensions:
+            values = cls.values(dataset, d)
+            summary = util.describe_array(values, quantiles, chunksize)
+            numeric = summary is not None and values.dtype.kind in 'iuf'
+            if summary is None:
+                summary = OrderedDict([('count', len(values)),
+                                       ('nancount', cls.nancount(dataset, d))])
+            summaries.append((summary, numeric))
+        return summaries
+
+
+    @classmethod
+    def spatial_index(cls, dataset):
+        """
+        Returns a KD-tree over the finite points along the first two
+        key dimensions along with the row index of each point, or None
+        if scipy is not available. The index is built lazily and
+        recorded in the statistics cache of the Dataset.
+        """
+        xdim, ydim = dataset.kdims[:2]
+        def spatial_index():
+            try:
+                from scipy.spatial import cKDTree
+            except ImportError:
+                return None
+            points = np.column_stack([cls.values(dataset, xdim),
+                                      cls.values(dataset, ydim)]).astype('float')
+            rows = np.flatnonzero(np.isfinite(points).all(axis=1))
+            if not len(rows):
+                return None
+            return cKDTree(points[rows]), rows
+        return cls.statistic(dataset, xdim, ('spatial_index', ydim.name), spatial_index)
+
+
+    @classmethod
+    def closest_rows(cls, dataset, coords):
+        """
+        Returns the row index of the point closest to each of the
+        supplied coordinates along the first two key dimensions,
+        querying the spatial index or falling back to a linear scan.
+        """
+        coords = np.asarray(coords, dtype='float').reshape(-1, 2)
+        index = cls.spatial_index(dataset)
+        if index is not None:
+            tree, rows = index
+            return rows[tree.query(coords)[1]]
+        xs, ys = (np.asarray(cls.values(dataset, d), dtype='float')
+                  for d in dataset.kdims[:2])
+        return np.array([np.nanargmin((xs-x)**2+(ys-y)**2) for x, y in coords])
+
+
+    @classmethod
+    def sorted_slice(cls, dataset, dim, key):
+        """
+        Given a Dataset object, a dimension and a selection key returns
+        a slice of the selected rows if the dimension is sorted and the
+        key is a range or a scalar, using a binary search on the sorted
+        values. Returns None if the key cannot be expressed as a slice.
+        """
+        if isinstance(key, tuple):
+            key = slice(*key)
+        if isinstance(key, slice):
+            if key.step is not None:
+                return None
+            bounds = [key.start, key.stop]
+        elif util.isscalar(key) and key is not None:
+            bounds = [key]
+        else:
+            return None
+
+        dim = dataset.get_dimension(dim)
+        if dim is None or not cls.issorted(dataset, dim):
+            return None
+        arr = cls.values(dataset, dim)
+        if arr.dtype.kind == 'M':
+            valid = all(b is None or (isinstance(b, np.datetime64) and not util.isnat(b))
+                        for b in bounds)
+        else:
+            valid = all(b is None or (util.isnumeric(b) and util.isfinite(b))
+                        for b in bounds)
+        if not valid:
+            return None
+
+        if isinstance(key, slice):
+            start, stop = bounds
+            start = 0 if start is None else np.searchsorted(arr, start, 'left')
+            stop = len(arr) if stop is None else np.searchsorted(arr, stop, 'left')
+            return slice(start, max(start, stop))
+        start = np.searchsorted(arr, bounds[0], 'left')
+        stop = np.searchsorted(arr, bounds[0], 'right')
+        if start == stop and dataset.ndims == 1 and len(arr):
+            if arr.dtype.kind == 'M':
+                return None
+            start = int(util.closest_indices(arr, bounds[0]))
+            stop = start+1
+        return slice(start, stop)
+
+
+    @classmethod
+    def select_index(cls, dataset, selection):
+        """
+        Given a Dataset object and a dictionary with dimension keys and
+        selection keys returns an index of the selected rows. If one of
+        the selected dimensions is sorted the rows are narrowed down to
+        a slice using a binary search, which allows the selection to be
+        returned as a view. Any remaining selections are then applied
+        to the rows within that slice, otherwise falls back to
+        computing a boolean mask over all rows.
+        """
+        if (dataset.ndims == 1 and len(selection) > 1 and
+            any(util.isscalar(k) for k in selection.values())):
+            # Closest match semantics apply across all selected rows
+            return cls.select_mask(dataset, selection)
+        for dim, key in selection.items():
+            index = cls.sorted_slice(dataset, dim, key)
+            if index is not None:
+                break
+        else:
+            return cls.select_mask(dataset, selection)
+        remaining = {d: k for d, k in selection.items() if d != dim}
+        if not remaining:
+            return index
+        mask = cls.select_mask(dataset, remaining, index)
+        return index.start + np.flatnonzero(mask)
+
+
     @classmethod
     def indexed(cls, dataset, selection):
         """
@@ -393,6 +734,80 @@ class Interface(param.Parameterized):
         kdims = [kdim for kdim in dataset.kdims if kdim not in reduce_dims]
         return cls.aggregate(dataset, kdims, function, **kwargs)
 
+    @classmethod
+    def aggregate_many(cls, dataset, dimensions, reductions):
+        """
+        Applies several reductions grouped by the supplied key
+        dimensions, where each reduction is declared as a tuple of the
+        value dimension name, the function and the name of the output
+        column. The known reductions on numeric columns are computed
+        for all groups in a single vectorized pass, while any other
+        function is applied to each group in turn.
+
+        Returns an OrderedDict of the key and output columns and the
+        list of outputs which could not be computed.
+        """
+        if cls.gridded:
+            return cls._aggregate_each(dataset, dimensions, reductions)
+
+        kdims = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        keys = [cls.categorical(dataset, kd) for kd in kdims]
+        keys = [np.asarray(cls.values(dataset, kd)) if k is None else k
+                for k, kd in zip(keys, kdims)]
+        if keys:
+            codes, first = util.group_codes(keys)
+        else:
+            codes = np.zeros(cls.length(dataset), dtype=np.intp)
+            first = np.arange(min(len(codes), 1))
+        ngroups = len(first)
+
+        columns = OrderedDict((kd, np.asarray(k[first])) for kd, k in zip(kdims, keys))
+        indices, dropped = None, []
+        for vdim, function, name in reductions:
+            values = np.asarray(cls.values(dataset, vdim))
+            reduced = util.group_reduce(values, codes, ngroups, function)
+            if reduced is None:
+                if indices is None:
+                    sorting = np.argsort(codes, kind='mergesort')
+                    counts = np.bincount(codes, minlength=ngroups)
+                    indices = np.split(sorting, np.cumsum(counts)[:-1])
+                if isinstance(function, util.basestring):
+                    function = util.reductions[function]
+                try:
+                    if isinstance(function, np.ufunc):
+                        reduced = [function.reduce(values[inds]) for inds in indices]
+                    else:
+                        reduced = [function(values[inds]) for inds in indices]
+                except TypeError:
+                    dropped.append(name)
+                    continue
+            columns[name] = reduced
+        return columns, dropped
+
+    @classmethod
+    def _aggregate_each(cls, dataset, dimensions, reductions):
+        """
+        Implements aggregate_many by applying the regular aggregate
+        method separately for each reduction.
+        """
+        from . import Dataset
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        columns, dropped = OrderedDict(), []
+        for vdim, function, name in reductions:
+            if isinstance(function, util.basestring):
+                function = util.reductions[function]
+            vdim = dataset.get_dimension(vdim, strict=True)
+            subset = dataset.clone(vdims=[vdim], new_type=Dataset)
+            aggregated, failed = cls.aggregate(subset, dimensions, function)
+            if failed:
+                dropped.append(name)
+                continue
+            aggregated = subset.clone(aggregated, kdims=dimensions, vdims=[vdim])
+            for kd in dimensions:
+                columns[kd.name] = aggregated.dimension_values(kd)
+            columns[name] = aggregated.dimension_values(vdim)
+        return columns, dropped
+
     @classmethod
     def array(cls, dataset, dimensions):
         return Element.array(dataset, dimensions)
@@ -0,0 +1,176 @@
+from __future__ import absolute_import
+
+import numpy as np
+
+
+class QueryPlan(object):
+    """
+    A QueryPlan records the operations applied to a lazy Dataset
+    without evaluating them. Each operation is stored as a tuple of
+    the Dataset method name, the positional and the keyword arguments
+    and adding an operation returns a new QueryPlan, which allows
+    lazy Datasets to share their plans.
+
+    When the plan is executed the operations are optimized before
+    they are applied to the source Dataset: selections are pushed
+    below sorts, adjacent range selections are merged into a single
+    selection so that only one mask is computed and value dimensions
+    that are never used are projected away before any operation
+    copies the data.
+    """
+
+    # Operations which do not change the rows of the data and can
+    # therefore be swapped with selections applied after them
+    _row_preserving = ('sort',)
+
+    def __init__(self, source, operations=()):
+        self.source = source
+        self.operations = tuple(operations)
+
+
+    def __len__(self):
+        return len(self.operations)
+
+
+    def _add(self, method, *args, **kwargs):
+        return QueryPlan(self.source, self.operations+((method, args, kwargs),))
+
+
+    def select(self, **selection):
+        return self._add('select', **selection)
+
+
+    def sort(self, by, reverse=False):
+        return self._add('sort', by, reverse)
+
+
+    def reindex(self, kdims, vdims):
+        return self._add('reindex', kdims, vdims)
+
+
+    def aggregate(self, dimensions, function, **kwargs):
+        return self._add('aggregate', dimensions, function, **kwargs)
+
+
+    def iloc(self, index):
+        return self._add('iloc', index)
+
+
+    @classmethod
+    def merge_selections(cls, first, second):
+        """
+        Merges two selections applied one after the other into a
+        single selection, returning None if they cannot be merged.
+        Only range selections and lists of values are merged, the
+        ranges along a shared dimension being intersected, since
+        scalar selections may index a single value and boolean masks
+        refer to the rows of the data they are applied to.
+        """
+        for selection in (first, second):
+            for k, v in selection.items():
+                if k == 'selection_mask' or not isinstance(v, (tuple, slice, list, set)):
+                    return None
+                elif isinstance(v, tuple) and len(v) != 2:
+                    return None
+                elif isinstance(v, slice) and v.step is not None:
+                    return None
+
+        merged = dict(first)
+        for k, v in second.items():
+            if k not in merged:
+                merged[k] = v
+                continue
+            prev = merged[k]
+            if isinstance(prev, (list, set)) or isinstance(v, (list, set)):
+                return None
+            if isinstance(prev, slice):
+                prev = (prev.start, prev.stop)
+            if isinstance(v, slice):
+                v = (v.start, v.stop)
+            try:
+                starts = [s for s in (prev[0], v[0]) if s is not None]
+                stops = [s for s in (prev[1], v[1]) if s is not None]
+                merged[k] = (max(starts) if starts else None,
+                             min(stops) if stops else None)
+            except TypeError:
+                return None
+        return merged
+
+
+    def optimize(self):
+        """
+        Returns the list of operations to apply, with selections
+        pushed below row preserving operations and adjacent
+        selections merged.
+        """
+        operations = []
+        for op in self.operations:
+            method, _, kwargs = op
+            if method != 'select':
+                operations.append(op)
+                continue
+            i = len(operations)
+            if 'selection_mask' not in kwargs:
+                while i and operations[i-1][0] in self._row_preserving:
+                    i -= 1
+            if i and operations[i-1][0] == 'select':
+                merged = self.merge_selections(operations[i-1][2], kwargs)
+                if merged is not None:
+                    operations[i-1] = ('select', (), merged)
+                    continue
+            operations.insert(i, op)
+        return operations
+
+
+    def required_dimensions(self, operations, dimensions):
+        """
+        Returns the names of the dimensions of the source which are
+        required to apply the operations and return the supplied
+        output dimensions or None if all dimensions are required.
+        """
+        source = self.source
+        required = set(dimensions)
+        for method, args, kwargs in operations:
+            if method == 'select':
+                dims = [k for k in kwargs if k != 'selection_mask']
+            elif method in ('sort', 'aggregate'):
+                dims = args[0]
+            elif method == 'reindex':
+                dims = args[0] + args[1]
+            elif method == 'iloc':
+                cols = args[0][1]
+                if isinstance(cols, slice) and cols == slice(None):
+                    continue
+                elif not isinstance(cols, (list, tuple, slice)):
+                    cols = [cols]
+                if isinstance(cols, slice) or any(isinstance(c, (int, np.integer))
+                                                  for c in cols):
+                    # Integer column indices refer to the dimension order
+                    return None
+                dims = cols
+            for d in dims:
+                dim = source.get_dimension(d)
+                if dim is not None:
+                    required.add(dim.name)
+        return required
+
+
+    def execute(self, dimensions):
+        """
+        Applies the optimized operations to the source Dataset,
+        returning a Dataset containing the supplied dimensions.
+        """
+        from . import Dataset
+        operations = self.optimize()
+        required = self.required_dimensions(operations, dimensions)
+        result = self.source.clone(new_type=Dataset)
+        if required is not None:
+            vdims = [vd for vd in result.vdims if vd.name in required]
+            if len(vdims) < len(result.vdims):
+                result = result.reindex(vdims=vdims)
+        for method, args, kwargs in operations:
+            if method == 'iloc':
+                result = result.iloc[args[0]]
+            else:
+                result = getattr(result, method)(*args, **kwargs)
+        return result
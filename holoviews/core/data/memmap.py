@@ -0,0 +1,163 @@
+from __future__ import absolute_import
+
+import os
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from .dictionary import DictInterface
+from .interface import Interface
+from ..util import isscalar, isnat, basestring
+
+
+class MemmapInterface(DictInterface):
+    """
+    The MemmapInterface allows a Dataset to wrap columns stored on
+    disk and opened as memory-mapped arrays, making it possible to
+    work with datasets far larger than the available memory. The data
+    may be supplied as a path to a directory of .npy files (one per
+    column, named after the column), a path to a .npy file holding a
+    structured array, a structured np.memmap or a dictionary of 1D
+    np.memmap columns. Since any string may name a directory, a
+    directory is only loaded if the memmap datatype is explicitly
+    requested.
+
+    The columns are held in a dictionary, just like the
+    DictInterface, but the memory-mapped arrays are never copied:
+    dimension_values returns views of the memory map, slicing with
+    iloc and selections on sorted columns return memmap views, while
+    the range and sortedness of each column are computed in chunks
+    of ``chunk_size`` rows so only a single chunk is ever loaded
+    into memory.
+    """
+
+    types = ()
+
+    datatype = 'memmap'
+
+    # Number of rows loaded at a time when computing reductions
+    chunk_size = 2**20
+
+    # Mode used to open memory-mapped .npy files
+    mmap_mode = 'r'
+
+    # Encoding string columns would load them into memory, even if
+    # encoding is enabled on the DictInterface
+    categorical_length = None
+
+    @classmethod
+    def applies(cls, obj):
+        if isinstance(obj, np.memmap):
+            return bool(obj.dtype.names)
+        elif isinstance(obj, basestring):
+            return obj.endswith('.npy')
+        return cls.memmap_columns(obj)
+
+    @classmethod
+    def memmap_columns(cls, obj):
+        "Whether the object is a dictionary of 1D memory-mapped columns"
+        return (isinstance(obj, dict) and len(obj) > 0 and
+                all(isinstance(v, np.memmap) and v.ndim == 1
+                    for v in obj.values()))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Opens a directory of .npy files or a single .npy file
+        containing a structured array as memory-mapped arrays.
+        """
+        if not os.path.isdir(path):
+            return np.load(path, mmap_mode=cls.mmap_mode)
+        files = sorted(f for f in os.listdir(path) if f.endswith('.npy'))
+        return OrderedDict((os.path.splitext(f)[0],
+                            np.load(os.path.join(path, f), mmap_mode=cls.mmap_mode))
+                           for f in files)
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        names = None
+        if isinstance(data, basestring):
+            data = cls.load(data)
+        if isinstance(data, np.ndarray) and data.dtype.names:
+            data = OrderedDict((name, data[name]) for name in data.dtype.names)
+            names = list(data)
+        elif cls.memmap_columns(data):
+            names = list(data)
+
+        # Infer the dimensions from the column names
+        if names and kdims is None and vdims is None:
+            kdims = names[:len(eltype.kdims)]
+            vdims = [n for n in names if n not in kdims]
+        elif names and vdims is None:
+            vdims = [n for n in names if n not in kdims]
+
+        memmaps = {}
+        if isinstance(data, dict):
+            memmaps = {k: v for k, v in data.items()
+                       if isinstance(v, np.memmap) and v.ndim == 1}
+        data, dims, extra = super(MemmapInterface, cls).init(eltype, data, kdims, vdims)
+        for k, v in memmaps.items():
+            if k in data:
+                data[k] = v
+        return data, dims, extra
+
+
+    @classmethod
+    def chunks(cls, column):
+        """
+        Iterates over the supplied column in chunks of chunk_size
+        rows, yielding plain ndarray views of each chunk.
+        """
+        for i in range(0, len(column), cls.chunk_size):
+            yield np.asarray(column[i:i+cls.chunk_size])
+
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        dim = dataset.get_dimension(dimension, strict=True)
+        column = dataset.data[dim.name]
+        if (isscalar(column) or not isinstance(column, np.ndarray) or
+            column.dtype.kind not in 'iufM'):
+            return super(MemmapInterface, cls).range(dataset, dimension)
+
+        lower, upper = None, None
+        for chunk in cls.chunks(column):
+            if chunk.dtype.kind == 'M':
+                chunk = chunk[~isnat(chunk)]
+                if not len(chunk):
+                    continue
+                cmin, cmax = chunk.min(), chunk.max()
+            else:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                    cmin, cmax = np.nanmin(chunk), np.nanmax(chunk)
+                if np.isnan(cmin):
+                    continue
+            lower = cmin if lower is None else min(lower, cmin)
+            upper = cmax if upper is None else max(upper, cmax)
+        if lower is None:
+            return np.NaN, np.NaN
+        return lower, upper
+
+
+    @classmethod
+    def issorted(cls, dataset, dim):
+        def issorted():
+            column = cls.values(dataset, dim)
+            if column.dtype.kind not in 'iufM':
+                return False
+            previous = None
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'invalid value encountered')
+                for chunk in cls.chunks(column):
+                    if previous is not None and not chunk[0] >= previous:
+                        return False
+                    elif not np.all(chunk[1:] >= chunk[:-1]):
+                        return False
+                    previous = chunk[-1]
+            return True
+        return cls.statistic(dataset, dim, 'sorted', issorted)
+
+
+Interface.register(MemmapInterface)
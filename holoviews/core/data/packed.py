@@ -0,0 +1,493 @@
+from __future__ import absolute_import
+
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import NdMapping, item_check, sorted_context
+from .interface import Interface, DataError
+from .multipath import MultiInterface
+
+
+class PackedData(object):
+    """
+    PackedData is a ragged-array representation of a collection of
+    geometries. The coordinates and other values varying along each
+    geometry are stored in contiguous columns holding the vertices of
+    all geometries one after the other, while the offsets array of
+    length N+1 marks where each of the N geometries starts and ends.
+    Values which are constant along each geometry are stored once per
+    geometry in the scalars.
+    """
+
+    def __init__(self, columns, offsets, scalars=None):
+        self.columns = OrderedDict(columns)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.scalars = OrderedDict(scalars or [])
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    @property
+    def lengths(self):
+        "The number of vertices in each geometry."
+        return np.diff(self.offsets)
+
+    def take(self, index):
+        """
+        Returns a new PackedData containing the geometries selected
+        by the supplied index, which may be an integer, a slice, a
+        list of integers or a boolean mask. Contiguous slices return
+        views of the columns.
+        """
+        n = len(self)
+        if isinstance(index, slice) and index.step in (None, 1):
+            start, stop, _ = index.indices(n)
+            stop = max(start, stop)
+            lower, upper = self.offsets[start], self.offsets[stop]
+            columns = [(k, v[lower:upper]) for k, v in self.columns.items()]
+            scalars = [(k, v[start:stop]) for k, v in self.scalars.items()]
+            return PackedData(columns, self.offsets[start:stop+1]-lower, scalars)
+
+        index = np.atleast_1d(np.arange(n)[index])
+        lengths = self.lengths[index]
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        rows = (np.repeat(self.offsets[:-1][index]-offsets[:-1], lengths) +
+                np.arange(offsets[-1]))
+        columns = [(k, v[rows]) for k, v in self.columns.items()]
+        scalars = [(k, v[index]) for k, v in self.scalars.items()]
+        return PackedData(columns, offsets, scalars)
+
+    def expanded(self, name):
+        """
+        Returns the values of the named column for all vertices,
+        repeating the scalar values along each geometry.
+        """
+        if name in self.scalars:
+            return np.repeat(self.scalars[name], self.lengths)
+        return self.columns[name]
+
+    def geometries(self):
+        """
+        Returns a list of dictionaries for each geometry, containing
+        views of the columns and the scalar values.
+        """
+        geometries = []
+        bounds = zip(self.offsets[:-1], self.offsets[1:])
+        for i, (start, end) in enumerate(bounds):
+            geometry = OrderedDict((k, v[start:end]) for k, v in self.columns.items())
+            for k, v in self.scalars.items():
+                geometry[k] = v[i]
+            geometries.append(geometry)
+        return geometries
+
+
+class PackedInterface(Interface):
+    """
+    PackedInterface stores a collection of paths or polygons using
+    the PackedData ragged-array representation, holding the vertices
+    of all geometries in a single contiguous buffer per dimension
+    alongside an array of offsets. Unlike the MultiInterface, which
+    wraps a list of tabular datasets, operations are computed in a
+    single vectorized pass over the buffers rather than by iterating
+    over the geometries, while splitting the data returns views into
+    the buffers.
+
+    The interface may be initialized with a PackedData object or with
+    a list of tabular data in any of the formats supported by the
+    MultiInterface. Dimensions which are constant along each geometry
+    are stored once per geometry. Polygons with holes are not
+    supported.
+    """
+
+    types = (PackedData,)
+
+    datatype = 'packed'
+
+    multi = True
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        dims = {'kdims': eltype.kdims if kdims is None else kdims,
+                'vdims': eltype.vdims if vdims is None else vdims}
+        if isinstance(data, PackedData):
+            return data, dims, {}
+        elif not isinstance(data, list):
+            raise ValueError('PackedInterface data must be PackedData '
+                             'or a list of tabular data types.')
+
+        from holoviews.element import Polygons
+        geometries, lengths = [], []
+        for d in data:
+            d, _, dims, _ = Interface.initialize(eltype, d, kdims, vdims,
+                                                 datatype=['dictionary'])
+            if Polygons._hole_key in d:
+                raise ValueError('PackedInterface does not support holes.')
+            lens = [len(v) for v in d.values() if not util.isscalar(v)]
+            lengths.append(max(lens) if lens else 1)
+            geometries.append(d)
+
+        columns, scalars = OrderedDict(), OrderedDict()
+        offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+        for dim in dims['kdims']+dims['vdims']:
+            name = dimension_name(dim)
+            values = [g[name] for g in geometries]
+            if all(util.isscalar(v) for v in values):
+                scalars[name] = np.array(values)
+            else:
+                columns[name] = np.concatenate([
+                    np.full(l, v) if util.isscalar(v) else np.asarray(v)
+                    for v, l in zip(values, lengths)]) if values else np.array([])
+        return PackedData(columns, offsets, scalars), dims, {}
+
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        data = dataset.data
+        dims = 'all' if vdims else 'key'
+        not_found = [d for d in dataset.dimensions(dims, label='name')
+                     if d not in data.columns and d not in data.scalars]
+        if not_found:
+            raise DataError('Following columns specified as dimensions '
+                            'but not found in data: %s' % not_found, cls)
+        nvertices, ngeometries = data.offsets[-1], len(data)
+        for k, v in data.columns.items():
+            if len(v) != nvertices:
+                raise DataError('Column %s has %d values but the offsets '
+                                'declare %d vertices.' % (k, len(v), nvertices), cls)
+        for k, v in data.scalars.items():
+            if len(v) != ngeometries:
+                raise DataError('Scalar column %s has %d values but the offsets '
+                                'declare %d geometries.' % (k, len(v), ngeometries), cls)
+
+
+    @classmethod
+    def _column(cls, dataset, dim):
+        data = dataset.data
+        name = dataset.get_dimension(dim, strict=True).name
+        if name in data.scalars:
+            return data.scalars[name]
+        return data.columns[name]
+
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        return cls.dtype(dataset, dim).type
+
+
+    @classmethod
+    def dtype(cls, dataset, dimension):
+        if not len(dataset.data):
+            return np.dtype('float')
+        return cls._column(dataset, dimension).dtype
+
+
+    @classmethod
+    def range(cls, dataset, dim):
+        if not len(dataset.data):
+            return (None, None)
+
+        # Backward compatibility for Contours/Polygons level
+        level = getattr(dataset, 'level', None)
+        dim = dataset.get_dimension(dim)
+        if level is not None and dim is dataset.vdims[0]:
+            return (level, level)
+
+        column = cls._column(dataset, dim)
+        if not len(column):
+            return np.NaN, np.NaN
+        elif column.dtype.kind == 'M':
+            column = column[~util.isnat(column)]
+            if not len(column):
+                return np.NaN, np.NaN
+            return column.min(), column.max()
+        try:
+            assert column.dtype.kind not in 'SUO'
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+                return (np.nanmin(column), np.nanmax(column))
+        except (AssertionError, TypeError):
+            column = [v for v in util.python2sort(column) if v is not None]
+            if not len(column):
+                return np.NaN, np.NaN
+            return column[0], column[-1]
+
+
+    @classmethod
+    def has_holes(cls, dataset):
+        return False
+
+
+    @classmethod
+    def holes(cls, dataset):
+        """
+        Returns an empty list of holes for each sub-geometry, where
+        sub-geometries within a geometry are separated by NaNs.
+        """
+        data = dataset.data
+        if not len(data):
+            return []
+        coords = data.expanded(dataset.kdims[0].name)
+        nans = np.concatenate([[0], np.cumsum(np.isnan(coords.astype('float')))])
+        splits = nans[data.offsets[1:]] - nans[data.offsets[:-1]]
+        return [[[]]*(n+1) for n in splits]
+
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        """
+        Tests if dimension is scalar in each geometry.
+        """
+        data = dataset.data
+        name = dataset.get_dimension(dim, strict=True).name
+        if name in data.scalars:
+            return True
+        column = data.columns[name]
+        if len(column) < 2:
+            return True
+        same = column[1:] == column[:-1]
+        if column.dtype.kind == 'f':
+            nans = np.isnan(column)
+            same |= nans[1:] & nans[:-1]
+        boundaries = data.offsets[1:-1]
+        boundaries = boundaries[(boundaries > 0) & (boundaries < len(column))]
+        same[boundaries-1] = True
+        return bool(same.all())
+
+
+    @classmethod
+    def _mask(cls, dataset, columns, selection):
+        """
+        Computes a boolean mask for a selection along the supplied
+        columns by applying the regular tabular selection logic.
+        """
+        from . import Dataset
+        dims = [dataset.get_dimension(k, strict=True) for k in selection]
+        ds = Dataset(OrderedDict((d.name, columns[d.name]) for d in dims),
+                     kdims=[], vdims=dims, datatype=['dictionary'])
+        return ds.interface.select_mask(ds, selection)
+
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies the selection to the vertices of all geometries,
+        returning empty geometries where no vertices were selected.
+        """
+        data = dataset.data
+        if not len(data) or not selection:
+            return data
+        names = {k: dataset.get_dimension(k, strict=True).name for k in selection}
+        vertex_sel = {k: v for k, v in selection.items() if names[k] in data.columns}
+        scalar_sel = {k: v for k, v in selection.items() if names[k] in data.scalars}
+        mask = np.ones(data.offsets[-1], dtype=bool)
+        if vertex_sel:
+            mask &= cls._mask(dataset, data.columns, vertex_sel)
+        if scalar_sel:
+            geometry_mask = cls._mask(dataset, data.scalars, scalar_sel)
+            mask &= np.repeat(geometry_mask, data.lengths)
+        counts = np.concatenate([[0], np.cumsum(mask)])
+        columns = [(k, v[mask]) for k, v in data.columns.items()]
+        return PackedData(columns, counts[data.offsets], data.scalars)
+
+
+    @classmethod
+    def select_paths(cls, dataset, selection):
+        """
+        Allows selecting paths with usual NumPy slicing index.
+        """
+        return dataset.data.take(selection)
+
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        raise NotImplementedError('Aggregation currently not implemented')
+
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d, strict=True) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        raw = group_type == 'raw'
+        if not raw and issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        for d in dimensions:
+            if not cls.isscalar(dataset, d):
+                raise ValueError('PackedInterface can only apply groupby '
+                                 'on scalar dimensions, %s dimension '
+                                 'is not scalar' % d)
+
+        # Group the geometries by the unique combinations of values
+        values = [cls.values(dataset, d, False) for d in dimensions]
+        keys, indices = util.group_indices(values)
+        grouped_data = []
+        for unique_key, index in zip(keys, indices):
+            selection = dataset.data.take(index)
+            if raw:
+                group_data = selection.geometries()
+            else:
+                group_data = group_type(selection, **group_kwargs)
+            grouped_data.append((unique_key, group_data))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        raise NotImplementedError('Sampling operation on subpaths not supported')
+
+
+    @classmethod
+    def shape(cls, dataset):
+        """
+        Returns the shape of all geometries, making it appear like a
+        single array of concatenated geometries separated by NaN values.
+        """
+        return (cls.length(dataset), len(dataset.dimensions()))
+
+
+    @classmethod
+    def length(cls, dataset):
+        """
+        Returns the length of the packed dataset making it appear
+        like a single array of concatenated geometries separated by
+        NaN values.
+        """
+        data = dataset.data
+        if not len(data):
+            return 0
+        # Separators are only inserted between non-empty geometries
+        nonempty = np.count_nonzero(data.lengths)
+        return int(data.offsets[-1])+max(nonempty-1, 0)
+
+
+    @classmethod
+    def nonzero(cls, dataset):
+        return bool(len(dataset.data))
+
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        data = dataset.data
+        columns = [(dimensions[k].name if k in dimensions else k, v)
+                   for k, v in data.columns.items()]
+        scalars = [(dimensions[k].name if k in dimensions else k, v)
+                   for k, v in data.scalars.items()]
+        return PackedData(columns, data.offsets, scalars)
+
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True, compute=True):
+        """
+        Returns a single array of all geometries separated by NaN
+        values. If expanded keyword is False the scalar values of each
+        geometry or the unique values along each geometry are returned.
+        """
+        data = dataset.data
+        if not len(data):
+            return np.array([])
+        name = dataset.get_dimension(dimension, strict=True).name
+        if not expanded:
+            if name in data.scalars:
+                return data.scalars[name]
+            column = data.columns[name]
+            if not len(column):
+                return column
+            # Find the first occurrence of each value in each geometry
+            geometry = np.repeat(np.arange(len(data)), data.lengths)
+            order = np.lexsort((column, geometry))
+            first = np.ones(len(order), dtype=bool)
+            first[1:] = ((geometry[order][1:] != geometry[order][:-1]) |
+                         (column[order][1:] != column[order][:-1]))
+            return column[np.sort(order[first])]
+
+        column = data.expanded(name)
+        nonempty = np.flatnonzero(data.lengths)
+        if len(nonempty) < 2:
+            return column
+        if column.dtype.kind in 'iub':
+            column, separator = column.astype('float'), np.NaN
+        elif column.dtype.kind in 'Mm':
+            separator = np.array('NaT', dtype=column.dtype)
+        elif column.dtype.kind in 'fc':
+            separator = np.NaN
+        else:
+            column, separator = column.astype('object'), np.NaN
+        return np.insert(column, data.offsets[1:][nonempty[:-1]], separator)
+
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        """
+        Splits a packed Dataset into regular Datasets or into arrays,
+        dataframes or dictionaries of columns. The columns of each
+        geometry are views into the packed buffers, computed with a
+        single np.split per dimension.
+        """
+        data = dataset.data
+        if start is not None or end is not None:
+            data = data.take(slice(start, end))
+        if datatype is None:
+            return [dataset.clone(d, datatype=MultiInterface.subtypes)
+                    for d in data.geometries()]
+        elif not len(data):
+            return []
+
+        dimensions = kwargs.get('dimensions')
+        if datatype == 'columns' and dimensions is None:
+            return data.geometries()
+        elif dimensions is None:
+            dimensions = dataset.dimensions()
+        names = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+        splits = data.offsets[1:-1]
+        if datatype == 'array':
+            array = np.column_stack([data.expanded(n) for n in names])
+            return np.split(array, splits)
+        elif datatype not in ('columns', 'dataframe'):
+            raise ValueError("%s datatype not support" % datatype)
+
+        columns = zip(*(np.split(data.expanded(n), splits) for n in names))
+        objs = [OrderedDict(zip(names, cols)) for cols in columns]
+        if datatype == 'dataframe':
+            import pandas as pd
+            objs = [pd.DataFrame(obj, columns=names) for obj in objs]
+        return objs
+
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        n = len(data)
+        name = dimension_name(dimension)
+        columns, scalars = OrderedDict(data.columns), OrderedDict(data.scalars)
+        if values is None or util.isscalar(values):
+            scalars[name] = np.array([values]*n)
+        elif not len(values) == n:
+            raise ValueError('Added dimension values must be scalar or '
+                             'match the length of the data.')
+        elif all(util.isscalar(v) for v in values):
+            scalars[name] = np.array(values)
+        else:
+            columns[name] = np.concatenate([
+                np.full(l, v) if util.isscalar(v) else np.asarray(v)
+                for v, l in zip(values, data.lengths)])
+        return PackedData(columns, data.offsets, scalars)
+
+
+
+Interface.register(PackedInterface)
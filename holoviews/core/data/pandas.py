@@ -94,7 +94,9 @@ class PandasInterface(Interface):
             columns = [dimension_name(d) for d in kdims+vdims]
 
             if isinstance(data, dict) and all(c in data for c in columns):
-                data = cyODict(((d, data[d]) for d in columns))
+                data = cyODict(((d, pd.Categorical.from_codes(data[d].codes, data[d].categories)
+                                 if isinstance(data[d], util.CategoricalArray) else data[d])
+                                for d in columns))
             elif isinstance(data, list) and len(data) == 0:
                 data = {c: np.array([]) for c in columns}
             elif isinstance(data, (list, dict)) and data in ([], {}):
@@ -168,14 +170,15 @@ class PandasInterface(Interface):
 
     @classmethod
     def concat(cls, datasets, dimensions, vdims):
-        dataframes = []
-        for key, ds in datasets:
-            data = ds.data.copy()
-            for d, k in zip(dimensions, key):
-                data[d.name] = k
-            dataframes.append(data)
+        # Concatenate once and add key columns instead of copying each frame
         kwargs = dict(sort=False) if util.pandas_version >= '0.23.0' else {}
-        return pd.concat(dataframes, **kwargs)
+        data = pd.concat([ds.data for _, ds in datasets], **kwargs)
+        lengths = [len(ds.data) for _, ds in datasets]
+        for i, d in enumerate(dimensions):
+            # Let pandas infer the dtype, e.g. datetime64 for Timestamps
+            keys = pd.Index([key[i] for key, _ in datasets])
+            data[d.name] = keys.repeat(lengths)
+        return data
 
 
     @classmethod
@@ -265,7 +268,7 @@ class PandasInterface(Interface):
     def select(cls, dataset, selection_mask=None, **selection):
         df = dataset.data
         if selection_mask is None:
-            selection_mask = cls.select_mask(dataset, selection)
+            selection_mask = cls.select_index(dataset, selection)
         indexed = cls.indexed(dataset, selection)
         df = df.iloc[selection_mask]
         if indexed and len(df) == 1 and len(dataset.vdims) == 1:
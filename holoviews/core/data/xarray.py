@@ -207,7 +207,10 @@ class XArrayInterface(GridInterface):
                 dmin, dmax = np.nanmin(data), np.nanmax(data)
         else:
             data = dataset.data[dim]
-            if len(data):
+            drange = cls.dask_ranges(dataset, dim)
+            if drange is not None:
+                dmin, dmax = drange
+            elif len(data):
                 dmin, dmax = data.min().data, data.max().data
             else:
                 dmin, dmax = np.NaN, np.NaN
@@ -321,8 +324,9 @@ class XArrayInterface(GridInterface):
                                     virtual_coords=virtual_coords)
             return data.T.flatten() if flat else data
         elif expanded:
-            data = cls.coords(dataset, dim.name, expanded=True)
-            return data.T.flatten() if flat else data
+            if flat:
+                return cls.expanded_values(dataset, dim)
+            return cls.coords(dataset, dim.name, expanded=True)
         else:
             return cls.coords(dataset, dim.name, ordered=True)
 
@@ -424,7 +428,7 @@ class XArrayInterface(GridInterface):
 
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
-        validated = {}
+        validated, sliced = {}, {}
         for k, v in selection.items():
             dim = dataset.get_dimension(k, strict=True)
             if cls.irregular(dataset, dim):
@@ -432,7 +436,13 @@ class XArrayInterface(GridInterface):
             dim = dim.name
             if isinstance(v, slice):
                 v = (v.start, v.stop)
-            if isinstance(v, set):
+            slc = None
+            if isinstance(v, tuple) and dim in dataset.data.dims:
+                # Slice monotonic coordinates by integer index
+                slc = cls.slice_index(dataset.data[dim].values, v)
+            if slc is not None:
+                sliced[dim] = slc
+            elif isinstance(v, set):
                 validated[dim] = list(v)
             elif isinstance(v, tuple):
                 dim_vals = dataset.data[k].values
@@ -446,7 +456,11 @@ class XArrayInterface(GridInterface):
                 validated[dim] = v(dataset[k])
             else:
                 validated[dim] = v
-        data = dataset.data.sel(**validated)
+        data = dataset.data
+        if sliced:
+            data = data.isel(**sliced)
+        if validated:
+            data = data.sel(**validated)
 
         # Restore constant dimensions
         indexed = cls.indexed(dataset, selection)
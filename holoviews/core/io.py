@@ -15,6 +15,7 @@ Archives: A collection of HoloViews objects that are first collected
 from __future__ import absolute_import
 
 import re, os, time, string, zipfile, tarfile, shutil, itertools, pickle
+import tempfile, zlib
 from collections import defaultdict
 
 from io import BytesIO
@@ -467,6 +468,172 @@ class Unpickler(Importer):
 
 
 
+class DiskCache(param.Parameterized):
+    """
+    A DiskCache persists objects in a directory on disk, making it
+    possible to share expensive results, e.g. the return values of
+    DynamicMap callbacks, between sessions and processes on the same
+    host. Entries are looked up by a string key, usually a stable
+    hash (see util.stable_hash), and are stored as zlib compressed
+    pickles using Store.dumps so that options are preserved.
+
+    Entries are written to a temporary file which is atomically moved
+    into place, ensuring that concurrent readers never observe
+    partially written entries. Once the total size of the entries
+    exceeds max_bytes the least recently used entries are deleted,
+    where the modification time of an entry is updated whenever it is
+    read.
+    """
+
+    path = param.String(default=None, doc="""
+        The directory the entries are stored in, defaults to a
+        holoviews directory in the cache directory of the user.
+        Since entries are unpickled when loaded, the directory must
+        be owned by the current user.""")
+
+    max_bytes = param.Integer(default=2**30, bounds=(0, None), allow_None=True, doc="""
+        The maximum total size of the entries on disk in bytes. If
+        None the size of the cache is unbounded.""")
+
+    compression = param.Integer(default=1, bounds=(0, 9), doc="""
+        The zlib compression level, trading off the size of the
+        entries on disk against the time taken to write them.""")
+
+    protocol = param.Integer(default=pickle.HIGHEST_PROTOCOL, doc="""
+        The pickling protocol used to serialize the entries.""")
+
+    file_ext = 'hvc'
+
+    def __init__(self, **params):
+        super(DiskCache, self).__init__(**params)
+        if self.path is None:
+            self.path = self.default_path()
+        if not os.path.isdir(self.path):
+            try:
+                os.makedirs(self.path, 0o700)
+            except OSError:
+                # Directory may have been created by another process
+                if not os.path.isdir(self.path):
+                    raise
+        # Loading entries written by another user could execute
+        # arbitrary code when they are unpickled
+        if hasattr(os, 'getuid') and os.stat(self.path).st_uid != os.getuid():
+            raise OSError('DiskCache directory %r is owned by another user, '
+                          'refusing to load entries from it.' % self.path)
+
+    @classmethod
+    def default_path(cls):
+        "Returns the per-user default cache directory"
+        if os.name == 'nt':
+            root = os.environ.get('LOCALAPPDATA', tempfile.gettempdir())
+        else:
+            root = os.environ.get('XDG_CACHE_HOME', os.path.join('~', '.cache'))
+        return os.path.join(os.path.expanduser(root), 'holoviews')
+
+    def _filename(self, key):
+        return os.path.join(self.path, '%s.%s' % (key, self.file_ext))
+
+    def _entries(self):
+        "Returns the (mtime, size, filename) of all entries on disk"
+        entries = []
+        for name in os.listdir(self.path):
+            if not name.endswith('.'+self.file_ext):
+                continue
+            filename = os.path.join(self.path, name)
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, filename))
+        return entries
+
+    def __contains__(self, key):
+        return os.path.isfile(self._filename(key))
+
+    def __len__(self):
+        return len(self._entries())
+
+    @property
+    def nbytes(self):
+        "The total size of the entries on disk in bytes"
+        return sum(size for _, size, _ in self._entries())
+
+    def get(self, key, default=None):
+        """
+        Returns the object stored under the supplied key, or the
+        default if there is no such entry or it cannot be loaded.
+        """
+        filename = self._filename(key)
+        try:
+            with open(filename, 'rb') as f:
+                data = f.read()
+        except (IOError, OSError):
+            return default
+        try:
+            value = Store.loads(zlib.decompress(data))
+        except Exception as e:
+            self.param.warning('Could not load cache entry %r, '
+                               'discarding it: %s' % (key, e))
+            self._remove(filename)
+            return default
+        try:
+            os.utime(filename, None)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key, value):
+        """
+        Stores the supplied object under the key, evicting the least
+        recently used entries if the cache exceeds max_bytes. Objects
+        which cannot be pickled are not stored.
+        """
+        try:
+            data = zlib.compress(Store.dumps(value, protocol=self.protocol),
+                                 self.compression)
+        except Exception as e:
+            Store.save_option_state = False
+            self.param.warning('Could not store cache entry %r: %s' % (key, e))
+            return
+        fd, tmp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            getattr(os, 'replace', os.rename)(tmp, self._filename(key))
+        except (IOError, OSError) as e:
+            self._remove(tmp)
+            self.param.warning('Could not store cache entry %r: %s' % (key, e))
+            return
+        self.evict()
+
+    def evict(self):
+        """
+        Deletes the least recently used entries until the total size
+        of the entries is within max_bytes.
+        """
+        if self.max_bytes is None:
+            return
+        entries = sorted(self._entries())
+        nbytes = sum(size for _, size, _ in entries)
+        for _, size, filename in entries[:-1]:
+            if nbytes <= self.max_bytes:
+                break
+            self._remove(filename)
+            nbytes -= size
+
+    def clear(self):
+        "Deletes all entries of the cache."
+        for _, _, filename in self._entries():
+            self._remove(filename)
+
+    def _remove(self, filename):
+        try:
+            os.remove(filename)
+        except OSError:
+            pass
+
+
+
 class Archive(param.Parameterized):
     """
     An Archive is a means to collect and store a collection of
@@ -892,16 +892,22 @@ class UniformNdMapping(NdMapping):
                     names += list(df.index.names)
                 df = df.set_index(indexes)
                 df.index.names = names
-            else:
-                for dim, val in key_dims:
-                    dimn = 1
-                    while dim in df:
-                        dim = dim+'_%d' % dimn
-                        if dim in df:
-                            dimn += 1
-                    df.insert(0, dim, val)
             dframes.append(df)
-        return pd.concat(dframes)
+        if multi_index or not dframes:
+            return pd.concat(dframes)
+
+        # Insert the key columns once, repeating each key for its frame
+        df = pd.concat(dframes)
+        lengths = [len(frame) for frame in dframes]
+        for d, i in inds:
+            dim, dimn = d.name, 1
+            while dim in df:
+                dim = dim+'_%d' % dimn
+                if dim in df:
+                    dimn += 1
+            keys = pd.Index([key[i] for key in self.data.keys()])
+            df.insert(0, dim, keys.repeat(lengths))
+        return df
 
 
     @property
@@ -1,8 +1,9 @@
 import itertools
+import threading
 import types
 import inspect
 
-from numbers import Number
+from numbers import Number, Integral
 from itertools import groupby
 from functools import partial
 from collections import defaultdict
@@ -587,6 +588,28 @@ class HoloMap(UniformNdMapping, Overlayable):
                 return histmaps[0]
 
 
+class CallbackPending(Exception):
+    """
+    Raised when the coroutine returned by a Callable was scheduled on
+    the running event loop instead of being run to completion. The
+    future attribute holds the scheduled task, which completes once
+    the return value is available.
+    """
+
+    def __init__(self, future):
+        super(CallbackPending, self).__init__('Callback result is pending')
+        self.future = future
+
+
+
+class CallbackSuperseded(Exception):
+    """
+    Raised in place of calling the function wrapped by a Callable if
+    the call was superseded by a newer call before it started.
+    """
+
+
+
 class Callable(param.Parameterized):
     """
     Callable allows wrapping callbacks on one or more DynamicMaps
@@ -596,11 +619,26 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
-    function and the state of all streams on its inputs, to avoid
-    calling the function unnecessarily. Note that because memoization
-    includes the streams found on the inputs it may be disabled if the
-    stream requires it and is triggering.
+    memoize the last memoize_size returned values based on the
+    arguments to the function and the state of all streams on its
+    inputs, to avoid calling the function unnecessarily. Note that
+    because memoization includes the streams found on the inputs it
+    may be disabled if the stream requires it and is triggering.
+
+    The callable may also be a coroutine function (declared using
+    async def) or otherwise return an awaitable, in which case the
+    awaitable is run to completion. When callbacks are deferred (see
+    defer_callbacks), e.g. when a plot is refreshed in response to a
+    stream event, the awaitable is instead scheduled on the running
+    event loop and a CallbackPending exception is raised. Similarly,
+    if an executor is supplied deferred calls are submitted to the
+    executor. In both cases work scheduled for superseded arguments
+    or stream state is cancelled or dropped.
+
+    If a disk_cache is supplied the return values are also persisted
+    to disk, keyed by a stable hash of the callable, the arguments and
+    the state of the streams, so that they can be reused across
+    sessions and processes.
 
     A Callable may also specify a stream_mapping which specifies the
     objects that are associated with interactive (i.e linked) streams
@@ -642,14 +680,48 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=1, bounds=(1, None), doc="""
+         The number of return values to memoize, evicting the least
+         recently used value once exceeded. Memoizing more than one
+         value avoids calling the function when toggling between
+         stream states but should only be used if the return value
+         depends solely on the arguments and stream state.""")
+
     stream_mapping = param.Dict(default={}, constant=True, doc="""
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
 
+    disk_cache = param.Parameter(default=None, doc="""
+         An optional DiskCache, or the path to a cache directory, used
+         to persist the return values of the callable. Results are
+         only persisted if the callable (including its closure), the
+         arguments and the stream state can be hashed stably and are
+         reused whenever the results would be memoized.""")
+
+    executor = param.Parameter(default=None, doc="""
+         An optional concurrent.futures Executor, e.g. a
+         ThreadPoolExecutor, which deferred calls are submitted to,
+         keeping expensive callbacks that release the GIL off the
+         thread handling stream events. Calls which are superseded
+         by a newer call before they start are skipped.""")
+
+    # Thread-local flag declaring whether awaitables and executor
+    # calls made on the current thread should be deferred
+    _deferral = threading.local()
+
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        if isinstance(self.disk_cache, util.basestring):
+            from .io import DiskCache
+            self.disk_cache = DiskCache(path=self.disk_cache)
+        self._memoized = OrderedDict()
+        self._memoized_chain = None
+        self._memoize_hits = 0
+        self._memoize_misses = 0
+        self._latest = None
+        self._pending = None
+        self._resolved = None
         self._is_overlay = False
         self.args = None
         self.kwargs = None
@@ -659,6 +731,30 @@ class Callable(param.Parameterized):
     def argspec(self):
         return util.argspec(self.callable)
 
+    @property
+    def _defer(self):
+        "Whether calls on the current thread are deferred"
+        return getattr(Callable._deferral, 'active', False)
+
+    @property
+    def memoize_info(self):
+        """
+        Returns a dictionary summarizing the memoization state,
+        including the number of hits and misses and the number of
+        memoized values.
+        """
+        return OrderedDict([('hits', self._memoize_hits),
+                            ('misses', self._memoize_misses),
+                            ('entries', len(self._memoized)),
+                            ('memoize_size', self.memoize_size)])
+
+    def _memoize(self, hashed_key, value):
+        "Memoizes a value evicting the least recently used values."
+        self._memoized.pop(hashed_key, None)
+        self._memoized[hashed_key] = value
+        while len(self._memoized) > self.memoize_size:
+            self._memoized.pop(next(iter(self._memoized)))
+
     @property
     def noargs(self):
         "Returns True if the callable takes no arguments"
@@ -666,6 +762,69 @@ class Callable(param.Parameterized):
         return self.argspec == noargs
 
 
+    def _resolve(self, awaitable, request):
+        """
+        Resolves the awaitable returned by the callable. If calls are
+        deferred and an event loop is running, the awaitable is
+        scheduled as a task on the loop and CallbackPending is raised.
+        Otherwise the awaitable is run to completion.
+        """
+        loop = util.running_event_loop()
+        if not self._defer or loop is None or request is None:
+            return util.resolve_awaitable(awaitable)
+        import asyncio
+        self._latest = request
+        self._schedule(asyncio.ensure_future(awaitable, loop=loop), request)
+
+    def _submit(self, args, kwargs, request):
+        """
+        Submits a call to the executor and raises CallbackPending. If
+        the call is superseded by a newer request before it starts it
+        is skipped by raising CallbackSuperseded, coalescing rapid
+        events into a single call. The done callbacks of the future
+        are invoked on the running event loop, if there is no event
+        loop the result cannot be handed back to the calling thread
+        asynchronously and is instead waited for.
+        """
+        def run():
+            if self._latest != request:
+                raise CallbackSuperseded()
+            ret = self.callable(*args, **kwargs)
+            return util.resolve_awaitable(ret) if util.isawaitable(ret) else ret
+        self._latest = request
+        future = self.executor.submit(run)
+        loop = util.running_event_loop()
+        if loop is None:
+            return future.result()
+        import asyncio
+        self._schedule(asyncio.wrap_future(future, loop=loop), request)
+
+    def _schedule(self, future, request):
+        """
+        Records the future computing the result of a request,
+        cancelling the future of any superseded request, and raises
+        CallbackPending.
+        """
+        if self._pending is not None and not self._pending[1].done():
+            self._pending[1].cancel()
+        self._pending = (request, future)
+        future.add_done_callback(partial(self._on_resolved, request))
+        raise CallbackPending(future)
+
+    def _on_resolved(self, request, task):
+        "Stores the result of a scheduled task unless it was superseded."
+        if self._pending is None or self._pending[1] is not task:
+            return
+        self._pending = None
+        if task.cancelled():
+            return
+        elif task.exception() is not None:
+            self.param.warning('Callable raised "%r" while awaiting %s.'
+                               % (task.exception(), self.name))
+            return
+        self._resolved = (request, task.result())
+
+
     def clone(self, callable=None, **overrides):
         """Clones the Callable optionally with new settings
 
@@ -699,7 +858,9 @@ class Callable(param.Parameterized):
         # Nothing to do for callbacks that accept no arguments
         kwarg_hash = kwargs.pop('_memoization_hash_', ())
         (self.args, self.kwargs) = (args, kwargs)
-        if not args and not kwargs and not any(kwarg_hash): return self.callable()
+        if not args and not kwargs and not any(kwarg_hash):
+            ret = self.callable()
+            return util.resolve_awaitable(ret) if util.isawaitable(ret) else ret
         inputs = [i for i in self.inputs if isinstance(i, DynamicMap)]
         streams = []
         for stream in [s for i in inputs for s in get_nested_streams(i)]:
@@ -710,8 +871,45 @@ class Callable(param.Parameterized):
         key = args + kwarg_hash + values
 
         hashed_key = util.deephash(key) if self.memoize else None
-        if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+        if hashed_key is not None:
+            # Invalidate memoized values if the chain of inputs changed
+            chain = (frozenset(id(s) for s in streams),
+                     frozenset((id(d), id(d.callback), id(d.callback.callable))
+                               for i in inputs for d in get_nested_dmaps(i)))
+            if chain != self._memoized_chain:
+                self._memoized = OrderedDict()
+                self._memoized_chain = chain
+        if hashed_key is not None and memoize:
+            if hashed_key in self._memoized:
+                self._memoize_hits += 1
+                ret = self._memoized.pop(hashed_key)
+                self._memoized[hashed_key] = ret
+                return ret
+            self._memoize_misses += 1
+
+        request = None
+        if self._resolved is not None or self._pending is not None:
+            # Look up results of coroutines scheduled on the event loop
+            request = hashed_key if hashed_key is not None else util.deephash(key)
+            resolved, pending = self._resolved, self._pending
+            if request is not None and resolved is not None and resolved[0] == request:
+                self._resolved = None
+                if hashed_key is not None:
+                    self._memoize(hashed_key, resolved[1])
+                return resolved[1]
+            elif (self._defer and request is not None and pending is not None and
+                  pending[0] == request and not pending[1].done()):
+                raise CallbackPending(pending[1])
+
+        disk_key = None
+        if self.disk_cache is not None and self.memoize and memoize:
+            disk_key = util.stable_hash([self.callable, key, sorted(kwargs.items())])
+        if disk_key is not None:
+            ret = self.disk_cache.get(disk_key)
+            if ret is not None:
+                if hashed_key is not None:
+                    self._memoize(hashed_key, ret)
+                return ret
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -730,8 +928,18 @@ class Callable(param.Parameterized):
             args, kwargs = (), dict(pos_kwargs, **kwargs)
 
         try:
-            ret = self.callable(*args, **kwargs)
-        except KeyError:
+            deferred = self.executor is not None and self._defer
+            if deferred and request is None:
+                request = hashed_key if hashed_key is not None else util.deephash(key)
+            if deferred and request is not None:
+                ret = self._submit(args, kwargs, request)
+            else:
+                ret = self.callable(*args, **kwargs)
+            if util.isawaitable(ret):
+                if request is None:
+                    request = hashed_key if hashed_key is not None else util.deephash(key)
+                ret = self._resolve(ret, request)
+        except (KeyError, CallbackPending):
             # KeyError is caught separately because it is used to signal
             # invalid keys on DynamicMap and should not warn
             raise
@@ -745,7 +953,9 @@ class Callable(param.Parameterized):
             raise
 
         if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+            self._memoize(hashed_key, ret)
+        if disk_key is not None:
+            self.disk_cache.set(disk_key, ret)
         return ret
 
 
@@ -804,6 +1014,23 @@ def get_nested_streams(dmap):
     return list({s for dmap in get_nested_dmaps(dmap) for s in dmap.streams})
 
 
+@contextmanager
+def defer_callbacks():
+    """
+    Context manager within which Callables schedule the awaitables
+    returned by the wrapped functions on the running event loop and
+    submit calls to their executor rather than waiting for the
+    result, raising CallbackPending. Only applies to calls made on
+    the current thread.
+    """
+    state = getattr(Callable._deferral, 'active', False)
+    Callable._deferral.active = True
+    try:
+        yield
+    finally:
+        Callable._deferral.active = state
+
+
 @contextmanager
 def dynamicmap_memoization(callable_obj, streams):
     """
@@ -877,12 +1104,284 @@ class periodic(object):
 
 
 
+class CachePolicy(param.Parameterized):
+    """
+    A CachePolicy decides which entries are evicted from the cache of
+    a DynamicMap. The base policy evicts entries in the order they
+    were inserted once the cache holds more entries than the
+    cache_size of the DynamicMap or once the estimated size of the
+    cached elements exceeds max_bytes. The most recently inserted
+    entry is never evicted.
+
+    The policy also counts the cache hits and misses of the
+    DynamicMap it is attached to. Subclasses may reorder the entries
+    on access to implement other eviction strategies.
+    """
+
+    max_bytes = param.Integer(default=None, bounds=(0, None), doc="""
+        The memory budget of the cache in bytes, estimated from the
+        data of the cached elements. If None the cache is bounded
+        only by the number of entries.""")
+
+    def __init__(self, **params):
+        super(CachePolicy, self).__init__(**params)
+        self._entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def copy(self):
+        """
+        Returns a copy of the policy tracking the same entries with
+        the hit and miss counters reset.
+        """
+        params = {k: v for k, v in self.get_param_values() if k != 'name'}
+        policy = self.__class__(**params)
+        policy._entries = OrderedDict(self._entries)
+        policy.nbytes = self.nbytes
+        return policy
+
+    def estimate(self, value):
+        """
+        Estimates the number of bytes held by the data of all the
+        elements in the supplied value.
+        """
+        from .element import Element
+        if hasattr(value, 'traverse'):
+            value = value.traverse(lambda x: x.data, [Element])
+        return util.estimate_nbytes(value)
+
+    def hit(self, key):
+        "Records a cache hit for the supplied key."
+        self.hits += 1
+
+    def miss(self, key):
+        "Records a cache miss for the supplied key."
+        self.misses += 1
+
+    def insert(self, cache, key, value, max_items):
+        """
+        Records the insertion of a key and value into the cache and
+        returns the list of keys that should be evicted from the
+        cache to stay within the max_items and max_bytes budgets.
+        Entries present in the cache which were not inserted via the
+        policy are treated as the oldest entries.
+        """
+        for k in [k for k in self._entries if k not in cache or k == key]:
+            self.nbytes -= self._entries.pop(k)
+        untracked = [(k, self.estimate(v)) for k, v in cache.items()
+                     if k not in self._entries and k != key]
+        if untracked:
+            self._entries = OrderedDict(untracked + list(self._entries.items()))
+            self.nbytes += sum(size for _, size in untracked)
+        size = self.estimate(value)
+        self._entries[key] = size
+        self.nbytes += size
+
+        evicted = []
+        while len(self._entries) > 1 and (len(self._entries) > max_items or
+                                          (self.max_bytes is not None and
+                                           self.nbytes > self.max_bytes)):
+            k = next(iter(self._entries))
+            self.nbytes -= self._entries.pop(k)
+            evicted.append(k)
+        return evicted
+
+    def clear(self):
+        "Clears all tracked entries and resets the counters."
+        self._entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+
+class LRUCachePolicy(CachePolicy):
+    """
+    A CachePolicy which evicts the least recently used entries first,
+    ensuring that entries which are accessed repeatedly, e.g. when
+    scrubbing back and forth across a slider, remain in the cache.
+    """
+
+    def hit(self, key):
+        "Records a cache hit marking the key as most recently used."
+        super(LRUCachePolicy, self).hit(key)
+        if key in self._entries:
+            self._entries[key] = self._entries.pop(key)
+
+
+
+class Prefetcher(object):
+    """
+    Implements the speculative prefetching of keys on a DynamicMap.
+
+    After a key is requested the keys neighbouring it along the most
+    recently changed key dimension are evaluated in a background
+    thread, nearest first. Keys along a dimension are defined by the
+    declared values of the dimension or by stepping through its range
+    using the declared step (or a step of one for integer ranges).
+
+    Prefetched results are handed to the DynamicMap cache on the next
+    request, where they are subject to the cache_policy. Prefetching
+    stops once the results exceed the cache_size or the memory budget
+    of the cache_policy and queued keys are dropped whenever a new key
+    is requested, so that jumping elsewhere cancels prefetches which
+    are no longer relevant. A prefetch which is already in flight is
+    not interrupted, so a request may wait on at most one callback.
+    """
+
+    def __init__(self, dmap):
+        self.dmap = dmap
+        # Serializes callback evaluation between threads
+        self.lock = threading.RLock()
+        self._condition = threading.Condition()
+        self._queue = []
+        self._targets = set()
+        self._results = OrderedDict()
+        self._nbytes = 0
+        self._last_key = None
+        self._active = None
+        self._running = False
+
+    def _steps(self, dim, value, count):
+        "Returns the values after and before a value along a dimension"
+        if dim.values:
+            values = list(dim.values)
+            if all(util.isnumeric(v) for v in values):
+                values = sorted(values)
+            if value not in values:
+                return [], []
+            idx = values.index(value)
+            return values[idx+1:idx+1+count], values[max(idx-count, 0):idx][::-1]
+        lower, upper = dim.range
+        step = dim.step
+        if step is None and all(isinstance(v, Integral) for v in (lower, upper, value)):
+            step = 1
+        if None in (lower, upper, step) or not util.isnumeric(value):
+            return [], []
+        after = [value+i*step for i in range(1, count+1) if value+i*step <= upper]
+        before = [value-i*step for i in range(1, count+1) if value-i*step >= lower]
+        return after, before
+
+    def neighbours(self, key):
+        """
+        Returns the keys neighbouring the supplied key along the most
+        recently changed key dimension, ordered by distance.
+        """
+        last, self._last_key = self._last_key, key
+        if last is not None and len(last) == len(key):
+            changed = [i for i, (k1, k2) in enumerate(zip(last, key)) if k1 != k2]
+            if len(changed) == 1:
+                self._active = changed[0]
+        elif len(key) == 1:
+            self._active = 0
+        if self._active is None or key[self._active] is None:
+            return []
+        dim = self.dmap.kdims[self._active]
+        after, before = self._steps(dim, key[self._active], self.dmap.prefetch)
+        keys = []
+        for i in range(max(len(after), len(before))):
+            keys += after[i:i+1] + before[i:i+1]
+        return [key[:self._active]+(v,)+key[self._active+1:] for v in keys]
+
+    def schedule(self, key):
+        """
+        Replaces the queued keys with the neighbours of the supplied
+        key and starts the background thread if required.
+        """
+        neighbours = self.neighbours(key)
+        with self._condition:
+            self._targets = set(neighbours)
+            self._queue = [k for k in neighbours if k not in self._results
+                           and k not in self.dmap.data]
+            if not self._queue or self._running:
+                return
+            self._running = True
+        thread = threading.Thread(target=self._run)
+        thread.daemon = True
+        thread.start()
+
+    def cancel(self):
+        "Drops the queued keys, leaving any prefetched results."
+        with self._condition:
+            self._queue = []
+
+    def take(self, key=None):
+        """
+        Removes and returns the prefetched result for the supplied
+        key as a (found, value) tuple. If no key is supplied, all
+        prefetched results are removed and returned as a list of
+        (key, value) pairs.
+        """
+        with self._condition:
+            if key is None:
+                results = [(k, v) for k, (v, _) in self._results.items()]
+                self._results = OrderedDict()
+                self._nbytes = 0
+                return results
+            elif key not in self._results:
+                return False, None
+            value, size = self._results.pop(key)
+            self._nbytes -= size
+            return True, value
+
+    def _within_budget(self, nbytes=0):
+        dmap = self.dmap
+        if len(self._results) >= dmap.cache_size-1:
+            return False
+        max_bytes = dmap.cache_policy.max_bytes
+        return max_bytes is None or self._nbytes+nbytes <= max_bytes
+
+    def _stop(self):
+        self._queue = []
+        self._running = False
+
+    def _run(self):
+        # Callbacks are evaluated in this thread, where callback
+        # deferral is never active since it is tracked per thread
+        dmap = self.dmap
+        while True:
+            with self.lock:
+                # The queue is only popped while holding the lock so
+                # that keys cancelled by a request are never started
+                with self._condition:
+                    if not self._queue or not self._within_budget():
+                        self._stop()
+                        return
+                    key = self._queue.pop(0)
+                    if key not in self._targets or key in self._results:
+                        continue
+                if key in dmap.data:
+                    continue
+                try:
+                    value = dmap._execute_callback(*key)
+                except Exception:
+                    continue
+            size = dmap.cache_policy.estimate(value)
+            with self._condition:
+                if key not in self._targets:
+                    continue
+                elif not self._within_budget(size):
+                    self._stop()
+                    return
+                self._results[key] = (value, size)
+                self._nbytes += size
+
+
+
 class DynamicMap(HoloMap):
     """
     A DynamicMap is a type of HoloMap where the elements are dynamically
     generated by a callable. The callable is invoked with values
     associated with the key dimensions or with values supplied by stream
     parameters.
+
+    Expensive callbacks may opt into persisting their results across
+    sessions and processes by supplying a DiskCache (or the path to a
+    cache directory) as the disk_cache argument. Similarly an executor,
+    e.g. a ThreadPoolExecutor, may be supplied to compute the results
+    for stream events off the thread handling the events. Both are
+    passed on to the Callable wrapping the callback.
     """
 
     # Declare that callback is a positional parameter (used in clone)
@@ -907,11 +1406,28 @@ class DynamicMap(HoloMap):
        updating the streams.""" )
 
     cache_size = param.Integer(default=500, doc="""
-       The number of entries to cache for fast access. This is an LRU
-       cache where the least recently used item is overwritten once
-       the cache is full.""")
-
-    def __init__(self, callback, initial_items=None, streams=None, **params):
+       The number of entries to cache for fast access. Once the cache
+       is full entries are evicted according to the cache_policy.""")
+
+    prefetch = param.Integer(default=0, bounds=(0, None), doc="""
+       The number of keys before and after the most recently requested
+       key along the most recently changed key dimension to evaluate
+       speculatively in a background thread, so that stepping through
+       the dimension, e.g. using a slider or player widget, does not
+       wait on the callback. The prefetched results are subject to the
+       cache_size and cache_policy and queued prefetches are dropped
+       when a key elsewhere is requested. A prefetch already in flight
+       is not cancelled, so a request may wait for that one callback,
+       since callbacks are never evaluated concurrently.""")
+
+    cache_policy = param.ClassSelector(class_=CachePolicy, default=None, doc="""
+       The CachePolicy deciding which entries are evicted once the
+       cache is full and counting cache hits and misses. Defaults to
+       an LRUCachePolicy, evicting the least recently used entries
+       first. The policy may also declare a memory budget in bytes.""")
+
+    def __init__(self, callback, initial_items=None, streams=None, disk_cache=None,
+                 executor=None, **params):
         streams = (streams or [])
 
         # If callback is a parameterized method and watch is disabled add as stream
@@ -923,6 +1439,11 @@ class DynamicMap(HoloMap):
         elif not isinstance(callback, Callable):
             callback = Callable(callback)
 
+        callable_params = dict(disk_cache=disk_cache, executor=executor)
+        callable_params = {k: v for k, v in callable_params.items() if v is not None}
+        if callable_params:
+            callback = callback.clone(**callable_params)
+
         if 'sampled' in params:
             self.param.warning('DynamicMap sampled parameter is deprecated '
                                'and no longer needs to be specified.')
@@ -935,6 +1456,8 @@ class DynamicMap(HoloMap):
             raise TypeError(msg.format(objs = ', '.join('%r' % el for el in invalid)))
 
         super(DynamicMap, self).__init__(initial_items, callback=callback, streams=valid, **params)
+        if self.cache_policy is None:
+            self.cache_policy = LRUCachePolicy()
 
         self.opts = Opts(self, mode='dynamicmap')
 
@@ -957,6 +1480,7 @@ class DynamicMap(HoloMap):
                 stream.source = self
         self.redim = Redim(self, mode='dynamic')
         self.periodic = periodic(self)
+        self._prefetcher = None
 
     @property
     def unbounded(self):
@@ -1166,6 +1690,8 @@ class DynamicMap(HoloMap):
             data = self.data
             if link and callback is self.callback:
                 overrides['plot_id'] = self._plot_id
+        if 'cache_policy' not in overrides and self.cache_policy is not None:
+            overrides['cache_policy'] = self.cache_policy.copy()
         clone = super(UniformNdMapping, self).clone(
             callback, shared_data, new_type, link,
             *(data,) + args, **overrides)
@@ -1182,9 +1708,24 @@ class DynamicMap(HoloMap):
     def reset(self):
         "Clear the DynamicMap cache"
         self.data = OrderedDict()
+        if self.cache_policy is not None:
+            self.cache_policy.clear()
         return self
 
 
+    @property
+    def cache_info(self):
+        """
+        Returns a dictionary summarizing the state of the cache,
+        including the number of cache hits and misses, the number of
+        cached entries and their estimated size in bytes.
+        """
+        policy = self.cache_policy
+        return OrderedDict([('hits', policy.hits), ('misses', policy.misses),
+                            ('entries', len(self.data)), ('nbytes', policy.nbytes),
+                            ('max_bytes', policy.max_bytes)])
+
+
     def _cross_product(self, tuple_key, cache, data_slice):
         """
         Returns a new DynamicMap if the key (tuple form) expresses a
@@ -1212,9 +1753,10 @@ class DynamicMap(HoloMap):
         for inner_key in product:
             key = util.wrap_tuple(inner_key)
             if key in cache:
+                self.cache_policy.hit(key)
                 val = cache[key]
             else:
-                val = self._execute_callback(*key)
+                val = self._evaluate(key)
             if data_slice:
                 val = self._dataslice(val, data_slice)
             data.append((key, val))
@@ -1305,12 +1847,18 @@ class DynamicMap(HoloMap):
                 return sliced
 
         # Cache lookup
+        cacheable = False
         try:
             dimensionless = util.dimensionless_contents(get_nested_streams(self),
                                                         self.kdims, no_duplicates=False)
             empty = util.stream_parameters(self.streams) == [] and self.kdims==[]
             if dimensionless or empty:
                 raise KeyError('Using dimensionless streams disables DynamicMap cache')
+            cacheable = True
+            prefetcher = getattr(self, '_prefetcher', None)
+            if prefetcher is not None:
+                for prefetched_key, prefetched in prefetcher.take():
+                    self._cache(prefetched_key, prefetched)
             cache = super(DynamicMap,self).__getitem__(key)
         except KeyError:
             cache = None
@@ -1320,15 +1868,56 @@ class DynamicMap(HoloMap):
         if product is not None:
             return product
 
+        # Speculatively evaluate neighbouring keys if cache is enabled
+        prefetch = self.prefetch and cacheable and not data_slice
+
         # Not a cross product and nothing cached so compute element.
-        if cache is not None: return cache
-        val = self._execute_callback(*tuple_key)
+        if cache is not None:
+            self.cache_policy.hit(tuple_key)
+            if prefetch:
+                self._prefetch(tuple_key)
+            return cache
+        val = self._evaluate(tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
         self._cache(tuple_key, val)
+        if prefetch:
+            self._prefetch(tuple_key)
+        return val
+
+
+    def _evaluate(self, key):
+        """
+        Evaluates the callback for a key, unless the key was
+        prefetched in the meantime, recording the cache miss.
+        """
+        prefetcher = getattr(self, '_prefetcher', None)
+        if prefetcher is None:
+            self.cache_policy.miss(key)
+            return self._execute_callback(*key)
+        found, val = prefetcher.take(key)
+        if not found:
+            # Drop queued prefetches so at most the prefetch in flight,
+            # which may be this key, is awaited before evaluating
+            prefetcher.cancel()
+            with prefetcher.lock:
+                found, val = prefetcher.take(key)
+                if not found:
+                    val = self._execute_callback(*key)
+        if found:
+            self.cache_policy.hit(key)
+        else:
+            self.cache_policy.miss(key)
         return val
 
 
+    def _prefetch(self, key):
+        "Schedules the prefetching of the keys neighbouring the key."
+        if getattr(self, '_prefetcher', None) is None:
+            self._prefetcher = Prefetcher(self)
+        self._prefetcher.schedule(key)
+
+
     def select(self, selection_specs=None, **kwargs):
         """Applies selection by dimension name
 
@@ -1394,9 +1983,8 @@ class DynamicMap(HoloMap):
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+        for evicted in self.cache_policy.insert(self.data, key, val, cache_size):
+            self.data.pop(evicted, None)
         self[key] = val
 
 
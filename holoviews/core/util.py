@@ -1,5 +1,6 @@
 import os, sys, warnings, operator
 import time
+import hashlib
 import types
 import numbers
 import inspect
@@ -347,6 +348,80 @@ def deephash(obj):
         return None
 
 
+class StableHashJSON(HashableJSON):
+    """
+    Extends HashableJSON to generate strings which are stable across
+    processes and sessions, making them suitable as keys of persistent
+    caches. Instead of falling back to the id or the Python hash of
+    unrecognized objects, which vary between processes, a TypeError is
+    raised for objects which cannot be represented stably.
+
+    Functions are represented by their module, name, bytecode,
+    constants, default arguments and closure contents, while bound
+    methods and partials also include the bound object and arguments.
+    Parameterized objects are represented by their class and parameter
+    values and HoloViews objects additionally by their data, except for
+    DynamicMaps whose data is merely a cache. Note that global state
+    referenced by a function is not taken into account.
+    """
+
+    def default(self, obj):
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=repr)
+        elif isinstance(obj, np.ndarray):
+            if obj.dtype.kind == 'O':
+                return obj.tolist()
+            data = np.ascontiguousarray(obj).tobytes()
+            return [str(obj.dtype), obj.shape, hashlib.sha1(data).hexdigest()]
+        elif isinstance(obj, np.generic):
+            return obj.item()
+        elif pd and isinstance(obj, (pd.Series, pd.DataFrame)):
+            return obj.to_csv()
+        elif isinstance(obj, (dt.date, dt.time, np.datetime64)):
+            return str(obj)
+        elif isinstance(obj, partial):
+            return ['partial', obj.func, list(obj.args), obj.keywords or {}]
+        elif inspect.ismethod(obj) and obj.__self__ is not None:
+            return ['method', obj.__self__, obj.__func__]
+        elif isinstance(obj, types.CodeType):
+            consts = [c for c in obj.co_consts if not isinstance(c, types.CodeType)]
+            code = [c for c in obj.co_consts if isinstance(c, types.CodeType)]
+            return [hashlib.sha1(obj.co_code).hexdigest(), list(obj.co_names),
+                    [repr(c) for c in consts], code]
+        elif isinstance(obj, types.FunctionType):
+            closure = [c.cell_contents for c in (obj.__closure__ or ())]
+            return [obj.__module__, getattr(obj, '__qualname__', obj.__name__),
+                    obj.__code__, list(obj.__defaults__ or ()), closure]
+        elif isinstance(obj, (type, types.BuiltinFunctionType)):
+            return [obj.__module__, getattr(obj, '__qualname__', obj.__name__)]
+        elif isinstance(obj, param.Parameterized):
+            from .dimension import LabelledData
+            from .spaces import DynamicMap
+            params = [(k, v) for k, v in sorted(obj.get_param_values())
+                      if k != 'name']
+            if isinstance(obj, LabelledData) and not isinstance(obj, DynamicMap):
+                data = obj.data
+                if isinstance(data, dict) and not all(isinstance(k, basestring) for k in data):
+                    data = list(data.items())
+                return [type(obj), params, data]
+            return [type(obj), params]
+        raise TypeError('Object of type %s cannot be hashed stably'
+                        % type(obj).__name__)
+
+
+def stable_hash(obj):
+    """
+    Given an object, return a hexadecimal hash using StableHashJSON.
+    Unlike deephash the hash is stable across processes and sessions.
+    Returns None if the object cannot be hashed stably.
+    """
+    try:
+        string = json.dumps(obj, cls=StableHashJSON, sort_keys=True)
+    except Exception:
+        return None
+    return hashlib.sha1(string.encode('utf-8')).hexdigest()
+
+
 def tree_attribute(identifier):
     """
     Predicate that returns True for custom attributes added to AttrTrees
@@ -494,6 +569,62 @@ def callable_name(callable_obj):
         return str(callable_obj)
 
 
+def isawaitable(obj):
+    "Whether the object can be awaited, e.g. a coroutine or Future."
+    check = getattr(inspect, 'isawaitable', None)
+    return False if check is None else check(obj)
+
+
+def running_event_loop():
+    """
+    Returns the asyncio event loop running in the current thread or
+    None if there is no running event loop.
+    """
+    try:
+        import asyncio
+    except ImportError:
+        return None
+    get_running_loop = getattr(asyncio, '_get_running_loop', None)
+    if get_running_loop is not None:
+        return get_running_loop()
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        return None
+    return loop if loop.is_running() else None
+
+
+def resolve_awaitable(awaitable):
+    """
+    Runs an awaitable, e.g. the coroutine returned by an async def
+    function, to completion on a new event loop and returns the
+    result. If an event loop is already running in the current
+    thread, e.g. in a Jupyter kernel or on a bokeh server, the new
+    event loop is run in a separate thread since the running loop
+    cannot be blocked on.
+    """
+    import asyncio
+    result = {}
+    def run():
+        loop = asyncio.new_event_loop()
+        try:
+            result['value'] = loop.run_until_complete(awaitable)
+        except BaseException as e:
+            result['error'] = e
+        finally:
+            loop.close()
+
+    if running_event_loop() is None:
+        run()
+    else:
+        thread = Thread(target=run)
+        thread.start()
+        thread.join()
+    if 'error' in result:
+        raise result['error']
+    return result['value']
+
+
 def process_ellipses(obj, key, vdim_selection=False):
     """
     Helper function to pad a __getitem__ key with the right number of
@@ -1110,6 +1241,8 @@ def unique_array(arr):
     """
     if not len(arr):
         return np.asarray(arr)
+    elif isinstance(arr, CategoricalArray):
+        return arr.unique()
     elif pd:
         if isinstance(arr, np.ndarray) and arr.dtype.kind not in 'MO':
             # Avoid expensive unpacking if not potentially datetime
@@ -1816,6 +1949,448 @@ def arglexsort(arrays):
     return recarray.argsort()
 
 
+class CategoricalArray(object):
+    """
+    CategoricalArray is a dictionary-encoded representation of a 1D
+    array of low-cardinality values such as strings, storing compact
+    integer codes indexing into an array of unique categories.
+    Comparisons, membership tests and factorization operate on the
+    integer codes, while converting it to a NumPy array decodes the
+    values.
+    """
+
+    def __init__(self, codes, categories):
+        self.codes = np.asarray(codes)
+        self.categories = np.asarray(categories)
+
+    @classmethod
+    def from_values(cls, values):
+        """
+        Encodes the supplied values, with categories ordered by their
+        first occurrence.
+        """
+        codes, categories = factorize(values)
+        dtype = np.min_scalar_type(max(len(categories)-1, 0))
+        return cls(codes.astype(dtype), categories)
+
+    @property
+    def dtype(self):
+        return self.categories.dtype
+
+    @property
+    def shape(self):
+        return self.codes.shape
+
+    @property
+    def ndim(self):
+        return 1
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.categories.nbytes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.categories[self.codes]
+        return values if dtype is None else values.astype(dtype)
+
+    def __iter__(self):
+        return iter(np.asarray(self))
+
+    def __repr__(self):
+        return '%s(%r, categories=%r)' % (type(self).__name__, np.asarray(self),
+                                          self.categories)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return self.categories[self.codes[index]]
+        return type(self)(self.codes[index], self.categories)
+
+    def _compare(self, other, op):
+        if not isscalar(other):
+            return op(np.asarray(self), other)
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'elementwise comparison failed')
+            return np.asarray(op(self.categories, other), dtype=bool)[self.codes]
+
+    def __eq__(self, other):
+        if not isscalar(other):
+            return np.asarray(self) == other
+        matches = np.flatnonzero(self.categories == other)
+        if not len(matches):
+            return np.zeros(len(self), dtype=bool)
+        return self.codes == matches[0]
+
+    def __ne__(self, other):
+        return ~(self == other)
+
+    __hash__ = None
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    def astype(self, dtype):
+        return np.asarray(self, dtype=dtype)
+
+    def copy(self):
+        return type(self)(self.codes.copy(), self.categories)
+
+    def isin(self, values):
+        "Returns a boolean mask of the values contained in the supplied values."
+        matches = [i for i, c in enumerate(self.categories) if c in values]
+        return np.isin(self.codes, matches)
+
+    def tolist(self):
+        return np.asarray(self).tolist()
+
+    def unique(self):
+        "Returns the categories in use in order of their first occurrence."
+        _, first = np.unique(self.codes, return_index=True)
+        return self.categories[self.codes[np.sort(first)]]
+
+
+def factorize(values):
+    """
+    Encodes the supplied array as integer codes into an array of its
+    unique values, where the unique values are ordered by their first
+    occurrence in the input.
+
+    Args:
+       values (np.ndarray): The array to factorize
+
+    Returns:
+       Tuple of integer codes and array of unique values
+    """
+    if isinstance(values, CategoricalArray):
+        codes, uniques = factorize(values.codes)
+        return codes, values.categories[uniques]
+    values = np.asarray(values)
+    try:
+        uniques, first, codes = np.unique(values, return_index=True,
+                                          return_inverse=True)
+    except TypeError:
+        # Unorderable object arrays are encoded by hashing the values
+        lookup = OrderedDict()
+        codes = np.array([lookup.setdefault(v, len(lookup)) for v in values],
+                         dtype=np.intp)
+        uniques = np.empty(len(lookup), dtype=values.dtype)
+        for i, v in enumerate(lookup):
+            uniques[i] = v
+        return codes, uniques
+    order = np.argsort(first, kind='mergesort')
+    ranks = np.empty(len(order), dtype=np.intp)
+    ranks[order] = np.arange(len(order))
+    return ranks[codes], uniques[order]
+
+
+def group_indices(arrays):
+    """
+    Groups the rows of the supplied arrays by each unique combination
+    of values in a single pass. Each array is factorized into integer
+    codes, which are combined into a single group code per row and
+    stably sorted, allowing the row indices of each group to be split
+    off at the group boundaries. Groups are returned in order of their
+    first occurrence.
+
+    Args:
+       arrays (list): List of equal length 1D arrays to group by
+
+    Returns:
+       Tuple of list of unique key tuples and list of index arrays
+    """
+    arrays = [array if isinstance(array, CategoricalArray) else np.asarray(array)
+              for array in arrays]
+    if not arrays or not len(arrays[0]):
+        return [], []
+    codes, first = group_codes(arrays)
+    sorting = np.argsort(codes, kind='mergesort')
+    boundaries = np.cumsum(np.bincount(codes))[:-1]
+    indices = np.split(sorting, boundaries)
+    keys = [tuple(array[i] for array in arrays) for i in first]
+    return keys, indices
+
+
+def concat_arrays(arrays, lengths=None):
+    """
+    Concatenates the supplied 1D arrays and scalars by preallocating
+    the output once and filling it in place, where scalars are
+    broadcast to the corresponding length. Falls back to
+    np.concatenate if the arrays are not all NumPy arrays or do not
+    share a common dtype.
+
+    Args:
+       arrays (list): List of 1D arrays or scalars to concatenate
+       lengths (list): Optional list of lengths of each array
+
+    Returns:
+       Concatenated array
+    """
+    if lengths is None:
+        lengths = [1 if isscalar(arr) else len(arr) for arr in arrays]
+    offsets = np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)])
+    try:
+        if any(not (isinstance(arr, np.ndarray) or isscalar(arr)) for arr in arrays):
+            raise TypeError('Only NumPy arrays and scalars may be preallocated')
+        dtype = np.result_type(*[np.asarray(arr).dtype for arr in arrays])
+    except TypeError:
+        return np.concatenate([np.full(l, arr) if isscalar(arr) else arr
+                               for arr, l in zip(arrays, lengths)])
+    out = np.empty(offsets[-1], dtype=dtype)
+    for arr, start, end in zip(arrays, offsets[:-1], offsets[1:]):
+        out[start:end] = arr
+    return out
+
+
+def repeat_keys(keys, lengths):
+    """
+    Builds a column repeating each key by the corresponding length.
+    Keys of mixed types are held in an object array rather than
+    letting NumPy coerce them to a common type, e.g. converting a mix
+    of numbers and strings to strings.
+
+    Args:
+       keys (list): List of scalar keys
+       lengths (list): Number of times each key is repeated
+
+    Returns:
+       Array of repeated keys
+    """
+    keys = list(keys)
+    array = np.asarray(keys)
+    if array.dtype.kind in 'SU' and not all(isinstance(k, basestring) for k in keys):
+        array = np.empty(len(keys), dtype=object)
+        array[:] = keys
+    return np.repeat(array, lengths)
+
+
+def group_codes(arrays):
+    """
+    Encodes each row of the supplied arrays as an integer group code,
+    where groups are numbered in order of their first occurrence.
+
+    Args:
+       arrays (list): List of equal length 1D arrays to group by
+
+    Returns:
+       Tuple of the group code of each row and the index of the
+       first row in each group
+    """
+    arrays = [array if isinstance(array, CategoricalArray) else np.asarray(array)
+              for array in arrays]
+    if not arrays or not len(arrays[0]):
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+    codes, _ = factorize(arrays[0])
+    for array in arrays[1:]:
+        array_codes, array_uniques = factorize(array)
+        codes, _ = factorize(codes * len(array_uniques) + array_codes)
+    _, first = np.unique(codes, return_index=True)
+    return codes, first
+
+
+# Reductions which may be computed for all groups in a single pass
+reductions = OrderedDict([
+    ('count', np.size), ('sum', np.sum), ('mean', np.mean),
+    ('var', np.var), ('std', np.std), ('min', np.min), ('max', np.max),
+    ('nansum', np.nansum), ('nanmean', np.nanmean),
+    ('nanmin', np.nanmin), ('nanmax', np.nanmax)])
+
+_reduction_names = [(fn, name) for name, fn in reductions.items()]
+_reduction_names += [(len, 'count'), (sum, 'sum'), (min, 'min'), (max, 'max'),
+                     (np.amin, 'min'), (np.amax, 'max')]
+
+
+def _known_reduction(function):
+    "Returns the name of a known reduction or None."
+    if isinstance(function, basestring):
+        if function not in reductions:
+            raise ValueError('Unknown reduction %r, valid reductions '
+                             'include: %s' % (function, list(reductions)))
+        return function
+    for fn, name in _reduction_names:
+        if function is fn:
+            return name
+    return None
+
+
+def reduction_name(function):
+    """
+    Returns the name of the supplied reduction, which may be a string
+    naming one of the known reductions or any callable.
+    """
+    name = _known_reduction(function)
+    if name is None:
+        return getattr(function, '__name__', type(function).__name__)
+    return name
+
+
+def group_reduce(values, codes, ngroups, function):
+    """
+    Applies a reduction to the values of all groups in a single
+    vectorized pass, given the group code of each value. Only the
+    known reductions on numeric or boolean data are supported, the
+    function may either be named or be the corresponding callable.
+
+    Args:
+       values (np.ndarray): The 1D array of values to reduce
+       codes (np.ndarray): The integer group code of each value
+       ngroups (int): The number of groups, all of which are non-empty
+       function: The reduction to apply
+
+    Returns:
+       Array of reduced values of each group or None if the reduction
+       cannot be vectorized
+    """
+    name = _known_reduction(function)
+    values = np.asarray(values)
+    if name is None or values.dtype.kind not in 'biuf':
+        return None
+
+    counts = np.bincount(codes, minlength=ngroups)
+    if name == 'count':
+        return counts
+    elif name in ('min', 'max', 'nanmin', 'nanmax'):
+        ufunc = {'min': np.minimum, 'max': np.maximum,
+                 'nanmin': np.fmin, 'nanmax': np.fmax}[name]
+        sorting = np.argsort(codes, kind='mergesort')
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        return ufunc.reduceat(values[sorting], starts)
+    elif name in ('sum', 'nansum') and values.dtype.kind in 'biu':
+        # Summing integers as float64 weights loses precision above 2**53
+        dtype = np.sum(values[:1]).dtype
+        sorting = np.argsort(codes, kind='mergesort')
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        return np.add.reduceat(values[sorting].astype(dtype), starts)
+
+    weights = values.astype('float')
+    if name.startswith('nan'):
+        valid = ~np.isnan(weights)
+        counts = np.bincount(codes, weights=valid, minlength=ngroups)
+        weights = np.where(valid, weights, 0)
+    sums = np.bincount(codes, weights=weights, minlength=ngroups)
+    if name == 'sum':
+        return sums.astype(np.sum(values[:1]).dtype)
+    elif name == 'nansum':
+        return sums
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts
+        if name in ('mean', 'nanmean'):
+            return means
+        deviations = weights - means[codes]
+        variances = np.bincount(codes, weights=deviations**2, minlength=ngroups) / counts
+    return np.sqrt(variances) if name == 'std' else variances
+
+
+def quantile_label(q):
+    "Returns the label of a quantile, e.g. '25%' for 0.25"
+    return '%g%%' % (q*100)
+
+
+def describe_array(values, quantiles=(0.25, 0.5, 0.75), chunksize=1000000):
+    """
+    Computes descriptive statistics of a 1D numeric or datetime array
+    in a single pass over chunks of the array. The mean and variance
+    of the chunks are merged using the parallel algorithm by Chan et
+    al. Quantiles are exact if the array fits into a single chunk and
+    are otherwise estimated from an evenly strided sample of each
+    chunk. Missing values are excluded from all statistics except the
+    count.
+
+    Args:
+       values (np.ndarray): The 1D array of values to describe
+       quantiles (tuple): Quantiles to compute between 0 and 1
+       chunksize (int): Number of values processed at a time
+
+    Returns:
+       OrderedDict of the count, nancount, min, max, mean, var and
+       quantiles or None if the array is not numeric
+    """
+    if isinstance(values, np.ma.MaskedArray):
+        values = values.compressed() if values.dtype.kind == 'M' else values.astype('float').filled(np.NaN)
+    values = np.asarray(values)
+    kind = values.dtype.kind
+    if kind not in 'biufM':
+        return None
+    elif kind == 'b':
+        values = values.astype('int8')
+
+    length = len(values)
+    nchunks = max(int(np.ceil(length/float(chunksize))), 1)
+    nsamples = max(chunksize//nchunks, 1)
+    nancount, n, mean, m2 = 0, 0, 0., 0.
+    lower, upper, samples = None, None, []
+    for start in range(0, length, chunksize):
+        chunk = values[start:start+chunksize]
+        if kind == 'M':
+            chunk = chunk[~isnat(chunk)].view('i8')
+        elif kind == 'f':
+            chunk = chunk[~np.isnan(chunk)]
+        nancount += min(length-start, chunksize) - len(chunk)
+        if not len(chunk):
+            continue
+        cmin, cmax = chunk.min(), chunk.max()
+        lower = cmin if lower is None else min(lower, cmin)
+        upper = cmax if upper is None else max(upper, cmax)
+        cn, cmean = len(chunk), chunk.mean(dtype='float64')
+        cm2 = ((chunk-cmean)**2).sum()
+        delta, total = cmean-mean, n+cn
+        mean += delta*cn/float(total)
+        m2 += cm2 + delta**2*n*cn/float(total)
+        n = total
+        samples.append(chunk[::max(cn//nsamples, 1)])
+
+    summary = OrderedDict([('count', length), ('nancount', nancount)])
+    if n:
+        sample = np.concatenate(samples)
+        qs = list(np.percentile(sample, [q*100 for q in quantiles]))
+        var = m2/n
+    else:
+        qs, lower, upper, mean, var = [np.NaN]*len(quantiles), np.NaN, np.NaN, np.NaN, np.NaN
+    if kind == 'M':
+        unit = np.datetime_data(values.dtype)[0]
+        to_dt = lambda v: np.datetime64(int(round(v)), unit) if np.isfinite(v) else np.datetime64('NaT')
+        lower, upper, mean = to_dt(lower), to_dt(upper), to_dt(mean)
+        var, qs = None, [to_dt(q) for q in qs]
+    summary['min'], summary['max'] = lower, upper
+    summary['mean'], summary['var'] = mean, var
+    for q, v in zip(quantiles, qs):
+        summary[quantile_label(q)] = v
+    return summary
+
+
+def estimate_nbytes(data):
+    """
+    Estimates the memory held by some data in bytes without copying
+    or computing it. Recurses into dictionaries, lists and tuples,
+    uses the nbytes or memory usage reported by arrays and dataframes
+    and falls back to sys.getsizeof for other objects, e.g. lazy
+    objects which cannot report their size without computing.
+    """
+    if isinstance(data, dict):
+        return sum(estimate_nbytes(v) for v in data.values())
+    elif isinstance(data, (list, tuple)):
+        return sum(estimate_nbytes(v) for v in data)
+    nbytes = getattr(data, 'nbytes', None)
+    if nbytes is None and hasattr(data, 'memory_usage'):
+        try:
+            nbytes = data.memory_usage(index=True).sum()
+        except Exception:
+            nbytes = None
+    if isinstance(nbytes, numbers.Number) and np.isfinite(nbytes):
+        return int(nbytes)
+    return sys.getsizeof(data)
+
+
 def dimensioned_streams(dmap):
     """
     Given a DynamicMap return all streams that have any dimensioned
@@ -2000,6 +2575,21 @@ def search_indices(values, source):
     return orig_indices[np.searchsorted(source[orig_indices], values)]
 
 
+def closest_indices(values, samples):
+    """
+    Given a sorted array of values returns the index of the closest
+    value for each of the supplied samples using a binary search. Ties
+    resolve to the lower value and duplicate values resolve to the
+    index of their first occurrence.
+    """
+    values, samples = np.asarray(values), np.asarray(samples)
+    right = np.clip(np.searchsorted(values, samples), 0, len(values)-1)
+    left = np.clip(right-1, 0, len(values)-1)
+    closer_left = np.abs(samples-values[left]) <= np.abs(values[right]-samples)
+    closest = np.where(closer_left, left, right)
+    return np.searchsorted(values, values[closest], side='left')
+
+
 def compute_edges(edges):
     """
     Computes edges as midpoints of the bin centers.  The first and
@@ -9,7 +9,7 @@ import numpy as np
 
 import param
 from ..core import Element2D, Dataset
-from ..core.data import MultiInterface
+from ..core.data import MultiInterface, PackedData
 from ..core.dimension import Dimension, asdim
 from ..core.util import OrderedDict, config, disable_constant, isscalar
 from .geom import Geometry
@@ -56,7 +56,7 @@ class Path(Geometry):
     group = param.String(default="Path", constant=True)
 
     datatype = param.ObjectSelector(default=[
-        'multitabular', 'dataframe', 'dictionary', 'dask', 'array'])
+        'multitabular', 'packed', 'dataframe', 'dictionary', 'dask', 'array'])
 
     def __init__(self, data, kdims=None, vdims=None, **params):
         if isinstance(data, tuple) and len(data) == 2:
@@ -76,6 +76,8 @@ class Path(Geometry):
                     path = path.redim(**redim)
                 if path.interface.multi and isinstance(path.data, list):
                     paths += path.data
+                elif path.interface.multi:
+                    paths += path.split(datatype='columns')
                 else:
                     paths.append(path.data)
             data = paths
@@ -84,11 +86,11 @@ class Path(Geometry):
 
         # Ensure that a list of tuples of scalars and any other non-list
         # type is interpreted as a single path
-        if (not isinstance(data, (list, Dataset)) or
+        if (not isinstance(data, (list, Dataset, PackedData)) or
             (isinstance(data, list) and not len(data) == 0 and all(
                 isinstance(d, tuple) and all(isscalar(v) for v in d)
                 for d in data))):
-            datatype = [dt for dt in datatype if dt != 'multitabular']
+            datatype = [dt for dt in datatype if dt not in ('multitabular', 'packed')]
         elif isinstance(data, list) and 'multitabular' not in datatype:
             datatype = datatype + ['multitabular']
 
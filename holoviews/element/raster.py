@@ -263,6 +263,17 @@ class Image(Dataset, Raster, SheetCoordinateSystem):
         data where regular sampling is expected. Expressed as the maximal
         allowable sampling difference between sample locations.""")
 
+    pyramid = param.ObjectSelector(default=None, objects=[None, 'mean', 'max'], doc="""
+        The aggregation used to build a pyramid of power-of-two
+        downsampled levels of the data. Levels are computed lazily
+        and shared between clones, allowing the regrid and rasterize
+        operations to avoid accessing the full resolution array when
+        the viewport is displayed at a lower resolution.""")
+
+    pyramid_path = param.String(default=None, doc="""
+        Directory to which the downsampled pyramid levels are written
+        as memory-mapped .npy files instead of being held in memory.""")
+
     _ndim = 2
 
     def __init__(self, data, kdims=None, vdims=None, bounds=None, extents=None,
@@ -424,8 +435,87 @@ class Image(Dataset, Raster, SheetCoordinateSystem):
             sheet_params = dict(bounds=self.bounds, xdensity=self.xdensity,
                                 ydensity=self.ydensity)
             overrides = dict(sheet_params, **overrides)
-        return super(Image, self).clone(data, shared_data, new_type, link,
-                                        *args, **overrides)
+        new = super(Image, self).clone(data, shared_data, new_type, link,
+                                       *args, **overrides)
+        if (isinstance(new, Image) and new._stats is not None and
+            new._stats is self._stats and
+            (new.bounds.lbrt() != self.bounds.lbrt() or
+             new.xdensity != self.xdensity or new.ydensity != self.ydensity)):
+            # The coordinates are derived from the bounds and density,
+            # so statistics computed on them cannot be shared
+            new._stats = None
+        return new
+
+
+    @property
+    def pyramid_levels(self):
+        "The number of downsampled levels available in the pyramid"
+        shape = self.interface.shape(self, gridded=True)[:2]
+        if not all(shape):
+            return 0
+        return max(int(np.log2(min(shape)))-1, 0)
+
+
+    def pyramid_level(self, level):
+        """Returns the Image downsampled by a factor of 2**level.
+
+        Computes the requested level of the pyramid using the
+        aggregation declared by the pyramid parameter (defaulting to
+        the mean), building any levels it is derived from only once.
+
+        Args:
+            level (int): Pyramid level where 0 is the full resolution
+
+        Returns:
+            Image downsampled to the requested level
+        """
+        if level == 0:
+            return self
+        elif not 0 < level <= self.pyramid_levels:
+            raise ValueError('%s pyramid level must be between 0 and %d, '
+                             'got %d.' % (type(self).__name__, self.pyramid_levels, level))
+        elif not hasattr(self.interface, 'pyramid'):
+            raise NotImplementedError('%s does not support pyramid levels.'
+                                      % self.interface.__name__)
+        data = self.interface.pyramid(self, level, self.pyramid or 'mean',
+                                      self.pyramid_path)
+        return self.clone(data, bounds=None, pyramid=None)
+
+
+    def select_level(self, width, height, x_range=None, y_range=None):
+        """Selects the pyramid level matching a viewport.
+
+        Returns the coarsest pyramid level which still provides at
+        least the requested number of samples along both axes within
+        the supplied ranges. Returns the Image itself if the pyramid
+        is disabled.
+
+        Args:
+            width (int): Number of samples required along the x-axis
+            height (int): Number of samples required along the y-axis
+            x_range (tuple, optional): Viewport range along the x-axis
+            y_range (tuple, optional): Viewport range along the y-axis
+
+        Returns:
+            Image at the selected pyramid level
+        """
+        if not self.pyramid or not width or not height:
+            return self
+
+        def samples(n, low, high, view):
+            if view is None:
+                return n
+            low, high, start, end = [util.dt_to_int(v, 'ns') if isinstance(v, util.datetime_types)
+                                     else v for v in (low, high)+tuple(view)]
+            return n * float(end-start) / (high-low) if high != low else n
+
+        l, b, r, t = self.bounds.lbrt()
+        ny, nx = self.interface.shape(self, gridded=True)[:2]
+        ratio = min(samples(nx, l, r, x_range)/float(width),
+                    samples(ny, b, t, y_range)/float(height))
+        if not ratio >= 2:
+            return self
+        return self.pyramid_level(min(int(np.log2(ratio)), self.pyramid_levels))
 
 
     def aggregate(self, dimensions=None, function=None, spreadfn=None, **kwargs):
@@ -568,12 +568,12 @@ class regrid(AggregationOperation):
                     xarr = xarr.copy()
                 if dims != xarr.dims and not irregular:
                     xarr = xarr.transpose(*dims)
-            elif irregular:
-                arr = element.dimension_values(vd, flat=False)
-                xarr = xr.DataArray(arr, coords=coord_dict, dims=['y', 'x'])
             else:
-                arr = element.dimension_values(vd, flat=False)
-                xarr = xr.DataArray(arr, coords=coord_dict, dims=dims)
+                # Avoid loading dask arrays, datashader will only
+                # compute the chunks required for the output grid
+                arr = element.interface.values(element, vd, flat=False, compute=False)
+                xarr = xr.DataArray(arr, coords=coord_dict,
+                                    dims=['y', 'x'] if irregular else dims)
             if xtype == "datetime":
                 xarr[x.name] = [dt_to_int(v, 'ns') for v in xarr[x.name].values]
             if ytype == "datetime":
@@ -588,10 +588,14 @@ class regrid(AggregationOperation):
 
         # Compute coords, anges and size
         x, y = element.kdims
-        coords = tuple(element.dimension_values(d, expanded=False) for d in [x, y])
         info = self._get_sampling(element, x, y)
         (x_range, y_range), (xs, ys), (width, height), (xtype, ytype) = info
 
+        # Regrid from the coarsest pyramid level covering the viewport
+        if isinstance(element, Image) and self.p.target is None:
+            element = element.select_level(width, height, x_range, y_range)
+        coords = tuple(element.dimension_values(d, expanded=False) for d in [x, y])
+
         # Disable upsampling by clipping size and ranges
         (xstart, xend), (ystart, yend) = (x_range, y_range)
         xspan, yspan = (xend-xstart), (yend-ystart)
@@ -99,6 +99,9 @@ class RasterPlot(ColorbarPlot):
         for i, vdim in enumerate(element.vdims, 2):
             if i > 2 and 'hover' not in self.handles:
                 break
+            # Bokeh pans and zooms the image client-side so the whole
+            # array has to be computed, use regrid or rasterize to only
+            # compute the portion of a dask array within the viewport
             img = element.dimension_values(i, flat=False)
             if img.dtype.kind == 'b':
                 img = img.astype(np.int8)
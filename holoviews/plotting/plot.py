@@ -18,7 +18,7 @@ from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
 from ..core.options import Store, Compositor, SkipRendering
 from ..core.overlay import NdOverlay
-from ..core.spaces import HoloMap, DynamicMap
+from ..core.spaces import HoloMap, DynamicMap, CallbackPending, defer_callbacks
 from ..core.util import stream_parameters, isfinite
 from ..element import Table, Graph
 from ..util.transform import dim
@@ -613,11 +613,23 @@ class DimensionedPlot(Plot):
                     for d, k in zip(self.dimensions, key))
         stream_key = util.wrap_tuple_streams(key, self.dimensions, self.streams)
 
-        self._trigger_refresh(stream_key)
+        try:
+            with defer_callbacks():
+                self._trigger_refresh(stream_key)
+        except CallbackPending as e:
+            # Refresh again once the coroutine callback has completed
+            e.future.add_done_callback(self._refresh_pending)
+            return
         if self.comm is not None and self.top_level:
             self.push()
 
 
+    def _refresh_pending(self, future):
+        "Refreshes the plot once a pending callback has resolved"
+        if not future.cancelled() and future.exception() is None:
+            self.refresh()
+
+
     def _trigger_refresh(self, key):
         "Triggers update to a plot on a refresh event"
         # Update if not top-level, batched or an ElementPlot
@@ -258,6 +258,65 @@ class HomogeneousColumnTests(object):
                                 kdims=[('x', 'X')], vdims=[('y', 'Y')])
         self.assertEqual(self.dataset_hm_alias[5:9], dataset_slice)
 
+    def test_dataset_slice_sorted_hm(self):
+        dataset = self.dataset_hm.index('x')
+        dataset_slice = Dataset({'x':range(5, 9), 'y':[2 * i for i in range(5, 9)]},
+                                kdims=['x'], vdims=['y'])
+        self.assertTrue(dataset.interface.issorted(dataset, 'x'))
+        self.assertEqual(dataset[5:9], dataset_slice)
+
+    def test_dataset_select_sorted_point_hm(self):
+        self.assertEqual(self.dataset_hm.select(x=5), 10)
+
+    def test_dataset_closest_sorted_hm(self):
+        dataset = self.dataset_hm.index('x')
+        self.assertEqual(dataset.closest([-1, 0.5, 4.6, 20]), [0, 0, 5, 10])
+
+    def test_dataset_range_cached_hm(self):
+        self.assertEqual(self.dataset_hm.range('y'), (0, 20))
+        stats = self.dataset_hm.interface.statistics(self.dataset_hm)
+        self.assertEqual(stats['y']['range'], (0, 20))
+        clone = self.dataset_hm.clone()
+        self.assertIs(clone.interface.statistics(clone), stats)
+        self.assertEqual(clone.range('y'), (0, 20))
+
+    def test_dataset_nancount_hm(self):
+        dataset = Dataset((self.xs.astype('float'), [np.nan, 1.]+[2.]*8+[np.nan]),
+                          kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset.interface.nancount(dataset, 'x'), 0)
+        self.assertEqual(dataset.interface.nancount(dataset, 'y'), 2)
+
+    def test_dataset_nunique_hm(self):
+        dataset = Dataset((self.xs.astype('float'), [np.nan, 1.]+[2.]*8+[np.nan]),
+                          kdims=['x'], vdims=['y'])
+        self.assertEqual(dataset.interface.nunique(dataset, 'x'), 11)
+        self.assertEqual(dataset.interface.nunique(dataset, 'y'), 3)
+
+    def test_dataset_lazy_chain_hm(self):
+        if self.dataset_hm.interface.gridded:
+            raise SkipTest('Lazy evaluation not supported on gridded data')
+        dataset = Dataset((self.xs, self.y_ints, self.xs_2),
+                          kdims=['x'], vdims=['y', 'z'])
+        def chain(ds):
+            return ds.select(x=(1, 9)).sort('y', reverse=True).select(x=(2, None)).reindex(vdims=['y'])
+        lazy = chain(dataset.lazy())
+        self.assertEqual(lazy, chain(dataset))
+
+    def test_dataset_lazy_evaluated_on_access_hm(self):
+        if self.dataset_hm.interface.gridded:
+            raise SkipTest('Lazy evaluation not supported on gridded data')
+        lazy = self.dataset_hm.lazy().select(x=(1, 9)).iloc[2:5]
+        self.assertIsNot(lazy._plan, None)
+        self.assertEqual(lazy.dimension_values('x'), np.array([3, 4, 5]))
+        self.assertIs(lazy._plan, None)
+
+    def test_dataset_lazy_merges_selections_hm(self):
+        if self.dataset_hm.interface.gridded:
+            raise SkipTest('Lazy evaluation not supported on gridded data')
+        lazy = Dataset(self.dataset_hm, lazy=True).select(x=(1, 9)).sort('y').select(x=(2, 11))
+        self.assertEqual([op[0] for op in lazy._plan.optimize()], ['select', 'sort'])
+        self.assertEqual(lazy.dimension_values('y'), self.y_ints[2:9])
+
     def test_dataset_slice_fn_hm(self):
         dataset_slice = Dataset({'x':range(5, 9), 'y':[2 * i for i in range(5, 9)]},
                                 kdims=['x'], vdims=['y'])
@@ -503,6 +562,20 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
         dataset = Dataset(dict(zip(self.xs, self.ys)), kdims=['A'], vdims=['B'])
         self.assertTrue(isinstance(dataset.data, self.data_type))
 
+    def test_dataset_describe(self):
+        summary = self.table.describe(['Age', 'Gender'])
+        self.assertEqual(list(summary), ['Age', 'Gender'])
+        age, gender = summary['Age'], summary['Gender']
+        self.assertEqual((age['count'], age['nancount']), (3, 0))
+        self.assertEqual((age['min'], age['max']), (10, 16))
+        self.assertAlmostEqual(age['mean'], 38/3.)
+        self.assertEqual((gender['count'], gender['nancount']), (3, 0))
+
+    def test_dataset_describe_seeds_range(self):
+        self.table.describe('Weight', quantiles=())
+        stats = self.table.interface.statistics(self.table)
+        self.assertEqual(stats['Weight']['range'], (10, 18))
+
     def test_dataset_range_with_dimension_range(self):
         dt64 = np.array([np.datetime64(datetime.datetime(2017, 1, i)) for i in range(1, 4)])
         ds = Dataset(dt64, [Dimension('Date', range=(dt64[0], dt64[-1]))])
@@ -610,6 +683,61 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
         aggregated = Dataset([], kdims=self.kdims[:1], vdims=[d for vd in self.vdims for d in [vd, vd+'_std']])
         self.compare_dataset(dataset.aggregate(['Gender'], np.mean, np.std), aggregated)
 
+    def test_dataset_aggregate_multiple_reductions(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight_mean':[16.5, 10], 'Weight_std':[1.5, 0],
+                              'Weight_count':[2, 1], 'Height':[0.8, 0.8]},
+                             kdims=self.kdims[:1],
+                             vdims=['Weight_mean', 'Weight_std', 'Weight_count', 'Height'])
+        reductions = {'Weight': ['mean', np.std, 'count'], 'Height': np.max}
+        self.compare_dataset(self.table.aggregate('Gender', reductions), aggregated)
+
+    def test_dataset_aggregate_reduction_list(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight_min':[15, 10], 'Weight_max':[18, 10],
+                              'Height_min':[0.6, 0.8], 'Height_max':[0.8, 0.8]},
+                             kdims=self.kdims[:1],
+                             vdims=['Weight_min', 'Weight_max', 'Height_min', 'Height_max'])
+        self.compare_dataset(self.table.aggregate('Gender', ['min', 'max']), aggregated)
+
+    def test_dataset_aggregate_reductions_custom_function(self):
+        aggregated = Dataset({'Gender':['M', 'F'], 'Weight_sum':[33, 10], 'Weight_<lambda>':[3, 0]},
+                             kdims=self.kdims[:1], vdims=['Weight_sum', 'Weight_<lambda>'])
+        reductions = {'Weight': [np.sum, lambda x: np.ptp(x)]}
+        self.compare_dataset(self.table.aggregate('Gender', reductions), aggregated)
+
+    def test_dataset_closest_2d(self):
+        ds = Dataset({'x': [0, 1, 2, 3], 'y': [0, 2, 1, 3], 'z': [0, 1, 2, 3]},
+                     kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(ds.closest([(0.9, 1.8), (2.8, 3.3)]), [(1, 2), (3, 3)])
+
+    def test_dataset_closest_2d_kwargs(self):
+        ds = Dataset({'x': [0, 1, 2, 3], 'y': [0, 2, 1, 3], 'z': [0, 1, 2, 3]},
+                     kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(ds.closest(x=2.2, y=0.7), [(2, 1)])
+
+    def test_dataset_sample_2d_snaps_to_closest(self):
+        ds = Dataset({'x': [0, 1, 2, 3], 'y': [0, 2, 1, 3], 'z': [0, 1, 2, 3]},
+                     kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(ds.sample([(0.1, 0.1), (2.1, 0.9)]).dimension_values('z'),
+                         np.array([0, 2]))
+
+    def test_dataset_sample_2d_exact_without_closest(self):
+        ds = Dataset({'x': [0, 1, 2, 3], 'y': [0, 2, 1, 3], 'z': [0, 1, 2, 3]},
+                     kdims=['x', 'y'], vdims=['z'])
+        sampled = ds.sample([(0.1, 0.1), (2, 1)], closest=False)
+        self.assertEqual(sampled.dimension_values('z'), np.array([2]))
+
+    def test_dataset_concat_hmap(self):
+        hmap = HoloMap({(i, 'A%d' % i): Dataset({'x': self.xs[:i+1], 'y': self.ys[:i+1]},
+                                               kdims=['x'], vdims=['y'])
+                        for i in range(3)}, kdims=['i', 'j'])
+        lengths = [1, 2, 3]
+        expected = Dataset({'i': np.repeat([0, 1, 2], lengths),
+                            'j': np.repeat(['A0', 'A1', 'A2'], lengths),
+                            'x': np.concatenate([self.xs[:l] for l in lengths]),
+                            'y': np.concatenate([self.ys[:l] for l in lengths])},
+                           kdims=['i', 'j', 'x'], vdims=['y'])
+        self.assertEqual(concat(hmap), expected)
+
     def test_dataset_groupby(self):
         group1 = {'Age':[10,16], 'Weight':[15,18], 'Height':[0.8,0.6]}
         group2 = {'Age':[12], 'Weight':[10], 'Height':[0.8]}
@@ -639,6 +767,27 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
                           kdims=['Age'], sort=False)
         self.assertEqual(self.table.groupby(['Age']), grouped)
 
+    def test_dataset_groupby_multiple_dims(self):
+        group1 = {'Weight':[15], 'Height':[0.8]}
+        group2 = {'Weight':[18], 'Height':[0.6]}
+        group3 = {'Weight':[10], 'Height':[0.8]}
+        grouped = HoloMap([(('M', 10), Dataset(group1, kdims=[], vdims=self.vdims)),
+                           (('M', 16), Dataset(group2, kdims=[], vdims=self.vdims)),
+                           (('F', 12), Dataset(group3, kdims=[], vdims=self.vdims))],
+                          kdims=['Gender', 'Age'], sort=False)
+        self.assertEqual(self.table.groupby(['Gender', 'Age']), grouped)
+
+    def test_dataset_index_unsorted(self):
+        dataset = Dataset({'x': [3, 1, 2], 'y': [0.3, 0.1, 0.2]}, kdims=['x'], vdims=['y'])
+        indexed = Dataset({'x': [1, 2, 3], 'y': [0.1, 0.2, 0.3]}, kdims=['x'], vdims=['y'])
+        self.assertFalse(dataset.interface.issorted(dataset, 'x'))
+        self.assertEqual(dataset.index('x'), indexed)
+
+    def test_dataset_select_sorted_and_unsorted_dims(self):
+        dataset = Dataset({'x': [0, 1, 2, 3, 4], 'y': [4, 1, 3, 0, 2]}, kdims=['x', 'y'])
+        selected = Dataset({'x': [1, 4], 'y': [1, 2]}, kdims=['x', 'y'])
+        self.assertEqual(dataset.select(x=(1, 5), y=(1, 3)), selected)
+
     def test_dataset_groupby_dynamic(self):
         grouped_dataset = self.table.groupby('Gender', dynamic=True)
         self.assertEqual(grouped_dataset['M'],
@@ -1028,6 +1177,15 @@ class GriddedInterfaceTests(object):
         self.assertEqual(self.dataset_grid_inv.dimension_values(0, flat=False),
                          expanded_xs)
 
+    def test_dataset_dim_vals_grid_kdims_expanded_xs_flat_cached(self):
+        expanded_xs = self.dataset_grid.dimension_values(0)
+        self.assertIs(self.dataset_grid.dimension_values(0), expanded_xs)
+        self.assertFalse(expanded_xs.flags.writeable)
+
+    def test_dataset_dim_vals_grid_kdims_expanded_xs_view(self):
+        expanded_xs = self.dataset_grid.dimension_values(0, flat=False)
+        self.assertFalse(expanded_xs.flags.owndata)
+
     def test_dataset_dim_vals_grid_kdims_ys(self):
         self.assertEqual(self.dataset_grid.dimension_values(1, expanded=False),
                          np.array([0.1, 0.2, 0.3]))
@@ -41,3 +41,9 @@ class ArrayDatasetTest(HomogeneousColumnTests, InterfaceTests):
         ds_sorted = Dataset(([2, 2, 1, 1], [2, 1, 2, 1], [0, 2, 1, 3]),
                             kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(ds.sort(reverse=True), ds_sorted)
+
+    def test_dataset_iloc_slice_returns_view(self):
+        ds = Dataset(np.arange(30).reshape(10, 3), kdims=['x'], vdims=['y', 'z'])
+        sliced = ds.iloc[2:8:2, ['x', 'z']]
+        self.assertTrue(np.shares_memory(sliced.data, ds.data))
+        self.assertEqual(sliced.dimension_values('z'), np.array([8, 14, 20]))
@@ -0,0 +1,84 @@
+from unittest import SkipTest
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+except:
+    raise SkipTest("Could not import pyarrow, skipping ArrowInterface tests.")
+
+from holoviews.core.data import Dataset
+
+from .base import HeterogeneousColumnTests, InterfaceTests
+
+
+class ArrowDatasetTest(HeterogeneousColumnTests, InterfaceTests):
+    """
+    Test of the ArrowInterface.
+    """
+
+    datatype = 'arrow'
+    data_type = pa.Table
+
+    def setUp(self):
+        super(ArrowDatasetTest, self).setUp()
+        self.arrow_table = pa.table({
+            'x': np.arange(6),
+            'cat': pa.array(['b', 'a', 'b', 'c', 'a', 'b']).dictionary_encode(),
+            'y': np.array([0.5, 1., 1.5, 2., 2.5, 3.])})
+
+    def test_dataset_table_construct(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        self.assertIsInstance(ds.data, pa.Table)
+        self.assertEqual(ds.vdims, ['y'])
+
+    def test_dataset_record_batch_construct(self):
+        batch = pa.RecordBatch.from_arrays([pa.array([0, 1, 2]), pa.array([3., 2., 1.])],
+                                           names=['x', 'y'])
+        ds = Dataset(batch, kdims=['x'], vdims=['y'])
+        self.assertIsInstance(ds.data, pa.Table)
+        self.assertEqual(ds.dimension_values('y'), np.array([3., 2., 1.]))
+
+    def test_dataset_values_zero_copy(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        values = ds.dimension_values('y')
+        buffer_address = self.arrow_table.column('y').chunk(0).buffers()[1].address
+        self.assertEqual(values.__array_interface__['data'][0], buffer_address)
+
+    def test_dataset_dictionary_values(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        self.assertEqual(ds.dimension_values('cat'),
+                         np.array(['b', 'a', 'b', 'c', 'a', 'b'], dtype=object))
+        self.assertEqual(ds.dimension_values('cat', expanded=False),
+                         np.array(['b', 'a', 'c'], dtype=object))
+
+    def test_dataset_dictionary_range(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        self.assertEqual(ds.range('cat'), ('a', 'c'))
+
+    def test_dataset_dictionary_select(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        self.assertEqual(ds.select(cat=['a', 'c']).dimension_values('y'),
+                         np.array([1., 2., 2.5]))
+        self.assertEqual(ds.select(cat='b').dimension_values('x'), np.array([0, 2, 5]))
+
+    def test_dataset_dictionary_groupby(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        grouped = ds.groupby('cat')
+        self.assertEqual(grouped.keys(), ['b', 'a', 'c'])
+        self.assertEqual(grouped['a'].dimension_values('y'), np.array([1., 2.5]))
+
+    def test_dataset_dictionary_sort(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        self.assertEqual(ds.sort('cat').dimension_values('x'), np.array([1, 4, 0, 2, 5, 3]))
+
+    def test_dataset_dictionary_aggregate(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        aggregated = ds.aggregate('cat', np.mean)
+        self.assertEqual(aggregated.dimension_values('cat'), np.array(['b', 'a', 'c'], dtype=object))
+        self.assertEqual(aggregated.dimension_values('y'), np.array([5/3., 1.75, 2.]))
+
+    def test_dataset_aggregate_function_without_kernel(self):
+        ds = Dataset(self.arrow_table, kdims=['x', 'cat'], vdims=['y'])
+        aggregated = ds.aggregate('cat', np.median)
+        self.assertEqual(aggregated.dimension_values('y'), np.array([1.5, 1.75, 2.]))
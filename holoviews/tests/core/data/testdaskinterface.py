@@ -1,3 +1,4 @@
+import gc
 from unittest import SkipTest
 
 import numpy as np
@@ -9,6 +10,7 @@ except:
     raise SkipTest("Could not import dask, skipping DaskInterface tests.")
 
 from holoviews.core.data import Dataset
+from holoviews.core.data.dask import DaskInterface
 
 from .testpandasinterface import PandasInterfaceTests
 
@@ -49,6 +51,9 @@ class DaskDatasetTest(PandasInterfaceTests):
     def test_dataset_sort_string_ht(self):
         raise SkipTest("Not supported")
 
+    def test_dataset_index_unsorted(self):
+        raise SkipTest("Not supported")
+
     def test_dataset_boolean_index(self):
         raise SkipTest("Not supported")
 
@@ -92,3 +97,73 @@ class DaskDatasetTest(PandasInterfaceTests):
         ds_range = ds.range(0)
         self.assertTrue(np.isnan(ds_range[0]))
         self.assertTrue(np.isnan(ds_range[1]))
+
+    def test_dataset_indexed_by_dimension(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        self.assertTrue(ds.data.known_divisions)
+        self.assertEqual(ds.interface.index_dimension(ds), 'x')
+        self.assertEqual(ds, Dataset(df, kdims=['x'], vdims=['y']))
+
+    def test_dataset_select_range_indexed_prunes_partitions(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        selected = ds.select(x=(6, 10))
+        self.assertEqual(selected.data.npartitions, 2)
+        self.assertEqual(selected.dimension_values('x'), np.arange(6., 10.))
+        self.assertEqual(selected.dimension_values('y'), np.arange(6., 10.)*2)
+
+    def test_dataset_select_scalar_indexed(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.select(x=7), 14.)
+
+    def test_dataset_range_indexed(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('x'), (0., 19.))
+        self.assertEqual(ds.select(x=(6.5, 12.5)).range('x'), (7., 12.))
+
+    def test_dataset_aggregate_indexed(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)%2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        aggregated = ds.aggregate('x', np.mean)
+        self.assertEqual(aggregated.dimension_values('y'), np.arange(20.)%2)
+
+    def test_dataset_select_persists_partitions(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        DaskInterface._persisted.clear()
+        DaskInterface.persist_partitions = 2
+        try:
+            selected = ds.select(x=(6, 12))
+            self.assertEqual(len(DaskInterface._persisted), 2)
+            self.assertEqual(selected.dimension_values('x'), np.arange(6., 12.))
+            selected = ds.select(x=(11, 16))
+            self.assertEqual(len(DaskInterface._persisted), 2)
+            self.assertEqual(selected.dimension_values('x'), np.arange(11., 16.))
+        finally:
+            DaskInterface.persist_partitions = 0
+            DaskInterface._persisted.clear()
+
+    def test_dataset_persisted_partitions_evicted(self):
+        df = pd.DataFrame({'x': np.arange(20.), 'y': np.arange(20.)*2})
+        ds = Dataset(dd.from_pandas(df.set_index('x'), 4), kdims=['x'], vdims=['y'])
+        DaskInterface._persisted.clear()
+        DaskInterface.persist_partitions = 2
+        try:
+            ds.select(x=(6, 12))
+            self.assertEqual(len(DaskInterface._persisted), 2)
+            del ds
+            gc.collect()
+            self.assertEqual(len(DaskInterface._persisted), 0)
+        finally:
+            DaskInterface.persist_partitions = 0
+            DaskInterface._persisted.clear()
+
+    def test_dataset_range_batches_dimensions(self):
+        df = pd.DataFrame({'x': np.arange(10.), 'y': np.arange(10.)*2})
+        ds = Dataset(dd.from_pandas(df, 2), kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('x'), (0., 9.))
+        self.assertEqual(ds.interface.statistics(ds)['y']['range'], (0., 18.))
+        self.assertEqual(ds.range('y'), (0., 18.))
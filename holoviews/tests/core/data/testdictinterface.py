@@ -1,11 +1,17 @@
 import sys
+from unittest import SkipTest
 
 from collections import OrderedDict
 
 import numpy as np
+import param
 
 from holoviews.core.dimension import OrderedDict as cyODict
-from holoviews.core.data import Dataset
+from holoviews.core.data import Dataset, concat
+from holoviews.core.data.dictionary import DictInterface
+from holoviews.core.data.interface import Interface, DataError
+from holoviews.core.spaces import HoloMap
+from holoviews.core.util import CategoricalArray
 
 from .base import HeterogeneousColumnTests, ScalarColumnTests, InterfaceTests
 
@@ -23,6 +29,14 @@ class DictDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
                                           kdims=['x'], vdims=['y']))
 
+    def test_dataset_concat_mixed_keys(self):
+        hmap = HoloMap([(0, Dataset({'x': [0, 1]}, kdims=['x'])),
+                        ('A', Dataset({'x': [2]}, kdims=['x']))],
+                       kdims=['i'], sort=False)
+        values = concat(hmap).dimension_values('i')
+        self.assertEqual(values.dtype, np.dtype('object'))
+        self.assertEqual(list(values), [0, 0, 'A'])
+
     def test_dataset_dataset_ht_dtypes(self):
         ds = self.table
         str_type = '<U1' if sys.version_info.major >= 3 else 'S1'
@@ -49,9 +63,151 @@ class DictDatasetTest(HeterogeneousColumnTests, ScalarColumnTests, InterfaceTest
         ds = Dataset({'x': None, 'y': [0, 1]}, kdims=['x', 'y'])
         self.assertEqual(ds.dimension_values(0), np.array([None, None]))
 
+    def test_dataset_select_sorted_returns_view(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        selected = ds.select(x=(2, 6))
+        self.assertEqual(selected.dimension_values('x'), np.arange(2, 6))
+        self.assertTrue(np.shares_memory(selected.data['x'], ds.data['x']))
+        self.assertTrue(np.shares_memory(selected.data['y'], ds.data['y']))
+
+    def test_dataset_statistics_shared_with_clone(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        ds.interface.issorted(ds, 'x')
+        clone = ds.clone()
+        self.assertEqual(clone.interface.statistics(clone), {'x': {'sorted': True}})
+
+    def test_dataset_statistics_not_shared_with_redimmed_clone(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        ds.range('y')
+        clone = ds.clone(kdims=['y'], vdims=['x'])
+        self.assertEqual(clone.interface.statistics(clone), {})
+
+    def test_dataset_statistics_reset_on_new_data(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (0, 18))
+        ds.data = OrderedDict([('x', np.arange(10)), ('y', np.arange(10)*3)])
+        self.assertEqual(ds.range('y'), (0, 27))
+
+    def test_dataset_select_preserves_sorted_statistic(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        ds.range('y')
+        selected = ds.select(x=(2, 6))
+        self.assertEqual(selected.interface.statistics(selected), {'x': {'sorted': True}})
+
     def test_dataset_ignore_non_dimensions(self):
         ds = Dataset({'x': [0, 1], 'y': [1, 2], 'ignore_scalar': 1,
                       'ignore_array': np.array([2, 3]), 'ignore_None': None},
                      kdims=['x', 'y'])
         ds2 = Dataset({'x': [0, 1], 'y': [1, 2]}, kdims=['x', 'y'])
         self.assertEqual(ds, ds2)
+
+    def test_dataset_categorical_column_init(self):
+        categorical = CategoricalArray.from_values(np.array(['B', 'A', 'B', 'C']))
+        ds = Dataset({'x': categorical, 'y': np.arange(4)}, kdims=['x'], vdims=['y'])
+        self.assertIs(ds.data['x'], categorical)
+        self.assertEqual(ds.dimension_values('x'), np.array(['B', 'A', 'B', 'C']))
+        self.assertEqual(ds.dimension_values('x', expanded=False), np.array(['B', 'A', 'C']))
+        self.assertEqual(ds.range('x'), ('A', 'C'))
+
+    def test_dataset_categorical_column_not_encoded_by_default(self):
+        values = np.array(['A', 'B', 'C', 'D'])[np.arange(20000) % 4]
+        ds = Dataset({'x': values, 'y': np.arange(20000)}, kdims=['x'], vdims=['y'])
+        self.assertIsInstance(ds.data['x'], np.ndarray)
+
+    def test_dataset_categorical_column_auto_encoded(self):
+        values = np.array(['A', 'B', 'C', 'D'])[np.arange(20000) % 4]
+        with param.logging_level('ERROR'):
+            DictInterface.categorical_length = 10000
+        try:
+            ds = Dataset({'x': values, 'y': np.arange(20000)}, kdims=['x'], vdims=['y'])
+        finally:
+            with param.logging_level('ERROR'):
+                DictInterface.categorical_length = None
+        self.assertIsInstance(ds.data['x'], CategoricalArray)
+        self.assertEqual(ds.data['x'].codes.dtype, np.dtype('uint8'))
+        self.assertEqual(ds.dimension_values('x'), values)
+
+    def test_dataset_categorical_column_high_cardinality_not_encoded(self):
+        values = np.arange(20000).astype(str)
+        with param.logging_level('ERROR'):
+            DictInterface.categorical_length = 10000
+        try:
+            ds = Dataset({'x': values, 'y': np.arange(20000)}, kdims=['x'], vdims=['y'])
+        finally:
+            with param.logging_level('ERROR'):
+                DictInterface.categorical_length = None
+        self.assertIsInstance(ds.data['x'], np.ndarray)
+
+    def test_dataset_categorical_column_select(self):
+        categorical = CategoricalArray.from_values(np.array(['B', 'A', 'B', 'C']))
+        ds = Dataset({'x': categorical, 'y': np.arange(4)}, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.select(x='B').dimension_values('y'), np.array([0, 2]))
+        self.assertEqual(ds.select(x=['A', 'C']).dimension_values('y'), np.array([1, 3]))
+        self.assertEqual(ds.select(x=('A', 'C')).dimension_values('y'), np.array([0, 1, 2]))
+        self.assertIsInstance(ds.select(x='B').data['x'], CategoricalArray)
+
+    def test_dataset_categorical_column_groupby(self):
+        categorical = CategoricalArray.from_values(np.array(['B', 'A', 'B', 'C']))
+        ds = Dataset({'x': categorical, 'y': np.arange(4)}, kdims=['x'], vdims=['y'])
+        grouped = ds.groupby('x')
+        self.assertEqual(grouped.keys(), ['B', 'A', 'C'])
+        self.assertEqual(grouped['B'].dimension_values('y'), np.array([0, 2]))
+
+    def test_dataset_categorical_column_aggregate(self):
+        categorical = CategoricalArray.from_values(np.array(['B', 'A', 'B', 'C']))
+        ds = Dataset({'x': categorical, 'y': np.arange(4)}, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.aggregate('x', np.sum),
+                         Dataset({'x': ['B', 'A', 'C'], 'y': [2, 1, 3]}, kdims=['x'], vdims=['y']))
+
+    def test_dataset_spatial_index_cached(self):
+        try:
+            import scipy # noqa (Availability import)
+        except ImportError:
+            raise SkipTest('Test requires scipy')
+        ds = Dataset({'x': [0, 1, 2, np.nan], 'y': [0, 2, 1, 3]}, kdims=['x', 'y'])
+        tree, rows = ds.interface.spatial_index(ds)
+        self.assertEqual(rows, np.array([0, 1, 2]))
+        self.assertIs(ds.clone().interface.spatial_index(ds.clone())[0], tree)
+        self.assertEqual(ds.closest([(1.5, 2.9)]), [(1, 2)])
+
+    def test_dataset_iloc_slice_returns_view(self):
+        ds = Dataset({'x': np.arange(10), 'y': np.arange(10)*2}, kdims=['x'], vdims=['y'])
+        sliced = ds.iloc[1:9:3]
+        self.assertTrue(np.shares_memory(sliced.data['y'], ds.data['y']))
+        self.assertEqual(sliced.dimension_values('y'), np.array([2, 8, 14]))
+
+    def test_dataset_dispatch_cached(self):
+        data = {'x': np.arange(3), 'y': np.arange(3)}
+        Dataset(data, kdims=['x'], vdims=['y'])
+        key = (Interface._signature(data), Dataset, ('dictionary',))
+        self.assertIs(Interface._dispatch[key], Interface.interfaces['dictionary'])
+
+    def test_dataset_dispatch_not_cached_after_failed_init(self):
+        data = (np.arange(2), np.arange(3), np.arange(6).reshape(3, 2))
+        datatype = ['dictionary', 'grid']
+        ds = Dataset(data, kdims=['x', 'y'], vdims=['z'], datatype=datatype)
+        self.assertIs(ds.interface, Interface.interfaces['grid'])
+        key = (Interface._signature(data), Dataset, tuple(datatype))
+        self.assertNotIn(key, Interface._dispatch)
+
+    def test_dataset_dispatch_cache_bounded(self):
+        size = Interface._dispatch_size
+        for i in range(size+1):
+            data = OrderedDict([('x%d' % j, np.arange(3)) for j in range(i+1)])
+            Dataset(data, kdims=list(data))
+        self.assertEqual(len(Interface._dispatch), size)
+
+    def test_dataset_clone_skips_validation(self):
+        ds = Dataset({'x': np.arange(3), 'y': np.arange(3)}, kdims=['x'], vdims=['y'])
+        interface = ds.interface
+        original = interface.__dict__['validate']
+        def validate(cls, dataset, vdims=True):
+            raise DataError('Validated')
+        interface.validate = classmethod(validate)
+        try:
+            clone = ds.clone()
+            with self.assertRaises(DataError):
+                ds.clone(vdims=[])
+        finally:
+            interface.validate = original
+        self.assertIs(clone.data, ds.data)
@@ -6,6 +6,7 @@ from unittest import SkipTest, skipIf
 
 import numpy as np
 from holoviews.core.data import Dataset
+from holoviews.core.data.grid import GridInterface
 from holoviews.core.util import pd, date_range
 from holoviews.element import Image, Curve, RGB, HSV
 
@@ -49,6 +50,18 @@ class GridInterfaceTests(GriddedInterfaceTests, HomogeneousColumnTests, Interfac
             Dataset(pd.DataFrame({'x':self.xs, 'x2':self.xs_2}),
                     kdims=['x'], vdims=['x2'])
 
+    def test_dataset_iloc_slice_rows_columnar(self):
+        ds = Dataset((np.arange(5), np.arange(5)*2), 'x', 'y')
+        sliced = ds.iloc[1:3]
+        self.assertFalse(sliced.interface.gridded)
+        self.assertEqual(sliced.dimension_values('y'), np.array([2, 4]))
+
+    def test_dataset_2d_iloc_slice_rows_columnar(self):
+        ds = Dataset(([0, 1], [0, 1, 2], np.arange(6).reshape(3, 2)), ['x', 'y'], 'z')
+        sliced = ds.iloc[1:3]
+        self.assertFalse(sliced.interface.gridded)
+        self.assertEqual(sliced.dimension_values('z'), np.array([2, 4]))
+
     def test_irregular_grid_data_values(self):
         nx, ny = 20, 5
         xs, ys = np.meshgrid(np.arange(nx)+0.5, np.arange(ny)+0.5)
@@ -267,6 +280,31 @@ class GridInterfaceTests(GriddedInterfaceTests, HomogeneousColumnTests, Interfac
         ds = Dataset((self.grid_xs, self.grid_zs[0]), 'x', 'z')
         self.assertEqual(reindexed, ds)
 
+    def test_select_slice_inverted_coords(self):
+        xs, ys = np.arange(10.), np.arange(8.)[::-1]
+        zs = np.arange(80.).reshape(8, 10)
+        ds = Dataset((xs, ys, zs), ['x', 'y'], 'z')
+        sliced = ds.select(x=(2, 5.5), y=(1, 4))
+        self.assertEqual(sliced.dimension_values('x', expanded=False), np.array([2., 3, 4, 5]))
+        self.assertEqual(sliced.dimension_values('y', expanded=False), np.array([1., 2, 3]))
+        self.assertEqual(sliced.dimension_values('z', flat=False), zs[4:7, 2:6][::-1])
+
+    def test_select_slice_shares_memory(self):
+        zs = np.arange(80.).reshape(8, 10)
+        ds = Dataset((np.arange(10.), np.arange(8.), zs), ['x', 'y'], 'z')
+        sliced = ds.select(x=(2, 6), y=(1, 4))
+        self.assertEqual(sliced.dimension_values('z', flat=False), zs[1:4, 2:6])
+        values = sliced.data['z']
+        values = getattr(values, 'values', values)
+        self.assertTrue(np.shares_memory(values, zs))
+
+    def test_slice_index_descending(self):
+        values = np.arange(10.)[::-1]
+        self.assertEqual(GridInterface.slice_index(values, (2, 5)), slice(5, 8))
+        self.assertEqual(GridInterface.slice_index(values, (None, 5)), slice(5, 10))
+        self.assertEqual(GridInterface.slice_index(values, (20, 30)), slice(0, 0))
+        self.assertIs(GridInterface.slice_index(np.array([0, 2, 1]), (0, 1)), None)
+
     def test_reindex_2d_grid_to_1d(self):
         with DatatypeContext([self.datatype, 'dictionary' , 'dataframe'], self.dataset_grid):
             ds = self.dataset_grid.reindex(kdims=['x'])
@@ -293,6 +331,13 @@ class DaskGridInterfaceTests(GridInterfaceTests):
             (self.xs, self.y_ints), [('x', 'X')], [('y', 'Y')]
         )
 
+    def test_dataset_range_batches_dask_vdims(self):
+        arr = da.from_array(np.arange(6.).reshape(2, 3), 2)
+        ds = Dataset(([0, 1, 2], [0, 1], arr, arr*2), ['x', 'y'], ['a', 'b'])
+        self.assertEqual(ds.range('a'), (0., 5.))
+        self.assertEqual(ds.interface.statistics(ds)['b']['range'], (0., 10.))
+        self.assertEqual(ds.range('b'), (0., 10.))
+
     def init_grid_data(self):
         import dask.array as da
         self.grid_xs = np.array([0, 1])
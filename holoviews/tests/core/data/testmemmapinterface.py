@@ -0,0 +1,125 @@
+import os
+import sys
+import shutil
+import tempfile
+from collections import OrderedDict
+
+import numpy as np
+import param
+
+from holoviews.core.data import Dataset, datatypes
+from holoviews.core.data.dictionary import DictInterface
+from holoviews.core.data.memmap import MemmapInterface
+from holoviews.core.dimension import OrderedDict as cyODict
+from holoviews.core.util import CategoricalArray
+
+from .base import HeterogeneousColumnTests, InterfaceTests
+
+
+class MemmapDatasetTest(HeterogeneousColumnTests, InterfaceTests):
+    """
+    Test of the memory-mapped column interface.
+    """
+
+    datatype = 'memmap'
+    data_type = (OrderedDict, cyODict)
+
+    def setUp(self):
+        super(MemmapDatasetTest, self).setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.chunk_size = MemmapInterface.chunk_size
+        with param.logging_level('ERROR'):
+            MemmapInterface.chunk_size = 3
+        np.save(os.path.join(self.tmpdir, 'x.npy'), np.arange(10))
+        np.save(os.path.join(self.tmpdir, 'y.npy'), np.linspace(0, 1, 10))
+
+    def tearDown(self):
+        super(MemmapDatasetTest, self).tearDown()
+        with param.logging_level('ERROR'):
+            MemmapInterface.chunk_size = self.chunk_size
+        shutil.rmtree(self.tmpdir)
+
+    def test_dataset_dataset_ht_dtypes(self):
+        ds = self.table
+        str_type = '<U1' if sys.version_info.major >= 3 else 'S1'
+        self.assertEqual(ds.interface.dtype(ds, 'Gender'), np.dtype(str_type))
+        self.assertEqual(ds.interface.dtype(ds, 'Age'), np.dtype(int))
+        self.assertEqual(ds.interface.dtype(ds, 'Weight'), np.dtype(int))
+        self.assertEqual(ds.interface.dtype(ds, 'Height'), np.dtype('float64'))
+
+    def test_dataset_directory_construct(self):
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        self.assertIs(ds.interface, MemmapInterface)
+        self.assertIsInstance(ds.data['x'], np.memmap)
+        self.assertEqual(ds.dimension_values('y'), np.linspace(0, 1, 10))
+
+    def test_dataset_memmap_dict_default_datatype(self):
+        columns = MemmapInterface.load(self.tmpdir)
+        ds = Dataset(columns, kdims=['x'], vdims=['y'], datatype=datatypes)
+        self.assertIs(ds.interface, MemmapInterface)
+        self.assertIsInstance(ds.data['y'], np.memmap)
+
+    def test_dataset_2d_memmap_default_datatype(self):
+        np.save(os.path.join(self.tmpdir, 'xy.npy'), np.arange(10).reshape(5, 2))
+        arr = np.load(os.path.join(self.tmpdir, 'xy.npy'), mmap_mode='r')
+        ds = Dataset(arr, kdims=['x'], vdims=['y'], datatype=datatypes)
+        self.assertIsNot(ds.interface, MemmapInterface)
+
+    def test_dataset_directory_not_applied_by_default(self):
+        self.assertFalse(MemmapInterface.applies(self.tmpdir))
+        self.assertTrue(MemmapInterface.applies(os.path.join(self.tmpdir, 'x.npy')))
+
+    def test_dataset_structured_construct_infers_dimensions(self):
+        arr = np.zeros(4, dtype=[('x', 'f8'), ('y', 'f8')])
+        arr['x'], arr['y'] = np.arange(4), np.arange(4)*2
+        path = os.path.join(self.tmpdir, 'structured.npy')
+        np.save(path, arr)
+        ds = Dataset(np.load(path, mmap_mode='r'), kdims=['x'])
+        self.assertEqual(ds.vdims, ['y'])
+        self.assertEqual(ds.dimension_values('y'), np.arange(4.)*2)
+
+    def test_dataset_string_memmap_not_encoded(self):
+        np.save(os.path.join(self.tmpdir, 'z.npy'), np.array(['A']*10))
+        def from_values(*args, **kwargs):
+            raise AssertionError('Memory-mapped column was encoded')
+        from_values_orig = CategoricalArray.__dict__['from_values']
+        CategoricalArray.from_values = staticmethod(from_values)
+        with param.logging_level('ERROR'):
+            DictInterface.categorical_length = 1
+        try:
+            ds = Dataset(self.tmpdir, kdims=['x', 'z'], vdims=['y'])
+        finally:
+            CategoricalArray.from_values = from_values_orig
+            with param.logging_level('ERROR'):
+                DictInterface.categorical_length = None
+        self.assertIsInstance(ds.data['z'], np.memmap)
+
+    def test_dataset_values_memmap_view(self):
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        self.assertTrue(np.shares_memory(ds.dimension_values('x'), ds.data['x']))
+
+    def test_dataset_select_sorted_memmap_view(self):
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        selected = ds.select(x=(2, 7))
+        self.assertIsInstance(selected.data['y'], np.memmap)
+        self.assertEqual(selected.dimension_values('x'), np.arange(2, 7))
+
+    def test_dataset_iloc_slice_memmap_view(self):
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        self.assertIsInstance(ds.iloc[1:5].data['x'], np.memmap)
+
+    def test_dataset_range_chunked(self):
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('x'), (0, 9))
+        self.assertEqual(ds.range('y'), (0, 1))
+
+    def test_dataset_range_chunked_all_nan_chunk(self):
+        ys = np.array([np.nan, np.nan, np.nan, 3., np.nan, -1.])
+        ds = Dataset({'x': np.arange(6), 'y': ys}, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (-1, 3))
+
+    def test_dataset_issorted_chunked(self):
+        ds = Dataset({'x': np.array([0, 1, 2, 1, 3, 4])}, kdims=['x'])
+        self.assertFalse(ds.interface.issorted(ds, 'x'))
+        ds = Dataset(self.tmpdir, kdims=['x'], vdims=['y'])
+        self.assertTrue(ds.interface.issorted(ds, 'x'))
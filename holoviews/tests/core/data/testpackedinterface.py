@@ -0,0 +1,152 @@
+"""
+Tests for the PackedInterface.
+"""
+
+import numpy as np
+from holoviews.core.data import PackedData, PackedInterface
+from holoviews.core.data.interface import DataError
+from holoviews.element import Path, Polygons
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class PackedInterfaceTest(ComparisonTestCase):
+    """
+    Test of the PackedInterface.
+    """
+
+    def setUp(self):
+        self.arrays = [{'x': np.arange(i, i+3), 'y': np.arange(i, i+3)*2., 'z': i}
+                       for i in range(3)]
+        self.packed = Path(self.arrays, vdims='z', datatype=['packed'])
+        self.multi = Path(self.arrays, vdims='z', datatype=['multitabular'])
+
+    def test_packed_dict_dataset(self):
+        self.assertIs(self.packed.interface, PackedInterface)
+        for i, ds in enumerate(self.packed.split()):
+            self.assertEqual(ds, Path(self.arrays[i], vdims='z', datatype=['dictionary']))
+
+    def test_packed_array_dataset(self):
+        arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2)]) for i in range(2)]
+        mds = Path(arrays, kdims=['x', 'y'], datatype=['packed'])
+        self.assertIs(mds.interface, PackedInterface)
+        for i, ds in enumerate(mds.split()):
+            self.assertEqual(ds, Path(arrays[i], kdims=['x', 'y'], datatype=['array']))
+
+    def test_packed_data_layout(self):
+        data = self.packed.data
+        self.assertEqual(data.offsets, np.array([0, 3, 6, 9]))
+        self.assertEqual(list(data.columns), ['x', 'y'])
+        self.assertEqual(data.scalars['z'], np.array([0, 1, 2]))
+
+    def test_packed_from_packed_data(self):
+        path = Path(self.packed.data, vdims='z')
+        self.assertIs(path.interface, PackedInterface)
+        self.assertEqual(path, self.multi)
+
+    def test_packed_holes_fall_back_to_multitabular(self):
+        holes = [[np.array([(0.5, 0.2), (0.7, 0.2), (0.6, 0.6)])]]
+        poly = Polygons([{'x': [0, 1, 1], 'y': [0, 0, 1], 'holes': holes}],
+                        datatype=['packed', 'multitabular'])
+        self.assertEqual(poly.interface.datatype, 'multitabular')
+
+    def test_packed_invalid_offsets(self):
+        data = PackedData({'x': np.arange(3), 'y': np.arange(3)}, [0, 2, 4])
+        with self.assertRaises(DataError):
+            Path(data, datatype=['packed'])
+
+    def test_packed_length(self):
+        self.assertEqual(len(self.packed), len(self.multi))
+        self.assertEqual(self.packed.shape, self.multi.shape)
+
+    def test_packed_length_skip_empty(self):
+        arrays = [{'x': [0, 1], 'y': [0, 1]}, {'x': [], 'y': []}, {'x': [2], 'y': [3]}]
+        packed = Path(arrays, datatype=['packed'])
+        self.assertEqual(len(packed), 4)
+        self.assertEqual(len(packed), len(packed.dimension_values('x')))
+
+    def test_packed_values(self):
+        for d in 'xyz':
+            self.assertEqual(self.packed.dimension_values(d),
+                             self.multi.dimension_values(d))
+
+    def test_packed_values_unexpanded(self):
+        for d in 'xyz':
+            self.assertEqual(self.packed.dimension_values(d, expanded=False),
+                             self.multi.dimension_values(d, expanded=False))
+
+    def test_packed_values_skip_empty(self):
+        arrays = [{'x': [0, 1], 'y': [0, 1]}, {'x': [], 'y': []}, {'x': [2], 'y': [3]}]
+        packed = Path(arrays, datatype=['packed'])
+        multi = Path(arrays, datatype=['multitabular'])
+        self.assertEqual(packed.dimension_values('x'), multi.dimension_values('x'))
+
+    def test_packed_range(self):
+        for d in 'xyz':
+            self.assertEqual(self.packed.range(d), self.multi.range(d))
+
+    def test_packed_isscalar(self):
+        self.assertTrue(self.packed.interface.isscalar(self.packed, 'z'))
+        self.assertFalse(self.packed.interface.isscalar(self.packed, 'x'))
+
+    def test_packed_isscalar_constant_column(self):
+        arrays = [{'x': [0, 1], 'y': [0, 1], 'z': [i, i]} for i in range(2)]
+        packed = Path(arrays, vdims='z', datatype=['packed'])
+        self.assertIn('z', packed.data.columns)
+        self.assertTrue(packed.interface.isscalar(packed, 'z'))
+
+    def test_packed_select_vertices(self):
+        packed = self.packed.interface.select(self.packed, x=(1, 3))
+        multi = self.multi.interface.select(self.multi, x=(1, 3))
+        self.assertEqual(self.packed.clone(packed), self.multi.clone(multi))
+
+    def test_packed_select_scalar(self):
+        packed = self.packed.clone(self.packed.interface.select(self.packed, z=1))
+        self.assertEqual(packed.data.lengths, np.array([0, 3, 0]))
+        self.assertEqual(packed.dimension_values('x'), np.array([1, 2, 3]))
+
+    def test_packed_select_paths(self):
+        data = self.packed.interface.select_paths(self.packed, [2, 0])
+        self.assertEqual(data.offsets, np.array([0, 3, 6]))
+        self.assertEqual(data.columns['x'], np.array([2, 3, 4, 0, 1, 2]))
+        self.assertEqual(data.scalars['z'], np.array([2, 0]))
+
+    def test_packed_split_slice(self):
+        paths = self.packed.split(1)
+        self.assertEqual(len(paths), 2)
+        self.assertEqual(paths[0], Path(self.arrays[1], vdims='z', datatype=['dictionary']))
+
+    def test_packed_split_columns_views(self):
+        columns = self.packed.split(datatype='columns', dimensions=['x', 'y'])
+        self.assertEqual(len(columns), 3)
+        for i, cols in enumerate(columns):
+            self.assertEqual(cols['x'], self.arrays[i]['x'])
+            self.assertTrue(np.shares_memory(cols['x'], self.packed.data.columns['x']))
+
+    def test_packed_split_array(self):
+        arrays = self.packed.split(datatype='array', dimensions=['x', 'y'])
+        for packed, multi in zip(arrays, self.multi.split(datatype='array', dimensions=['x', 'y'])):
+            self.assertEqual(packed, multi)
+
+    def test_packed_groupby(self):
+        grouped = self.packed.groupby('z')
+        self.assertEqual(grouped.keys(), [0, 1, 2])
+        self.assertIs(grouped[1].interface, PackedInterface)
+        self.assertEqual(grouped[1].dimension_values('x'), np.array([1, 2, 3]))
+
+    def test_packed_add_dimension_scalar(self):
+        mds = self.packed.add_dimension('A', 0, 'Scalar', True)
+        for i, ds in enumerate(mds.split()):
+            self.assertEqual(ds, Path(dict(self.arrays[i], A='Scalar'), ['x', 'y'],
+                                      ['A', 'z'], datatype=['dictionary']))
+
+    def test_packed_add_dimension_values(self):
+        mds = self.packed.add_dimension('A', 0, [3, 4, 5], True)
+        self.assertEqual(mds.data.scalars['A'], np.array([3, 4, 5]))
+
+    def test_packed_redim(self):
+        redimmed = self.packed.redim(x='a')
+        self.assertEqual(redimmed.dimension_values('a'), self.multi.dimension_values('x'))
+
+    def test_packed_unpack_paths(self):
+        path = Path([self.packed, self.packed], vdims='z')
+        self.assertEqual(len(path.split()), 6)
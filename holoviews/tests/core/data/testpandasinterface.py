@@ -8,8 +8,8 @@ except:
     raise SkipTest("Could not import pandas, skipping PandasInterface tests.")
 
 from holoviews.core.dimension import Dimension
-from holoviews.core.data import Dataset
-from holoviews.core.data.interface import DataError
+from holoviews.core.data import Dataset, concat
+from holoviews.core.data.interface import DataError, Interface
 from holoviews.core.spaces import HoloMap
 from holoviews.element import Scatter, Points, Distribution
 
@@ -25,6 +25,29 @@ class PandasInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
     datatype = 'dataframe'
     data_type = pd.DataFrame
 
+    def test_dataset_concat_datetime_keys(self):
+        dates = pd.date_range('2020-01-01', periods=2)
+        hmap = HoloMap([(d, Dataset({'x': [0, 1]}, kdims=['x'])) for d in dates],
+                       kdims=['t'])
+        concatenated = concat(hmap)
+        self.assertEqual(concatenated.data['t'].dtype.kind, 'M')
+        self.assertEqual(concatenated.dimension_values('t'), np.repeat(dates.values, 2))
+
+    def test_holomap_dframe_datetime_keys(self):
+        dates = pd.date_range('2020-01-01', periods=2)
+        hmap = HoloMap([(d, Scatter([0, 1])) for d in dates], kdims=['t'])
+        self.assertEqual(hmap.dframe()['t'].dtype.kind, 'M')
+
+    def test_dataset_dispatch_independent_of_earlier_data(self):
+        datatype = ['dataframe', 'dictionary']
+        data = (np.arange(3), np.arange(3))
+        ds = Dataset(data, 'x', 'y', datatype=datatype)
+        self.assertIs(ds.interface, Interface.interfaces['dataframe'])
+        ds = Dataset((np.arange(3), np.array([1.])), 'x', 'y', datatype=datatype)
+        self.assertIs(ds.interface, Interface.interfaces['dictionary'])
+        ds = Dataset(data, 'x', 'y', datatype=datatype)
+        self.assertIs(ds.interface, Interface.interfaces['dataframe'])
+
     def test_dataset_empty_list_init_dtypes(self):
         dataset = Dataset([], kdims=['x'], vdims=['y'])
         for d in 'xy':
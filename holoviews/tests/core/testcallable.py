@@ -4,11 +4,18 @@ Unit tests of the Callable object that wraps user callbacks. Also test
 how DynamicMap validates and invokes Callable based on its signature.
 """
 import param
+import shutil
 import sys
+import tempfile
+import threading
+from unittest import SkipTest
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.element import Scatter
 from holoviews import streams
-from holoviews.core.spaces import Callable, Generator, DynamicMap
+from holoviews.core import util
+from holoviews.core.spaces import (
+    Callable, Generator, DynamicMap, CallbackPending, defer_callbacks
+)
 from holoviews.core.operation import OperationCallable
 from holoviews.operation import contours
 from functools import partial
@@ -37,6 +44,13 @@ class ParamFunc(param.ParameterizedFunction):
         return a * p.b
 
 
+disk_cache_calls = []
+
+def disk_cached_fn(x, y=1):
+    disk_cache_calls.append((x, y))
+    return Scatter([(x, y)])
+
+
 class TestCallableName(ComparisonTestCase):
 
     def test_simple_function_name(self):
@@ -366,3 +380,227 @@ class TestDynamicMapInvocation(ComparisonTestCase):
         self.assertEqual(dmap['Test'], Scatter([(1, 2)], label='Test'))
 
 
+class TestCallableMemoize(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def fn(x):
+            self.calls.append(x)
+            return Scatter([(x, x)])
+        self.fn = fn
+
+    def test_callable_memoize_last_value(self):
+        callable_obj = Callable(self.fn)
+        callable_obj(1), callable_obj(2), callable_obj(1)
+        self.assertEqual(self.calls, [1, 2, 1])
+
+    def test_callable_memoize_toggle(self):
+        callable_obj = Callable(self.fn, memoize_size=2)
+        callable_obj(1), callable_obj(2), callable_obj(1), callable_obj(2)
+        self.assertEqual(self.calls, [1, 2])
+        info = callable_obj.memoize_info
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(info['misses'], 2)
+        self.assertEqual(info['entries'], 2)
+
+    def test_callable_memoize_lru_eviction(self):
+        callable_obj = Callable(self.fn, memoize_size=2)
+        callable_obj(1), callable_obj(2), callable_obj(1), callable_obj(3)
+        callable_obj(1), callable_obj(2)
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_callable_memoize_disabled(self):
+        callable_obj = Callable(self.fn, memoize=False, memoize_size=2)
+        callable_obj(1), callable_obj(1)
+        self.assertEqual(self.calls, [1, 1])
+        self.assertEqual(callable_obj.memoize_info['hits'], 0)
+
+    def test_callable_memoize_invalidated_by_input_change(self):
+        dmap = DynamicMap(lambda x: Scatter([(x, x)]), kdims=['x'])
+        callable_obj = Callable(self.fn, inputs=[dmap], memoize_size=2)
+        callable_obj(1)
+        with util.disable_constant(dmap):
+            dmap.callback = Callable(lambda x: Scatter([(x, -x)]))
+        callable_obj(1)
+        self.assertEqual(self.calls, [1, 1])
+
+
+class TestCallableDiskCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        disk_cache_calls[:] = []
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_callable_disk_cache_shared_between_callables(self):
+        self.assertEqual(Callable(disk_cached_fn, disk_cache=self.path)(1), Scatter([(1, 1)]))
+        self.assertEqual(Callable(disk_cached_fn, disk_cache=self.path)(1), Scatter([(1, 1)]))
+        self.assertEqual(disk_cache_calls, [(1, 1)])
+
+    def test_callable_disk_cache_distinguishes_kwargs(self):
+        Callable(disk_cached_fn, disk_cache=self.path)(1, y=2)
+        Callable(disk_cached_fn, disk_cache=self.path)(1, y=3)
+        self.assertEqual(disk_cache_calls, [(1, 2), (1, 3)])
+
+    def test_dynamicmap_disk_cache_shared_between_dynamicmaps(self):
+        xy = streams.PointerY(y=2)
+        dmap1 = DynamicMap(disk_cached_fn, kdims=['x'], streams=[xy], disk_cache=self.path)
+        dmap2 = DynamicMap(disk_cached_fn, kdims=['x'], streams=[xy], disk_cache=self.path)
+        self.assertEqual(dmap1[1], Scatter([(1, 2)]))
+        self.assertEqual(dmap2[1], Scatter([(1, 2)]))
+        self.assertEqual(disk_cache_calls, [(1, 2)])
+        xy.event(y=3)
+        self.assertEqual(dmap2[1], Scatter([(1, 3)]))
+        self.assertEqual(disk_cache_calls, [(1, 2), (1, 3)])
+
+
+class TestCallableAwaitable(ComparisonTestCase):
+
+    def setUp(self):
+        try:
+            import asyncio
+        except ImportError:
+            raise SkipTest('Awaitable callbacks require asyncio')
+        self.asyncio = asyncio
+        self.calls = []
+        def fn(x):
+            self.calls.append(x)
+            return asyncio.sleep(0.01, result=Scatter([(x, x)]))
+        self.fn = fn
+
+    def test_callable_awaitable_resolved(self):
+        self.assertEqual(Callable(self.fn)(1), Scatter([(1, 1)]))
+
+    def test_callable_awaitable_resolved_in_running_loop(self):
+        callable_obj = Callable(self.fn)
+        loop = self.asyncio.new_event_loop()
+        results = []
+        loop.call_soon(lambda: results.append(callable_obj(1)))
+        loop.run_until_complete(self.asyncio.sleep(0.05))
+        loop.close()
+        self.assertEqual(results, [Scatter([(1, 1)])])
+
+    def test_callable_awaitable_deferred(self):
+        callable_obj = Callable(self.fn)
+        loop = self.asyncio.new_event_loop()
+        futures = []
+        def run():
+            with defer_callbacks():
+                try:
+                    callable_obj(1)
+                except CallbackPending as e:
+                    futures.append(e.future)
+        loop.call_soon(run)
+        loop.run_until_complete(self.asyncio.sleep(0.05))
+        loop.close()
+        self.assertEqual(len(futures), 1)
+        self.assertEqual(callable_obj(1), Scatter([(1, 1)]))
+        self.assertEqual(self.calls, [1])
+
+    def test_callable_awaitable_superseded_cancelled(self):
+        callable_obj = Callable(self.fn)
+        loop = self.asyncio.new_event_loop()
+        futures = []
+        def run(x):
+            with defer_callbacks():
+                try:
+                    callable_obj(x)
+                except CallbackPending as e:
+                    futures.append(e.future)
+        loop.call_soon(run, 1)
+        loop.call_soon(run, 2)
+        loop.run_until_complete(self.asyncio.sleep(0.05))
+        loop.close()
+        self.assertTrue(futures[0].cancelled())
+        self.assertEqual(callable_obj(2), Scatter([(2, 2)]))
+        self.assertEqual(self.calls, [1, 2])
+
+
+class TestCallableExecutor(ComparisonTestCase):
+
+    def setUp(self):
+        try:
+            import asyncio
+            from concurrent.futures import ThreadPoolExecutor
+        except ImportError:
+            raise SkipTest('Executor callbacks require asyncio and concurrent.futures')
+        self.asyncio = asyncio
+        self.executor = ThreadPoolExecutor(1)
+        self.calls = []
+        def fn(x):
+            self.calls.append(x)
+            return Scatter([(x, x)])
+        self.fn = fn
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _deferred_calls(self, callable_obj, args, on_deferred=None):
+        """
+        Makes a deferred call for each argument on a running event
+        loop, returning the futures once they have completed.
+        """
+        loop = self.asyncio.new_event_loop()
+        futures = []
+        def run():
+            for arg in args:
+                with defer_callbacks():
+                    try:
+                        callable_obj(arg)
+                    except CallbackPending as e:
+                        futures.append(e.future)
+            if on_deferred is not None:
+                on_deferred()
+        loop.call_soon(run)
+        loop.run_until_complete(self.asyncio.sleep(0))
+        if futures:
+            loop.run_until_complete(self.asyncio.wait(futures))
+        loop.close()
+        return futures
+
+    def test_callable_executor_not_deferred(self):
+        callable_obj = Callable(self.fn, executor=self.executor)
+        self.assertEqual(callable_obj(1), Scatter([(1, 1)]))
+
+    def test_callable_executor_deferred(self):
+        callable_obj = Callable(self.fn, executor=self.executor)
+        futures = self._deferred_calls(callable_obj, [1])
+        self.assertEqual(len(futures), 1)
+        self.assertEqual(callable_obj(1), Scatter([(1, 1)]))
+        self.assertEqual(self.calls, [1])
+
+    def test_callable_executor_deferred_without_event_loop(self):
+        threads = []
+        def fn(x):
+            threads.append(threading.current_thread())
+            return Scatter([(x, x)])
+        callable_obj = Callable(fn, executor=self.executor)
+        with defer_callbacks():
+            self.assertEqual(callable_obj(1), Scatter([(1, 1)]))
+        self.assertIsNot(threads[0], threading.current_thread())
+
+    def test_callable_executor_coalesces_requests(self):
+        callable_obj = Callable(self.fn, executor=self.executor)
+        blocker = threading.Event()
+        self.executor.submit(blocker.wait, 5)
+        futures = self._deferred_calls(callable_obj, range(3), blocker.set)
+        self.assertTrue(futures[0].cancelled())
+        self.assertTrue(futures[1].cancelled())
+        self.assertEqual(callable_obj(2), Scatter([(2, 2)]))
+        self.assertEqual(self.calls, [2])
+
+    def test_defer_callbacks_thread_local(self):
+        callable_obj = Callable(self.fn, executor=self.executor)
+        deferred = []
+        with defer_callbacks():
+            thread = threading.Thread(target=lambda: deferred.append(callable_obj._defer))
+            thread.start()
+            thread.join()
+            self.assertTrue(callable_obj._defer)
+        self.assertEqual(deferred, [False])
+
+    def test_dynamicmap_executor_passed_to_callable(self):
+        dmap = DynamicMap(self.fn, kdims=['x'], executor=self.executor)
+        self.assertIs(dmap.callback.executor, self.executor)
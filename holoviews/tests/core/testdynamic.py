@@ -1,11 +1,15 @@
 import uuid
 import time
+import threading
 from collections import deque
 
 import param
 import numpy as np
 from holoviews import Dimension, NdLayout, GridSpace, Layout, NdOverlay
-from holoviews.core.spaces import DynamicMap, HoloMap, Callable
+from holoviews.core.spaces import (
+    DynamicMap, HoloMap, Callable, CachePolicy, LRUCachePolicy, Prefetcher,
+    defer_callbacks
+)
 from holoviews.core.options import Store
 from holoviews.element import Image, Scatter, Curve, Text, Points
 from holoviews.operation import histogram
@@ -688,6 +692,175 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+class DynamicMapCachePolicy(ComparisonTestCase):
+
+    def test_dynamic_cache_lru_eviction(self):
+        dmap = DynamicMap(lambda x: Curve([(0, x)]), kdims=['x'], cache_size=2)
+        dmap[0], dmap[1], dmap[0], dmap[2]
+        self.assertEqual(list(dmap.keys()), [0, 2])
+
+    def test_dynamic_cache_fifo_eviction(self):
+        dmap = DynamicMap(lambda x: Curve([(0, x)]), kdims=['x'], cache_size=2,
+                          cache_policy=CachePolicy())
+        dmap[0], dmap[1], dmap[0], dmap[2]
+        self.assertEqual(list(dmap.keys()), [1, 2])
+
+    def test_dynamic_cache_max_bytes(self):
+        policy = LRUCachePolicy(max_bytes=2000)
+        dmap = DynamicMap(lambda x: Image(np.full((10, 10), x, dtype='float64')),
+                          kdims=['x'], cache_policy=policy)
+        for i in range(5):
+            dmap[i]
+        self.assertEqual(list(dmap.keys()), [3, 4])
+        self.assertEqual(dmap.cache_info['nbytes'], 1600)
+
+    def test_dynamic_cache_keeps_latest_over_budget(self):
+        policy = LRUCachePolicy(max_bytes=100)
+        dmap = DynamicMap(lambda x: Image(np.full((10, 10), x, dtype='float64')),
+                          kdims=['x'], cache_policy=policy)
+        dmap[0], dmap[1]
+        self.assertEqual(list(dmap.keys()), [1])
+
+    def test_dynamic_cache_hits_and_misses(self):
+        dmap = DynamicMap(lambda x: Curve([(0, x)]), kdims=['x'])
+        dmap[0], dmap[0], dmap[1], dmap[0]
+        info = dmap.cache_info
+        self.assertEqual(info['hits'], 2)
+        self.assertEqual(info['misses'], 2)
+        self.assertEqual(info['entries'], 2)
+        dmap.reset()
+        self.assertEqual(dmap.cache_info['hits'], 0)
+        self.assertEqual(dmap.cache_info['entries'], 0)
+
+    def test_dynamic_cache_policy_not_shared_by_clone(self):
+        dmap = DynamicMap(lambda x: Curve([(0, x)]), kdims=['x'])
+        dmap[0]
+        clone = dmap.clone()
+        clone[1]
+        self.assertIsNot(clone.cache_policy, dmap.cache_policy)
+        self.assertEqual(dmap.cache_info['misses'], 1)
+        self.assertEqual(len(dmap), 1)
+        self.assertEqual(len(clone), 2)
+
+
+class DynamicMapPrefetch(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def fn(x):
+            self.calls.append(x)
+            return Image(np.full((10, 10), x, dtype='float64'))
+        self.fn = fn
+
+    def _wait(self, dmap):
+        prefetcher = dmap._prefetcher
+        for _ in range(500):
+            with prefetcher._condition:
+                if not prefetcher._running:
+                    return
+            time.sleep(0.01)
+
+    def test_prefetch_neighbours_range(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', range=(0, 10))], prefetch=2)
+        self.assertEqual(Prefetcher(dmap).neighbours((5,)), [(6,), (4,), (7,), (3,)])
+
+    def test_prefetch_neighbours_range_bounds(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', range=(0, 10))], prefetch=2)
+        self.assertEqual(Prefetcher(dmap).neighbours((10,)), [(9,), (8,)])
+
+    def test_prefetch_neighbours_values(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', values=[3, 1, 2, 4])], prefetch=2)
+        self.assertEqual(Prefetcher(dmap).neighbours((2,)), [(3,), (1,), (4,)])
+
+    def test_prefetch_neighbours_unbounded(self):
+        dmap = DynamicMap(self.fn, kdims=['x'], prefetch=2)
+        self.assertEqual(Prefetcher(dmap).neighbours((2.5,)), [])
+
+    def test_prefetch_neighbours_active_dimension(self):
+        fn = lambda x, y: Curve([(x, y)])
+        kdims = [Dimension('x', range=(0, 10)), Dimension('y', range=(0, 10))]
+        prefetcher = Prefetcher(DynamicMap(fn, kdims=kdims, prefetch=1))
+        prefetcher.neighbours((2, 2))
+        self.assertEqual(prefetcher.neighbours((2, 3)), [(2, 4), (2, 2)])
+
+    def test_prefetch_populates_cache(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', values=list(range(5)))], prefetch=1)
+        dmap[2]
+        self._wait(dmap)
+        self.assertEqual(dmap[3], Image(np.full((10, 10), 3, dtype='float64')))
+        self._wait(dmap)
+        self.assertEqual(sorted(self.calls), [1, 2, 3, 4])
+        self.assertEqual(dmap.cache_info['hits'], 1)
+
+    def test_prefetch_respects_memory_budget(self):
+        policy = LRUCachePolicy(max_bytes=100)
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', values=list(range(5)))],
+                          prefetch=1, cache_policy=policy)
+        dmap[2]
+        self._wait(dmap)
+        self.assertEqual(dmap._prefetcher.take(), [])
+
+    def test_prefetch_restarts_after_completion(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', values=list(range(10)))], prefetch=1)
+        dmap[2]
+        self._wait(dmap)
+        dmap[3]
+        dmap[4]
+        self._wait(dmap)
+        self.assertEqual(sorted(self.calls), [1, 2, 3, 4, 5])
+
+    def test_prefetch_request_drops_queued_keys(self):
+        started, release = threading.Event(), threading.Event()
+        def fn(x):
+            self.calls.append(x)
+            if x == 6:
+                started.set()
+                release.wait(5)
+            return Image(np.full((10, 10), x, dtype='float64'))
+        dmap = DynamicMap(fn, kdims=[Dimension('x', values=list(range(10)))], prefetch=2)
+        dmap[5]
+        self.assertTrue(started.wait(5))
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        dmap[0]
+        timer.join()
+        self._wait(dmap)
+        self.assertEqual(self.calls, [5, 6, 0, 1, 2])
+
+    def test_prefetch_cross_product_callbacks_never_overlap(self):
+        lock, active, overlaps = threading.Lock(), [0], []
+        def fn(x):
+            with lock:
+                active[0] += 1
+                overlaps.append(active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+            return Image(np.full((10, 10), x, dtype='float64'))
+        dmap = DynamicMap(fn, kdims=[Dimension('x', range=(0, 20))], prefetch=5)
+        dmap[0]
+        dmap[[10, 11, 12]]
+        self._wait(dmap)
+        self.assertEqual(max(overlaps), 1)
+
+    def test_prefetch_not_deferred(self):
+        deferred = {}
+        def fn(x):
+            deferred[x] = getattr(Callable._deferral, 'active', False)
+            return Image(np.full((10, 10), x, dtype='float64'))
+        dmap = DynamicMap(fn, kdims=[Dimension('x', values=list(range(5)))], prefetch=1)
+        with defer_callbacks():
+            dmap[2]
+            self._wait(dmap)
+        self.assertEqual(deferred, {1: False, 2: True, 3: False})
+
+    def test_prefetch_disabled_by_default(self):
+        dmap = DynamicMap(self.fn, kdims=[Dimension('x', values=list(range(5)))])
+        dmap[2]
+        self.assertIs(dmap._prefetcher, None)
+        self.assertEqual(self.calls, [2])
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
@@ -3,9 +3,13 @@ Unit test of the (non-rendering) exporters and importers.
 """
 
 import os
+import shutil
+import tempfile
+from unittest import SkipTest
+
 import numpy as np
 from holoviews import Image, Layout
-from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer
+from holoviews.core.io import Serializer, Pickler, Unpickler, Deserializer, DiskCache
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -187,3 +191,63 @@ class TestPicklerAdvanced(ComparisonTestCase):
                                 entries=['Image.I(L)'])
         self.assertEqual(single_layout, loaded)
 
+
+class TestDiskCache(ComparisonTestCase):
+    """
+    Test the DiskCache used to persist objects between sessions.
+    """
+
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+        self.image1 = Image(np.array([[1,2],[4,5]]))
+        self.image2 = Image(np.array([[5,4],[3,2]]))
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_disk_cache_set_and_get(self):
+        cache = DiskCache(path=self.path)
+        cache.set('a', self.image1)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.get('a'), self.image1)
+
+    def test_disk_cache_default_path_private(self):
+        if os.name == 'nt':
+            raise SkipTest('Directory permissions are not supported on Windows')
+        cache_home = os.environ.get('XDG_CACHE_HOME')
+        os.environ['XDG_CACHE_HOME'] = self.path
+        try:
+            cache = DiskCache()
+        finally:
+            if cache_home is None:
+                del os.environ['XDG_CACHE_HOME']
+            else:
+                os.environ['XDG_CACHE_HOME'] = cache_home
+        self.assertEqual(cache.path, os.path.join(self.path, 'holoviews'))
+        self.assertEqual(os.stat(cache.path).st_mode & 0o777, 0o700)
+
+    def test_disk_cache_get_missing(self):
+        cache = DiskCache(path=self.path)
+        self.assertIs(cache.get('a'), None)
+        self.assertEqual(cache.get('a', 'default'), 'default')
+
+    def test_disk_cache_shared_between_instances(self):
+        DiskCache(path=self.path).set('a', self.image1)
+        self.assertEqual(DiskCache(path=self.path).get('a'), self.image1)
+
+    def test_disk_cache_evicts_least_recently_used(self):
+        cache = DiskCache(path=self.path, max_bytes=None)
+        cache.set('a', self.image1)
+        cache.set('b', self.image2)
+        os.utime(os.path.join(self.path, 'a.hvc'), (0, 0))
+        cache.max_bytes = cache.nbytes-1
+        cache.evict()
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        self.assertEqual(len(cache), 1)
+
+    def test_disk_cache_clear(self):
+        cache = DiskCache(path=self.path)
+        cache.set('a', self.image1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
@@ -19,7 +19,8 @@ from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
     deephash, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range, tree_attribute
+    dimension_range, tree_attribute, factorize, group_indices, group_reduce,
+    concat_arrays, describe_array, stable_hash, repeat_keys
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -141,6 +142,41 @@ class TestDeepHash(ComparisonTestCase):
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
 
+class TestStableHash(ComparisonTestCase):
+    """
+    Tests of stable_hash function used for persistent caching.
+    """
+
+    def test_stable_hash_nested_equality(self):
+        obj1 = [[1,2], (3, 'a'), set(['b', 'c']), {'a': 9.2}, np.array([1,2,3])]
+        obj2 = [[1,2], (3, 'a'), set(['c', 'b']), {'a': 9.2}, np.array([1,2,3])]
+        self.assertEqual(stable_hash(obj1), stable_hash(obj2))
+
+    def test_stable_hash_numpy_inequality(self):
+        self.assertNotEqual(stable_hash(np.array([1,2,3])),
+                            stable_hash(np.array([1,2,4])))
+
+    def test_stable_hash_numpy_dtype_inequality(self):
+        self.assertNotEqual(stable_hash(np.array([1,2,3], dtype='int32')),
+                            stable_hash(np.array([1,2,3], dtype='int64')))
+
+    def test_stable_hash_function_closure(self):
+        def make_fn(offset):
+            return lambda x: x+offset
+        self.assertEqual(stable_hash(make_fn(1)), stable_hash(make_fn(1)))
+        self.assertNotEqual(stable_hash(make_fn(1)), stable_hash(make_fn(2)))
+
+    def test_stable_hash_function_code(self):
+        self.assertNotEqual(stable_hash(lambda x: x+1), stable_hash(lambda x: x-1))
+
+    def test_stable_hash_element_data(self):
+        self.assertEqual(stable_hash(Element([1, 2])), stable_hash(Element([1, 2])))
+        self.assertNotEqual(stable_hash(Element([1, 2])), stable_hash(Element([1, 3])))
+
+    def test_stable_hash_unsupported_object(self):
+        self.assertIs(stable_hash([1, object()]), None)
+
+
 class TestAllowablePrefix(ComparisonTestCase):
     """
     Tests of allowable and hasprefix method.
@@ -826,6 +862,143 @@ class TestCrossIndex(ComparisonTestCase):
         self.assertEqual(cross_index(values, 500001), ('D', 423, 'c', '1'))
 
 
+class TestGroupIndices(ComparisonTestCase):
+
+    def test_factorize_first_occurrence_order(self):
+        codes, uniques = factorize(np.array([3, 1, 3, 2, 1]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2, 1]))
+        self.assertEqual(uniques, np.array([3, 1, 2]))
+
+    def test_factorize_strings(self):
+        codes, uniques = factorize(np.array(['B', 'A', 'B']))
+        self.assertEqual(codes, np.array([0, 1, 0]))
+        self.assertEqual(uniques, np.array(['B', 'A']))
+
+    def test_factorize_unorderable_objects(self):
+        codes, uniques = factorize(np.array(['B', 1, 'B', None], dtype=object))
+        self.assertEqual(codes, np.array([0, 1, 0, 2]))
+        self.assertEqual(list(uniques), ['B', 1, None])
+
+    def test_group_indices_single_array(self):
+        keys, indices = group_indices([np.array(['M', 'F', 'M', 'F', 'X'])])
+        self.assertEqual(keys, [('M',), ('F',), ('X',)])
+        self.assertEqual(indices[0], np.array([0, 2]))
+        self.assertEqual(indices[1], np.array([1, 3]))
+        self.assertEqual(indices[2], np.array([4]))
+
+    def test_group_indices_multiple_arrays(self):
+        keys, indices = group_indices([np.array([1, 0, 1, 1]),
+                                       np.array(['A', 'A', 'B', 'A'])])
+        self.assertEqual(keys, [(1, 'A'), (0, 'A'), (1, 'B')])
+        self.assertEqual(indices[0], np.array([0, 3]))
+        self.assertEqual(indices[1], np.array([1]))
+        self.assertEqual(indices[2], np.array([2]))
+
+    def test_group_indices_empty(self):
+        self.assertEqual(group_indices([np.array([])]), ([], []))
+
+
+class TestConcatArrays(ComparisonTestCase):
+
+    def test_concat_arrays_promotes_dtype(self):
+        concatenated = concat_arrays([np.array([0, 1]), np.array([2.5])])
+        self.assertEqual(concatenated, np.array([0, 1, 2.5]))
+
+    def test_concat_arrays_broadcasts_scalars(self):
+        concatenated = concat_arrays([np.array([0, 1]), 3], [2, 3])
+        self.assertEqual(concatenated, np.array([0, 1, 3, 3, 3]))
+
+    def test_concat_arrays_strings(self):
+        concatenated = concat_arrays([np.array(['A']), np.array(['BC', 'D'])])
+        self.assertEqual(concatenated, np.array(['A', 'BC', 'D']))
+
+
+class TestDescribeArray(ComparisonTestCase):
+
+    def test_describe_array_single_chunk(self):
+        values = np.array([3., 1., np.nan, 4., 2.])
+        summary = describe_array(values)
+        self.assertEqual(list(summary.items()),
+                         [('count', 5), ('nancount', 1), ('min', 1.), ('max', 4.),
+                          ('mean', 2.5), ('var', 1.25), ('25%', 1.75), ('50%', 2.5),
+                          ('75%', 3.25)])
+
+    def test_describe_array_chunked_moments(self):
+        values = np.random.rand(1000)
+        summary = describe_array(values, quantiles=(), chunksize=64)
+        self.assertEqual(summary['min'], values.min())
+        self.assertEqual(summary['max'], values.max())
+        self.assertAlmostEqual(summary['mean'], values.mean())
+        self.assertAlmostEqual(summary['var'], values.var())
+
+    def test_describe_array_datetimes(self):
+        values = np.array(['2018-01-01', 'NaT', '2018-01-03'], dtype='datetime64[D]')
+        summary = describe_array(values, quantiles=(0.5,))
+        self.assertEqual(summary['nancount'], 1)
+        self.assertEqual(summary['min'], np.datetime64('2018-01-01'))
+        self.assertEqual(summary['50%'], np.datetime64('2018-01-02'))
+
+    def test_describe_array_strings(self):
+        self.assertIs(describe_array(np.array(['A', 'B'])), None)
+
+
+class TestRepeatKeys(ComparisonTestCase):
+
+    def test_repeat_keys(self):
+        self.assertEqual(repeat_keys([1, 2], [2, 1]), np.array([1, 1, 2]))
+
+    def test_repeat_keys_mixed_types(self):
+        repeated = repeat_keys([1, 'A'], [1, 2])
+        self.assertEqual(repeated.dtype, np.dtype('object'))
+        self.assertEqual(list(repeated), [1, 'A', 'A'])
+
+
+class TestGroupReduce(ComparisonTestCase):
+
+    def setUp(self):
+        self.values = np.array([1., 4., 2., np.nan, 6.])
+        self.codes = np.array([0, 1, 0, 1, 2])
+
+    def test_group_reduce_mean(self):
+        self.assertEqual(group_reduce(self.values, self.codes, 3, np.mean),
+                         np.array([1.5, np.nan, 6.]))
+
+    def test_group_reduce_nanmean(self):
+        self.assertEqual(group_reduce(self.values, self.codes, 3, 'nanmean'),
+                         np.array([1.5, 4., 6.]))
+
+    def test_group_reduce_std(self):
+        self.assertEqual(group_reduce(self.values[:3], self.codes[:3], 2, 'std'),
+                         np.array([0.5, 0.]))
+
+    def test_group_reduce_count(self):
+        self.assertEqual(group_reduce(self.values, self.codes, 3, len),
+                         np.array([2, 2, 1]))
+
+    def test_group_reduce_int_sum(self):
+        reduced = group_reduce(np.array([1, 2, 3]), np.array([1, 0, 1]), 2, np.sum)
+        self.assertEqual(reduced, np.array([2, 4]))
+        self.assertEqual(reduced.dtype.kind, 'i')
+
+    def test_group_reduce_int_sum_precision(self):
+        values = np.array([2**53, 1, 1, 5], dtype='int64')
+        reduced = group_reduce(values, np.array([0, 0, 0, 1]), 2, 'nansum')
+        self.assertEqual(reduced, np.array([2**53+2, 5]))
+        self.assertEqual(reduced.dtype, np.dtype('int64'))
+
+    def test_group_reduce_min_max(self):
+        values, codes = np.array([3, 1, 2, 5]), np.array([0, 1, 0, 1])
+        self.assertEqual(group_reduce(values, codes, 2, np.min), np.array([2, 1]))
+        self.assertEqual(group_reduce(values, codes, 2, 'max'), np.array([3, 5]))
+
+    def test_group_reduce_unknown_function(self):
+        self.assertIs(group_reduce(self.values, self.codes, 3, np.median), None)
+
+    def test_group_reduce_strings(self):
+        values = np.array(['A', 'B', 'C'])
+        self.assertIs(group_reduce(values, np.array([0, 0, 1]), 2, 'min'), None)
+
+
 class TestClosestMatch(ComparisonTestCase):
 
     def test_complete_match_overlay(self):
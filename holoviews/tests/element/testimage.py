@@ -1,6 +1,10 @@
 """
 Unit tests of Image elements
 """
+import gc
+import os
+import shutil
+import tempfile
 
 import numpy as np
 import holoviews as hv
@@ -83,3 +87,65 @@ class TestImage(LoggingComparisonTestCase):
         Z = np.sqrt(X**2 + Y**2) * np.cos(X)
         with self.assertRaises(ValueError):
             Image((X, Y, Z))
+
+    def test_image_pyramid_level_mean(self):
+        img = Image(np.arange(16.).reshape(4, 4), bounds=(0, 0, 4, 4), pyramid='mean')
+        level = img.pyramid_level(1)
+        self.assertEqual(level.bounds.lbrt(), (0, 0, 4, 4))
+        self.assertEqual(level.dimension_values(2, flat=False),
+                         np.array([[10.5, 12.5], [2.5, 4.5]]))
+
+    def test_image_pyramid_level_max(self):
+        img = Image(np.arange(16).reshape(4, 4), bounds=(0, 0, 4, 4), pyramid='max')
+        self.assertEqual(img.pyramid_level(1).dimension_values(2, flat=False),
+                         np.array([[13, 15], [5, 7]]))
+
+    def test_image_pyramid_levels_shared_between_clones(self):
+        img = Image(np.random.rand(64, 32), pyramid='mean')
+        self.assertEqual(img.pyramid_levels, 4)
+        self.assertEqual(img.pyramid_level(2).data.shape, (16, 8))
+        self.assertIs(img.interface.pyramid(img.clone(), 2)[2],
+                      img.interface.pyramid(img, 2)[2])
+
+    def test_image_pyramid_level_out_of_range(self):
+        img = Image(np.random.rand(8, 8), pyramid='mean')
+        with self.assertRaises(ValueError):
+            img.pyramid_level(3)
+
+    def test_image_select_level(self):
+        img = Image(np.random.rand(64, 64), bounds=(0, 0, 1, 1), pyramid='mean')
+        self.assertEqual(img.select_level(16, 16).data.shape, (16, 16))
+        self.assertEqual(img.select_level(20, 20).data.shape, (32, 32))
+        self.assertEqual(img.select_level(16, 16, (0, 0.5), (0, 0.5)).data.shape, (32, 32))
+        self.assertIs(img.clone(pyramid=None).select_level(16, 16).data, img.data)
+
+    def test_image_pyramid_level_clone_bounds(self):
+        img = Image(np.arange(16.).reshape(4, 4), bounds=(0, 0, 4, 4), pyramid='mean')
+        self.assertEqual(img.pyramid_level(1).dimension_values('x', expanded=False),
+                         np.array([1., 3.]))
+        level = img.clone(bounds=(0, 0, 8, 8)).pyramid_level(1)
+        self.assertEqual(level.dimension_values('x', expanded=False), np.array([2., 6.]))
+
+    def test_image_clone_bounds_expanded_coords(self):
+        img = Image(np.arange(4.).reshape(2, 2), bounds=(0, 0, 2, 2))
+        self.assertEqual(img.dimension_values('x'), np.array([0.5, 0.5, 1.5, 1.5]))
+        clone = img.clone(bounds=(0, 0, 4, 4))
+        self.assertEqual(clone.dimension_values('x'), np.array([1., 1., 3., 3.]))
+        self.assertEqual(clone.range('x'), (0, 4))
+        self.assertEqual(img.dimension_values('x'), np.array([0.5, 0.5, 1.5, 1.5]))
+
+    def test_image_pyramid_memmap(self):
+        path = tempfile.mkdtemp()
+        try:
+            img = Image(np.random.rand(8, 8), pyramid='max', pyramid_path=path)
+            level = img.pyramid_level(1)
+            self.assertIsInstance(img.interface.pyramid(img, 1, 'max', path)[2], np.memmap)
+            self.assertEqual(level.data.max(), img.data.max())
+            other = Image(np.random.rand(8, 8), pyramid='max', pyramid_path=path)
+            other.pyramid_level(1)
+            self.assertEqual(len(os.listdir(path)), 2)
+            del img, level, other
+            gc.collect()
+            self.assertEqual(os.listdir(path), [])
+        finally:
+            shutil.rmtree(path)